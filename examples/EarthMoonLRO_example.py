@@ -10,6 +10,7 @@ import pysamss
 
 # Step 1: Setup system
 system = pysamss.System('EarthMoonLRO')
+system.addObserver(pysamss.printProgress)
 system.current.setDatetime(datetime.datetime.utcnow()) # Set current time utc
 # Step 1.1: Add Earth, Moon and LRO to system
 # https://earth.esa.int/web/eoportal/satellite-missions/l/lro
@@ -32,6 +32,7 @@ P = [-2280, 5716, 3557]
 V = [-17235, 4592, 4514]
 # O: 66º, 47.3º, 244.4º
 system = pysamss.System('EarthMoonOrion')
+system.addObserver(pysamss.printProgress)
 launch_time = datetime.datetime(2022, 11, 16, 6, 47, 00)
 #time_delta = datetime.timedelta(hours=1, minutes=59)
 system.current.setDatetime(launch_time + datetime.timedelta(hours=1, minutes=59))
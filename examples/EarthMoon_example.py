@@ -10,6 +10,7 @@ import pysamss
 
 # Step 1: Setup system
 system = pysamss.System('EarthMoon')
+system.addObserver(pysamss.printProgress)
 system.current.setDatetime(datetime.datetime.utcnow()) # Set current time utc
 # Step 1.1: Add Earth and Moon to system
 system.current.addCelestialBody(pysamss.CelestialBody('Earth', 5.972e24, 6.371e6))
@@ -14,6 +14,7 @@ UniversalRF = pysamss.ReferenceFrame()
 earth = pysamss.CelestialBody('Earth', 5.972e24, 6.371e6)
 earth.setUniversalRF(UniversalRF)
 earth.setBodyRF(pysamss.ReferenceFrame())
+earth.setAtmosphere(pysamss.Atmosphere())
 
 # Define Falcon9
 stage1 = pysamss.Stage(258500, 1.85, 35, np.array([-30.6, 0, 0]))
@@ -25,6 +26,7 @@ falcon9.setParent(earth)
 falcon9.setParentRF(earth.bodyRF)
 falcon9.setPosition([earth.radius, 0, 0])
 falcon9.initAttitude()
+falcon9.setDragCoefficient(0.5)
 
 Isp = 300 # (s)
 m_dot = 1500 # (kg/s)
@@ -47,6 +49,9 @@ positions = []
 # Gravity:
 forceGravity = pysamss.gravity(earth, falcon9)
 falcon9.addForce(forceGravity)
+# Drag:
+forceDrag = pysamss.drag(earth, falcon9)
+falcon9.addForce(forceDrag)
 # Thrust:
 forceThrust, torqueThrust = pysamss.thrust(falcon9, m_dot, Isp, gimbal[-1], dt)
 falcon9.addForce(forceThrust, local=True)
@@ -88,6 +93,9 @@ for i in range(0, 8000):
     # Gravity:
     forceGravity = pysamss.gravity(earth, falcon9)
     falcon9.addForce(forceGravity)
+    # Drag:
+    forceDrag = pysamss.drag(earth, falcon9)
+    falcon9.addForce(forceDrag)
     # Thrust:
     forceThrust, torqueThrust = pysamss.thrust(falcon9, m_dot, Isp, gimbal[-1], dt)
     falcon9.addForce(forceThrust, local=True)
@@ -15,6 +15,7 @@ def parse_args():
 def main():
     args = parse_args()
     system = pysamss.System(args.input_file)
+    system.addObserver(pysamss.printProgress)
     system.load(args.input_file, args.every_nth)
     if args.plot:
         fig = pysamss.MainWidget()
@@ -10,6 +10,7 @@ import pysamss
 
 # Step 1: Setup system
 system = pysamss.System('SolarSystem')
+system.addObserver(pysamss.printProgress)
 system.current.setDatetime(datetime.datetime.utcnow()) # Set current time utc
 # Step 1.1: Add CelestialBodies to system
 # https://en.wikipedia.org/wiki/List_of_Solar_System_objects_by_size
@@ -10,6 +10,7 @@ import pysamss
 
 # Step 1: Setup System
 system = pysamss.System('Spire')
+system.addObserver(pysamss.printProgress)
 system.current.setDatetime(datetime.datetime.utcnow()) # Set current time utc
 
 # Step 2: Define Earth
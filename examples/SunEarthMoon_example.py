@@ -10,6 +10,7 @@ import pysamss
 
 # Step 1: Setup system
 system = pysamss.System('SunEarthMoon')
+system.addObserver(pysamss.printProgress)
 system.current.setDatetime(datetime.datetime.utcnow()) # Set current time utc
 # Step 1.1: Add Sun, Earth and Moon to system
 system.current.addCelestialBody(pysamss.CelestialBody('Sun', 1.9885e30, 696342e3))
@@ -1,11 +1,17 @@
 from .main.referenceframe import ReferenceFrame
 from .main.celestialbody import CelestialBody
+from .main.ephemeris import Ephemeris, loadSPK
 from .main.stage import Stage
 from .main.vessel import Vessel
 from .main.system import System
+from .main.ensemble import Ensemble
+from .main.sweep import Sweep
+from .main.progress import Progress, printProgress
 from .helpermath.helpermath import *
 from .helpermath.orbital import *
 from .forcetorque.gravity import gravity
+from .forcetorque.harmonics import ZonalHarmonics
+from .forcetorque.drag import drag, Atmosphere
 from .forcetorque.thrust import thrust
 from .control.pidcontroller import PIDcontroller
 from .plotting.plotting import plotCelestialBody, plotCylinder, plotTrajectory
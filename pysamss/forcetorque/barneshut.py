@@ -0,0 +1,207 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Barnes-Hut octree approximation of gravitational accelerations
+import numpy as np
+
+class Octree:
+    """
+    Octree class. Recursively subdivides the bounding cube of a set of source
+    objects into octants, storing the total standard gravitational parameter
+    and centre of mass of each node. Sources of every node are contiguous in
+    order so the tree can be refitted to moved sources without rebuilding
+    (see update).
+
+    Args:
+        positions (np.array): Source positions (M, 3) [m].
+        mus (np.array): Source standard gravitational parameters G * m (M,) [m**3.s**-2].
+        leaf_size (int): Maximum number of sources in a leaf node. Default leaf_size = 8.
+        max_depth (int): Maximum tree depth. Nodes at max_depth are leaves
+                         regardless of leaf_size. Default max_depth = 32.
+    """
+    def __init__(self, positions, mus, leaf_size=8, max_depth=32):
+        self.positions = np.asarray(positions, dtype=float)
+        self.mus = np.asarray(mus, dtype=float)
+        self.leaf_size = leaf_size
+        self.max_depth = max_depth
+        self.centers = []
+        self.sizes = []
+        self.children = []
+        self.leaves = []
+        self.starts = []
+        self.counts = []
+        self.order = []
+        if len(self.mus) > 0:
+            lower = np.min(self.positions, axis=0)
+            upper = np.max(self.positions, axis=0)
+            size = max(np.max(upper - lower), np.finfo(float).tiny)
+            self.addNode(np.arange(len(self.mus)), 0.5 * (lower + upper), size, 0)
+        self.centers = np.array(self.centers).reshape(-1, 3)
+        self.sizes = np.array(self.sizes)
+        self.children = np.array(self.children, dtype=int).reshape(-1, 8)
+        self.leaves = np.array(self.leaves, dtype=bool)
+        self.starts = np.array(self.starts, dtype=int)
+        self.counts = np.array(self.counts, dtype=int)
+        self.order = np.array(self.order, dtype=int)
+        self.build_positions = self.positions
+        self.update(self.positions, self.mus)
+
+    def addNode(self, indices, center, size, depth):
+        """
+        Add node containing sources indices and, if it is not a leaf, its
+        children.
+
+        Args:
+            indices (np.array): Indices of sources in node.
+            center (np.array): Node centre [m].
+            size (float): Node side length [m].
+            depth (int): Node depth.
+
+        Returns:
+            node (int): Node index.
+        """
+        node = len(self.sizes)
+        self.centers.append(center)
+        self.sizes.append(size)
+        self.children.append([-1] * 8)
+        self.starts.append(len(self.order))
+        self.counts.append(len(indices))
+        if len(indices) <= self.leaf_size or depth >= self.max_depth:
+            self.leaves.append(True)
+            self.order.extend(indices)
+        else:
+            self.leaves.append(False)
+            octants = np.dot(self.positions[indices] > center, [1, 2, 4])
+            for octant in range(0, 8):
+                child_indices = indices[octants == octant]
+                if len(child_indices) > 0:
+                    offset = 0.25 * size * (2 * np.array([octant & 1, (octant >> 1) & 1, (octant >> 2) & 1]) - 1)
+                    self.children[node][octant] = self.addNode(child_indices, center + offset, 0.5 * size, depth + 1)
+        return node
+
+    def update(self, positions, mus=None):
+        """
+        Refit the tree to moved sources, i.e. at each stage of a step, keeping
+        the node structure built in __init__. Node masses and centres of mass
+        are recalculated and node sizes grow by twice the largest source
+        displacement so every node still bounds its sources.
+
+        Args:
+            positions (np.array): Source positions (M, 3) [m], in the order
+                                  the tree was built with.
+            mus (np.array): Source standard gravitational parameters (M,)
+                            [m**3.s**-2]. If mus=None the current values are kept.
+
+        Note:
+            - Refitting is exact, i.e. theta = 0.0 still gives the direct sum.
+              Accuracy for theta > 0.0 degrades as sources move away from the
+              positions the tree was built with, rebuild the tree each step.
+        """
+        self.positions = np.asarray(positions, dtype=float)
+        if mus is not None:
+            self.mus = np.asarray(mus, dtype=float)
+        # Sources in tree order, leaves index them directly
+        self.ordered_positions = self.positions[self.order]
+        self.ordered_mus = self.mus[self.order]
+        if len(self.sizes) == 0:
+            self.node_mus = np.zeros(0)
+            self.coms = np.zeros((0, 3))
+            self.bounds = np.zeros(0)
+            return
+        # Sum sources in each node's slice of order, reduceat over [start, end) pairs with a padded zero row
+        sources = np.concatenate([self.ordered_mus[:, None], self.ordered_mus[:, None] * self.ordered_positions, self.ordered_positions], axis=1)
+        sources = np.concatenate([sources, np.zeros((1, 7))])
+        slices = np.stack([self.starts, self.starts + self.counts], axis=1).ravel()
+        sums = np.add.reduceat(sources, slices, axis=0)[::2]
+        self.node_mus = sums[:, 0]
+        self.coms = np.where(self.node_mus[:, None] > 0.0, sums[:, 1:4] / np.where(self.node_mus > 0.0, self.node_mus, 1.0)[:, None], sums[:, 4:7] / self.counts[:, None])
+        displacement = np.max(np.linalg.norm(self.positions - self.build_positions, axis=1))
+        self.bounds = self.sizes + 2 * displacement
+
+    def getAccelerations(self, positions, theta=0.5):
+        """
+        Calculate gravitational accelerations acting on a set of objects. All
+        objects walk the tree together: at each level a node is accepted as a
+        point mass if size / distance < theta, leaves are summed directly and
+        all other nodes are opened.
+
+        Args:
+            positions (np.array): Positions (N, 3) of objects to calculate
+                                  accelerations for [m].
+            theta (float): Opening angle. theta = 0.0 gives the direct sum.
+                           Default theta = 0.5.
+
+        Returns:
+            accelerations (np.array): Gravitational accelerations (N, 3) [m.s**-2].
+        """
+        positions = np.asarray(positions, dtype=float)
+        accelerations = np.zeros(np.shape(positions))
+        if len(self.sizes) == 0:
+            return accelerations
+        targets = np.arange(len(positions))
+        nodes = np.zeros(len(positions), dtype=int)
+        while len(targets) > 0:
+            r = self.coms[nodes] - positions[targets]
+            r2 = np.einsum('ij,ij->i', r, r)
+            inside = np.all(np.abs(positions[targets] - self.centers[nodes]) <= 0.5 * self.bounds[nodes][:, None], axis=1)
+            leaf = self.leaves[nodes]
+            accept = ~leaf & ~inside & (self.bounds[nodes]**2 < theta**2 * r2)
+            # Step 1: Accepted nodes act as point masses at their centre of mass
+            if np.any(accept):
+                self.addAccelerations(accelerations, targets[accept], r[accept], r2[accept], self.node_mus[nodes[accept]])
+            # Step 2: Leaf nodes are summed directly
+            if np.any(leaf):
+                leaf_targets = targets[leaf]
+                leaf_nodes = nodes[leaf]
+                counts = self.counts[leaf_nodes]
+                pair_targets = np.repeat(leaf_targets, counts)
+                offsets = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+                sources = np.repeat(self.starts[leaf_nodes], counts) + offsets
+                pair_r = self.ordered_positions[sources] - positions[pair_targets]
+                pair_r2 = np.einsum('ij,ij->i', pair_r, pair_r)
+                self.addAccelerations(accelerations, pair_targets, pair_r, pair_r2, self.ordered_mus[sources])
+            # Step 3: Open all other nodes
+            opened = ~leaf & ~accept
+            children = self.children[nodes[opened]]
+            valid = children >= 0
+            targets = np.repeat(targets[opened], np.sum(valid, axis=1))
+            nodes = children[valid]
+        return accelerations
+
+    def addAccelerations(self, accelerations, targets, r, r2, mus):
+        """
+        Add point mass accelerations mu * r / |r|**3 to targets. Coincident
+        pairs contribute zero acceleration.
+
+        Args:
+            accelerations (np.array): Accelerations (N, 3) to add to [m.s**-2].
+            targets (np.array): Target indices (K,).
+            r (np.array): Vectors from targets to sources (K, 3) [m].
+            r2 (np.array): Squared lengths of r (K,) [m**2].
+            mus (np.array): Source standard gravitational parameters (K,) [m**3.s**-2].
+        """
+        inv_r3 = np.divide(1.0, r2 * np.sqrt(r2), out=np.zeros_like(r2), where=r2 > 0.0)
+        weights = mus * inv_r3
+        for k in range(0, 3):
+            accelerations[:, k] += np.bincount(targets, weights * r[:, k], len(accelerations))
+
+def barnesHutAccelerations(positions, source_positions, mus, theta=0.5, leaf_size=8):
+    """
+    Calculate gravitational accelerations acting on a set of objects due to a
+    set of source objects using a Barnes-Hut octree. Scales as O(N log M)
+    rather than O(N M) for gravityAccelerations.
+
+    Args:
+        positions (np.array): Positions (N, 3) of objects to calculate
+                              accelerations for [m].
+        source_positions (np.array): Positions (M, 3) of source objects [m].
+        mus (np.array): Standard gravitational parameters G * m (M,) of
+                        source objects [m**3.s**-2].
+        theta (float): Opening angle. Default theta = 0.5.
+        leaf_size (int): Maximum number of sources in a leaf node. Default leaf_size = 8.
+
+    Returns:
+        accelerations (np.array): Gravitational accelerations (N, 3) [m.s**-2].
+    """
+    octree = Octree(source_positions, mus, leaf_size)
+    accelerations = octree.getAccelerations(positions, theta)
+    return accelerations
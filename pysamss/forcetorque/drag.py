@@ -0,0 +1,166 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Calculate force due to atmospheric drag acting on objects
+import numpy as np
+from ..helpermath.quaternion import quaternionNormalize, quaternions2rotationMatrices
+
+# Piecewise exponential Earth atmosphere [base altitude (m), base density (kg.m**-3), scale height (m)]
+# (Vallado, Fundamentals of Astrodynamics and Applications, Table 8-4)
+EARTH_ATMOSPHERE = np.array([[0.0e3, 1.225e0, 7.249e3],
+                             [25.0e3, 3.899e-2, 6.349e3],
+                             [30.0e3, 1.774e-2, 6.682e3],
+                             [40.0e3, 3.972e-3, 7.554e3],
+                             [50.0e3, 1.057e-3, 8.382e3],
+                             [60.0e3, 3.206e-4, 7.714e3],
+                             [70.0e3, 8.770e-5, 6.549e3],
+                             [80.0e3, 1.905e-5, 5.799e3],
+                             [90.0e3, 3.396e-6, 5.382e3],
+                             [100.0e3, 5.297e-7, 5.877e3],
+                             [110.0e3, 9.661e-8, 7.263e3],
+                             [120.0e3, 2.438e-8, 9.473e3],
+                             [130.0e3, 8.484e-9, 12.636e3],
+                             [140.0e3, 3.845e-9, 16.149e3],
+                             [150.0e3, 2.070e-9, 22.523e3],
+                             [180.0e3, 5.464e-10, 29.740e3],
+                             [200.0e3, 2.789e-10, 37.105e3],
+                             [250.0e3, 7.248e-11, 45.546e3],
+                             [300.0e3, 2.418e-11, 53.628e3],
+                             [350.0e3, 9.518e-12, 53.298e3],
+                             [400.0e3, 3.725e-12, 58.515e3],
+                             [450.0e3, 1.585e-12, 60.828e3],
+                             [500.0e3, 6.967e-13, 63.822e3],
+                             [600.0e3, 1.454e-13, 71.835e3],
+                             [700.0e3, 3.614e-14, 88.667e3],
+                             [800.0e3, 1.170e-14, 124.64e3],
+                             [900.0e3, 5.245e-15, 181.05e3],
+                             [1000.0e3, 3.019e-15, 268.00e3]])
+
+class Atmosphere:
+    """
+    Atmosphere class. Tabulated atmosphere with density interpolated
+    exponentially between table altitudes. Defaults to a piecewise
+    exponential Earth atmosphere (EARTH_ATMOSPHERE).
+
+    Args:
+        altitudes (np.array): Base altitudes (K,) in ascending order [m]. If
+                              altitudes=None EARTH_ATMOSPHERE is used.
+        densities (np.array): Densities (K,) at base altitudes [kg.m**-3].
+        scale_heights (np.array): Scale heights (K,) above each base altitude
+                                  [m]. If scale_heights=None scale heights
+                                  are calculated so density is continuous
+                                  between table altitudes.
+        ceiling (float): Altitude above which density is zero [m]. If
+                         ceiling=None the last table altitude is used.
+
+    Note:
+        - Below the first table altitude the first band is extrapolated.
+    """
+    def __init__(self, altitudes=None, densities=None, scale_heights=None, ceiling=None):
+        if altitudes is None:
+            altitudes, densities, scale_heights = EARTH_ATMOSPHERE.T
+        self.altitudes = np.asarray(altitudes, dtype=float)
+        self.densities = np.asarray(densities, dtype=float)
+        if scale_heights is None:
+            scale_heights = np.diff(self.altitudes) / np.log(self.densities[:-1] / self.densities[1:])
+            scale_heights = np.append(scale_heights, scale_heights[-1])
+        self.scale_heights = np.asarray(scale_heights, dtype=float)
+        if ceiling is None:
+            ceiling = self.altitudes[-1]
+        self.ceiling = ceiling
+        self.log_densities = np.log(self.densities) # Precomputed for interpolation
+
+    def save(self, group):
+        """
+        Save Atmosphere object to .h5 file.
+
+        Args:
+            group (h5py group): HDF5 file group to save Atmosphere object to.
+        """
+        group.create_dataset('altitudes', data=self.altitudes)
+        group.create_dataset('densities', data=self.densities)
+        group.create_dataset('scale_heights', data=self.scale_heights)
+        group.attrs.create('ceiling', self.ceiling)
+
+    def load(self, group):
+        """
+        Load Atmosphere object from .h5 file.
+
+        Args:
+            group (h5py group): HDF5 file group to load Atmosphere object from.
+        """
+        self.altitudes = np.array(group.get('altitudes'))
+        self.densities = np.array(group.get('densities'))
+        self.scale_heights = np.array(group.get('scale_heights'))
+        self.ceiling = group.attrs['ceiling']
+        self.log_densities = np.log(self.densities)
+
+    def getDensities(self, altitudes):
+        """
+        Get densities at a set of altitudes.
+
+        Args:
+            altitudes (np.array): Altitudes (N,) [m].
+
+        Returns:
+            densities (np.array): Densities (N,) [kg.m**-3].
+        """
+        altitudes = np.asarray(altitudes, dtype=float)
+        bands = np.clip(np.searchsorted(self.altitudes, altitudes, side='right') - 1, 0, len(self.altitudes) - 1)
+        densities = np.exp(self.log_densities[bands] - (altitudes - self.altitudes[bands]) / self.scale_heights[bands])
+        densities[altitudes > self.ceiling] = 0.0
+        return densities
+
+def dragForces(velocities, densities, areas, drag_coefficients):
+    """
+    Calculate drag forces acting on a set of objects,
+    F = -0.5 * rho * Cd * A * |v| * v.
+
+    Args:
+        velocities (np.array): Velocities (N, 3) relative to the atmosphere [m/s].
+        densities (np.array): Atmospheric densities (N,) [kg.m**-3].
+        areas (np.array): Cross-sectional areas (N,) [m**2].
+        drag_coefficients (np.array): Drag coefficients (N,).
+
+    Returns:
+        forces (np.array): Drag forces (N, 3) [N].
+    """
+    speeds = np.linalg.norm(velocities, axis=1)
+    forces = -(0.5 * densities * drag_coefficients * areas * speeds)[:, None] * velocities
+    return forces
+
+def atmosphereVelocities(positions, parent_states):
+    """
+    Calculate velocities of atmospheres co-rotating with their parent bodies
+    at a set of positions.
+
+    Args:
+        positions (np.array): Positions (N, 3) [m].
+        parent_states (np.array): Parent body state vectors (N, 13).
+
+    Returns:
+        velocities (np.array): Atmosphere velocities (N, 3) [m/s].
+    """
+    Rs = quaternions2rotationMatrices(quaternionNormalize(parent_states[:, 9:13]))
+    omegas = np.einsum('ijk,ik->ij', Rs, parent_states[:, 6:9]) # Body rates to universalRF
+    velocities = parent_states[:, 0:3] + np.cross(omegas, positions - parent_states[:, 3:6])
+    return velocities
+
+def drag(obj0, obj1):
+    """
+    Calculate dragForce acting on a Vessel obj1 due to the atmosphere of a
+    CelestialBody obj0.
+
+    Args:
+        obj0 (obj): CelestialBody object with an atmosphere (see
+                    CelestialBody.setAtmosphere).
+        obj1 (obj): Vessel object.
+
+    Returns:
+        dragForce (np.array): dragForce acting on obj1.
+    """
+    position = np.array([obj1.getPosition()], dtype=float)
+    altitude = np.linalg.norm(position - obj0.getPosition(), axis=1) - obj0.getRadius()
+    density = obj0.atmosphere.getDensities(altitude)
+    velocity = np.array([obj1.getVelocity()], dtype=float) - atmosphereVelocities(position, np.array([obj0.state], dtype=float))
+    dragForce = dragForces(velocity, density, np.array([obj1.getCrossSection()]), np.array([obj1.drag_coefficient]))[0]
+    return dragForce
@@ -4,6 +4,8 @@
 import numpy as np
 from ..helpermath.helpermath import *
 
+G = 6.67408e-11 # Gravitational constant [m**3.kg**-1.s**-2]
+
 def gravity(obj0, obj1):
     """
     Calculate gravityForce acting on an obj1 (body or vehicle).
@@ -24,3 +26,87 @@ def gravity(obj0, obj1):
     F = G * ((obj0Mass * obj1Mass) / r**2)
     gravityForce = F * (obj0Position - obj1Position) / np.linalg.norm(obj0Position - obj1Position)
     return gravityForce
+
+def gravityAccelerations(positions, source_positions, mus):
+    """
+    Calculate gravitational accelerations acting on a set of objects due to a
+    set of source objects (typically CelestialBody objects) in one pass.
+
+    Args:
+        positions (np.array): Positions (..., N, 3) of objects to calculate
+                              accelerations for [m].
+        source_positions (np.array): Positions (..., M, 3) of source objects [m].
+        mus (np.array): Standard gravitational parameters G * m (..., M) of
+                        source objects [m**3.s**-2].
+
+    Returns:
+        accelerations (np.array): Gravitational accelerations (..., N, 3) [m.s**-2].
+
+    Note:
+        - Coincident object/source pairs (i.e. a source acting on itself)
+          contribute zero acceleration.
+        - Leading dimensions (...) are broadcast, i.e. for ensembles of systems.
+    """
+    r = source_positions[..., None, :, :] - positions[..., :, None, :] # (..., N, M, 3)
+    r2 = np.einsum('...ijk,...ijk->...ij', r, r)
+    inv_r3 = np.divide(1.0, r2 * np.sqrt(r2), out=np.zeros_like(r2), where=r2 > 0.0)
+    accelerations = np.einsum('...ij,...ijk->...ik', np.asarray(mus)[..., None, :] * inv_r3, r)
+    return accelerations
+
+def significantSources(positions, source_positions, mus, tolerance, soi_radii=None):
+    """
+    Get the gravitationally significant source objects for each of a set of
+    objects. For each object the weakest sources are dropped while the sum of
+    their acceleration magnitudes remains within tolerance times the sum of
+    acceleration magnitudes due to all sources. Sources whose sphere of
+    influence contains the object are always kept.
+
+    Args:
+        positions (np.array): Positions (N, 3) of objects [m].
+        source_positions (np.array): Positions (M, 3) of source objects [m].
+        mus (np.array): Standard gravitational parameters G * m (M,) of
+                        source objects [m**3.s**-2].
+        tolerance (float): Relative acceleration budget for dropped sources.
+        soi_radii (np.array): Sphere of influence radii (M,) of source objects
+                              [m]. If soi_radii=None only tolerance is used.
+
+    Returns:
+        sources (np.array): Boolean matrix (N, M), True where a source is kept.
+    """
+    r = np.linalg.norm(source_positions[None, :, :] - positions[:, None, :], axis=2) # (N, M)
+    magnitudes = np.divide(mus[None, :], r**2, out=np.zeros_like(r), where=r > 0.0)
+    order = np.argsort(magnitudes, axis=1)
+    dropped = np.cumsum(np.take_along_axis(magnitudes, order, axis=1), axis=1) <= tolerance * np.sum(magnitudes, axis=1, keepdims=True)
+    sources = np.ones(np.shape(r), dtype=bool)
+    np.put_along_axis(sources, order, ~dropped, axis=1)
+    if soi_radii is not None:
+        sources |= r < soi_radii[None, :]
+    return sources
+
+def prunedGravityAccelerations(positions, source_positions, mus, sources):
+    """
+    Calculate gravitational accelerations acting on a set of objects due to a
+    subset of source objects per object. Only kept object/source pairs are
+    evaluated.
+
+    Args:
+        positions (np.array): Positions (N, 3) of objects to calculate
+                              accelerations for [m].
+        source_positions (np.array): Positions (M, 3) of source objects [m].
+        mus (np.array): Standard gravitational parameters G * m (M,) of
+                        source objects [m**3.s**-2].
+        sources (np.array): Boolean matrix (N, M), True where a source acts on
+                            an object (see significantSources).
+
+    Returns:
+        accelerations (np.array): Gravitational accelerations (N, 3) [m.s**-2].
+    """
+    objects, kept = np.nonzero(sources)
+    r = source_positions[kept] - positions[objects] # (K, 3)
+    r2 = np.einsum('ij,ij->i', r, r)
+    inv_r3 = np.divide(1.0, r2 * np.sqrt(r2), out=np.zeros_like(r2), where=r2 > 0.0)
+    pair_accelerations = (mus[kept] * inv_r3)[:, None] * r
+    accelerations = np.zeros(np.shape(positions))
+    for axis in range(0, 3):
+        accelerations[:, axis] = np.bincount(objects, pair_accelerations[:, axis], minlength=len(positions))
+    return accelerations
@@ -0,0 +1,67 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Calculate perturbing accelerations due to the zonal harmonics of a body
+import numpy as np
+
+class ZonalHarmonics:
+    """
+    ZonalHarmonics class. Zonal gravity field of an axisymmetric body with
+    coefficients J2, J3, ... Jn. The Legendre polynomial recurrence
+    coefficients are precomputed so accelerations for any number of objects
+    are evaluated in one array operation per degree.
+
+    Args:
+        J (list): Zonal harmonic coefficients [J2, J3, ... Jn] (unnormalised).
+        radius (float): Reference radius of the body [m].
+    """
+    def __init__(self, J, radius):
+        self.J = np.concatenate([[0.0, 0.0], np.asarray(J, dtype=float)]) # Index by degree
+        self.radius = radius
+        self.degree = len(self.J) - 1
+        # Bonnet recurrence n * P_n = (2n - 1) * s * P_n-1 - (n - 1) * P_n-2
+        n = np.arange(2, self.degree + 1)
+        self.a = np.concatenate([[0.0, 0.0], (2 * n - 1) / n])
+        self.b = np.concatenate([[0.0, 0.0], (n - 1) / n])
+
+    def getAccelerations(self, positions, mu, pole=np.array([0, 0, 1])):
+        """
+        Calculate perturbing accelerations, i.e. excluding the point mass
+        term, acting on a set of objects.
+
+        Args:
+            positions (np.array): Positions (N, 3) of objects relative to the
+                                  body centre [m].
+            mu (float): Standard gravitational parameter G * m of the body [m**3.s**-2].
+            pole (np.array): Unit vector along the body's polar axis, i.e.
+                             bodyFixedRF.k. Default pole = [0, 0, 1].
+
+        Returns:
+            accelerations (np.array): Perturbing accelerations (N, 3) [m.s**-2].
+
+        Note:
+            - The potential is V = mu / r * (1 - sum(J_n * (R / r)**n * P_n(s)))
+              with s = pole . r / r. Its gradient is
+              mu / r**2 * sum(J_n * (R / r)**n * (((n + 1) * P_n + s * P_n') * r_hat - P_n' * pole)).
+        """
+        positions = np.asarray(positions, dtype=float)
+        pole = np.asarray(pole, dtype=float)
+        r = np.linalg.norm(positions, axis=1)
+        r_hat = positions / r[:, None]
+        s = np.dot(r_hat, pole)
+        ratio = self.radius / r
+        # Legendre polynomials P_n(s) and derivatives P_n'(s) by recurrence
+        P0, P1 = np.ones_like(s), s
+        dP0, dP1 = np.zeros_like(s), np.ones_like(s)
+        radial = np.zeros_like(s)
+        polar = np.zeros_like(s)
+        ratio_n = ratio
+        for n in range(2, self.degree + 1):
+            P0, P1 = P1, self.a[n] * s * P1 - self.b[n] * P0
+            dP0, dP1 = dP1, n * P0 + s * dP1 # P_n' = n * P_n-1 + s * P_n-1'
+            ratio_n = ratio_n * ratio
+            if self.J[n] != 0.0:
+                radial += self.J[n] * ratio_n * ((n + 1) * P1 + s * dP1)
+                polar += self.J[n] * ratio_n * dP1
+        scale = mu / r**2
+        accelerations = (scale * radial)[:, None] * r_hat - (scale * polar)[:, None] * pole[None, :]
+        return accelerations
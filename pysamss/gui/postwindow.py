@@ -103,13 +103,15 @@ class MainWidget(QSplitter):
         self.addWidget(self.slider)
         # Setup system and actors
         self.system = None
+        self.timesteps = []
         self.actors = {}
     
     def loadSystem(self, system, save_animation=False):
         self.system = system
         self.save_animation = save_animation
-        self.slider.setMaximum(max(list(system.timesteps.keys())))
-        timesteps = sorted(list(self.system.timesteps.keys()))
+        timesteps = sorted(list(self.system.timesteps.keys())) # Slider value indexes timesteps in time order
+        self.timesteps = timesteps
+        self.slider.setMaximum(len(timesteps) - 1)
         # DateTime actor
         text = 'DateTime : ' + str(system.current.getDatetime()) + ', JulianDate : ' + str(system.current.getJulianDate())
         text_source = tvtk.TextSource(text=text)
@@ -185,19 +187,20 @@ class MainWidget(QSplitter):
     def sliderValueChange(self):
         value = self.slider.value()
         if self.system is not None:
+            timestep = self.system.timesteps[self.timesteps[value]]
             # DateTime
-            text = 'DateTime : ' + str(self.system.timesteps[value].getDatetime()) + ', JulianDate : ' + str(self.system.timesteps[value].getJulianDate())
+            text = 'DateTime : ' + str(timestep.getDatetime()) + ', JulianDate : ' + str(timestep.getJulianDate())
             self.actors['DateTime'][0].trait_set(text=text)
             # CelestialBodies
             for celestial_body in self.system.current.celestial_bodies.values():
                 # Update base actor
-                position = self.system.timesteps[value].celestial_bodies[celestial_body.name].getPosition()
-                orientation = np.rad2deg(quaternion2euler(self.system.timesteps[value].celestial_bodies[celestial_body.name].getAttitude()))
+                position = timestep.celestial_bodies[celestial_body.name].getPosition()
+                orientation = np.rad2deg(quaternion2euler(timestep.celestial_bodies[celestial_body.name].getAttitude()))
                 self.actors[celestial_body.name]['base'].trait_set(position=position, orientation=(orientation + np.array([0, 0, 180])))
                 # Update bodyRF actors
-                radius = self.system.timesteps[value].celestial_bodies[celestial_body.name].getRadius()
-                position = self.system.timesteps[value].celestial_bodies[celestial_body.name].getPosition()
-                i, j, k = self.system.timesteps[value].celestial_bodies[celestial_body.name].bodyRF.getIJK()
+                radius = timestep.celestial_bodies[celestial_body.name].getRadius()
+                position = timestep.celestial_bodies[celestial_body.name].getPosition()
+                i, j, k = timestep.celestial_bodies[celestial_body.name].bodyRF.getIJK()
                 i_points = np.append(np.expand_dims(position, axis=0), np.expand_dims(position + (i * radius * 1.5), axis=0), axis=0)
                 j_points = np.append(np.expand_dims(position, axis=0), np.expand_dims(position + (j * radius * 1.5), axis=0), axis=0)
                 k_points = np.append(np.expand_dims(position, axis=0), np.expand_dims(position + (k * radius * 1.5), axis=0), axis=0)
@@ -209,8 +212,8 @@ class MainWidget(QSplitter):
             # Vessels
             for vessel in self.system.current.vessels.values():
                 # Update bodyRF actors
-                position = self.system.timesteps[value].vessels[vessel.name].getPosition()
-                i, j, k = self.system.timesteps[value].vessels[vessel.name].bodyRF.getIJK()
+                position = timestep.vessels[vessel.name].getPosition()
+                i, j, k = timestep.vessels[vessel.name].bodyRF.getIJK()
                 i_points = np.append(np.expand_dims(position, axis=0), np.expand_dims(position + (i * 100000), axis=0), axis=0)
                 j_points = np.append(np.expand_dims(position, axis=0), np.expand_dims(position + (j * 100000), axis=0), axis=0)
                 k_points = np.append(np.expand_dims(position, axis=0), np.expand_dims(position + (k * 100000), axis=0), axis=0)
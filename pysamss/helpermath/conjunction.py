@@ -0,0 +1,28 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Conjunction screening using a k-d tree spatial index
+import numpy as np
+from scipy.spatial import cKDTree
+
+def screenConjunctions(positions, threshold):
+    """
+    Find all pairs of objects within threshold distance of each other. Pairs
+    are found with a k-d tree in O(N log N) rather than checking all
+    O(N**2) distances.
+
+    Args:
+        positions (np.array): Positions (N, 3) [m].
+        threshold (float): Screening distance [m].
+
+    Returns:
+        pairs (np.array): Index pairs (K, 2) with pairs[:, 0] < pairs[:, 1],
+                          sorted by first then second index.
+        distances (np.array): Pair distances (K,) [m].
+    """
+    if len(positions) < 2:
+        return np.zeros((0, 2), dtype=int), np.zeros(0)
+    tree = cKDTree(positions)
+    pairs = tree.query_pairs(threshold, output_type='ndarray')
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    distances = np.linalg.norm(positions[pairs[:, 1]] - positions[pairs[:, 0]], axis=1)
+    return pairs, distances
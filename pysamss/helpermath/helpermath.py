@@ -159,6 +159,31 @@ def heading2vector(heading):
     vector = np.dot(R, [1,0,0])
     return vector
 
+def northEastDownVectors(position, parent_position, parent_k, parent_radius):
+    """
+    Get north, east, down reference frame i, j, k vectors. Works on single
+    vectors or arrays of vectors (N, 3).
+
+    Args:
+        position (np.array): Position(s) in universalRF [x, y, z].
+        parent_position (np.array): Parent position(s) in universalRF [x, y, z].
+        parent_k (np.array): Parent north pole axis k vector(s) in universalRF.
+        parent_radius (float/np.array): Parent radius (radii).
+
+    Returns:
+        i (np.array): North vector(s).
+        j (np.array): East vector(s).
+        k (np.array): Down vector(s).
+    """
+    parent_north_pole_position = parent_position + parent_k * np.expand_dims(parent_radius, -1)
+    k = parent_position - position # k is the vector joining position to parent_position
+    j = np.cross(k, parent_north_pole_position - position) # j is normal to the three points
+    i = np.cross(j, k) # i is normal to j and k and completes i, j, k
+    i = i / np.linalg.norm(i, axis=-1, keepdims=True)
+    j = j / np.linalg.norm(j, axis=-1, keepdims=True)
+    k = k / np.linalg.norm(k, axis=-1, keepdims=True)
+    return i, j, k
+
 def lonlatalt2cartesian(celestialbody, longitude, latitude, altitude):
     """
     Convert from longitude, latitude, altitude to x, y, z.
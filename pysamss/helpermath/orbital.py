@@ -94,3 +94,74 @@ def cartesian2orbitalelements():
     """
     Convert cartesian coordinates to orbital elements.
     """
+
+def stumpff(z):
+    """
+    Evaluate the Stumpff functions C(z) and S(z).
+
+    Args:
+        z (np.array): Argument z = alpha * chi**2.
+
+    Returns:
+        C (np.array): Stumpff function C(z).
+        S (np.array): Stumpff function S(z).
+    """
+    z = np.asarray(z, dtype=float)
+    C = np.empty(np.shape(z))
+    S = np.empty(np.shape(z))
+    small = np.abs(z) < 1e-8
+    positive = (z > 0.0) & ~small
+    negative = (z < 0.0) & ~small
+    sz = np.sqrt(z[positive])
+    C[positive] = (1 - np.cos(sz)) / z[positive]
+    S[positive] = (sz - np.sin(sz)) / sz**3
+    sz = np.sqrt(-z[negative])
+    C[negative] = (np.cosh(sz) - 1) / -z[negative]
+    S[negative] = (np.sinh(sz) - sz) / sz**3
+    C[small] = 1 / 2 - z[small] / 24
+    S[small] = 1 / 6 - z[small] / 120
+    return C, S
+
+def keplerPropagate(positions, velocities, mus, dt):
+    """
+    Propagate two-body orbits by dt using the universal variable formulation.
+    Valid for elliptic, parabolic and hyperbolic orbits.
+
+    Args:
+        positions (np.array): Positions (N, 3) relative to the primary [m].
+        velocities (np.array): Velocities (N, 3) relative to the primary [m/s].
+        mus (np.array): Standard gravitational parameters (N,) of the primaries [m**3.s**-2].
+        dt (np.array): Time (N,) or float to propagate by [s].
+
+    Returns:
+        positions (np.array): Positions (N, 3) at t + dt [m].
+        velocities (np.array): Velocities (N, 3) at t + dt [m/s].
+    """
+    # See Curtis, Orbital Mechanics for Engineering Students, Algorithms 3.3 and 3.4
+    dt = np.broadcast_to(dt, np.shape(mus)).astype(float)
+    sqrt_mu = np.sqrt(mus)
+    r0 = np.linalg.norm(positions, axis=1)
+    vr0 = np.einsum('ij,ij->i', positions, velocities) / r0
+    alpha = 2 / r0 - np.einsum('ij,ij->i', velocities, velocities) / mus
+    # Step 1: Solve the universal Kepler equation for chi using Newton-Raphson
+    chi = sqrt_mu * np.abs(alpha) * dt
+    for iteration in range(0, 50):
+        z = alpha * chi**2
+        C, S = stumpff(z)
+        F = r0 * vr0 / sqrt_mu * chi**2 * C + (1 - alpha * r0) * chi**3 * S + r0 * chi - sqrt_mu * dt
+        dF = r0 * vr0 / sqrt_mu * chi * (1 - z * S) + (1 - alpha * r0) * chi**2 * C + r0
+        step = F / dF
+        chi -= step
+        if np.all(np.abs(step) <= 1e-12 * np.maximum(1.0, np.abs(chi))):
+            break
+    # Step 2: Lagrange coefficients
+    z = alpha * chi**2
+    C, S = stumpff(z)
+    f = 1 - chi**2 / r0 * C
+    g = dt - chi**3 / sqrt_mu * S
+    positions1 = f[:, None] * positions + g[:, None] * velocities
+    r = np.linalg.norm(positions1, axis=1)
+    f_d = sqrt_mu / (r * r0) * (z * S - 1) * chi
+    g_d = 1 - chi**2 / r * C
+    velocities1 = f_d[:, None] * positions + g_d[:, None] * velocities
+    return positions1, velocities1
@@ -0,0 +1,134 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Quaternion operations on arrays of quaternions [qw, qx, qy, qz] (..., 4)
+import numpy as np
+
+def quaternion2array(quaternion):
+    """
+    Get array representation of a quaternion. Accepts pyquaternion Quaternion
+    objects so they can be passed to the array functions in this module.
+
+    Args:
+        quaternion (Quaternion/list/np.array): Quaternion(s) [qw, qx, qy, qz].
+
+    Returns:
+        quaternion (np.array): Quaternion array (..., 4).
+    """
+    return np.asarray(getattr(quaternion, 'elements', quaternion), dtype=float)
+
+def quaternionMultiply(q0, q1):
+    """
+    Get Hamilton product q0 * q1.
+
+    Args:
+        q0 (np.array): Quaternion array (..., 4).
+        q1 (np.array): Quaternion array (..., 4).
+
+    Returns:
+        q (np.array): Quaternion product array (..., 4).
+    """
+    w0, x0, y0, z0 = q0[..., 0], q0[..., 1], q0[..., 2], q0[..., 3]
+    w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    q = np.empty(np.broadcast(q0, q1).shape)
+    q[..., 0] = w0 * w1 - x0 * x1 - y0 * y1 - z0 * z1
+    q[..., 1] = w0 * x1 + x0 * w1 + y0 * z1 - z0 * y1
+    q[..., 2] = w0 * y1 - x0 * z1 + y0 * w1 + z0 * x1
+    q[..., 3] = w0 * z1 + x0 * y1 - y0 * x1 + z0 * w1
+    return q
+
+def quaternionConjugate(q):
+    """
+    Get quaternion conjugate. Equal to the inverse for unit quaternions.
+
+    Args:
+        q (np.array): Quaternion array (..., 4).
+
+    Returns:
+        q (np.array): Conjugate quaternion array (..., 4).
+    """
+    return q * np.array([1.0, -1.0, -1.0, -1.0])
+
+def quaternionNormalize(q):
+    """
+    Get unit quaternion. Zero quaternions are returned as [1, 0, 0, 0].
+
+    Args:
+        q (np.array): Quaternion array (..., 4).
+
+    Returns:
+        q (np.array): Unit quaternion array (..., 4).
+    """
+    norm = np.sqrt(np.sum(q**2, axis=-1, keepdims=True))
+    q = np.where(norm > 0.0, q / np.where(norm > 0.0, norm, 1.0), np.array([1.0, 0.0, 0.0, 0.0]))
+    return q
+
+def quaternionRotate(q, v):
+    """
+    Rotate vectors by unit quaternions, v' = q * v * q^-1.
+
+    Args:
+        q (np.array): Unit quaternion array (..., 4).
+        v (np.array): Vector array (..., 3).
+
+    Returns:
+        v (np.array): Rotated vector array (..., 3).
+    """
+    # v' = v + 2 * w * (u x v) + 2 * u x (u x v)
+    w = q[..., 0:1]
+    u = q[..., 1:4]
+    t = 2 * np.cross(u, v)
+    return v + w * t + np.cross(u, t)
+
+def quaternions2rotationMatrices(q):
+    """
+    Get rotation matrix representation of unit quaternions. Columns of the
+    rotation matrix are the rotated i, j and k unit vectors.
+
+    Args:
+        q (np.array): Unit quaternion array (..., 4).
+
+    Returns:
+        R (np.array): Rotation matrix array (..., 3, 3).
+    """
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    R = np.empty(np.shape(q)[:-1] + (3, 3))
+    R[..., 0, 0] = 1 - 2 * (y**2 + z**2)
+    R[..., 0, 1] = 2 * (x * y - w * z)
+    R[..., 0, 2] = 2 * (x * z + w * y)
+    R[..., 1, 0] = 2 * (x * y + w * z)
+    R[..., 1, 1] = 1 - 2 * (x**2 + z**2)
+    R[..., 1, 2] = 2 * (y * z - w * x)
+    R[..., 2, 0] = 2 * (x * z - w * y)
+    R[..., 2, 1] = 2 * (y * z + w * x)
+    R[..., 2, 2] = 1 - 2 * (x**2 + y**2)
+    return R
+
+def rotationMatrices2quaternions(R):
+    """
+    Get unit quaternion representation of rotation matrices. Uses Shepperd's
+    method, choosing the largest quaternion component as the pivot so the
+    result is well conditioned for all rotations.
+
+    Args:
+        R (np.array): Rotation matrix array (..., 3, 3).
+
+    Returns:
+        q (np.array): Unit quaternion array (..., 4) with qw >= 0.
+    """
+    R00, R01, R02 = R[..., 0, 0], R[..., 0, 1], R[..., 0, 2]
+    R10, R11, R12 = R[..., 1, 0], R[..., 1, 1], R[..., 1, 2]
+    R20, R21, R22 = R[..., 2, 0], R[..., 2, 1], R[..., 2, 2]
+    # 4 * component**2 for w, x, y, z
+    d = np.stack([1 + R00 + R11 + R22,
+                  1 + R00 - R11 - R22,
+                  1 - R00 + R11 - R22,
+                  1 - R00 - R11 + R22], axis=-1)
+    pivot = np.argmax(d, axis=-1)
+    s = 2 * np.sqrt(np.maximum(np.take_along_axis(d, pivot[..., None], axis=-1)[..., 0], 1e-300))
+    candidates = np.stack([np.stack([0.25 * s, (R21 - R12) / s, (R02 - R20) / s, (R10 - R01) / s], axis=-1),
+                           np.stack([(R21 - R12) / s, 0.25 * s, (R01 + R10) / s, (R02 + R20) / s], axis=-1),
+                           np.stack([(R02 - R20) / s, (R01 + R10) / s, 0.25 * s, (R12 + R21) / s], axis=-1),
+                           np.stack([(R10 - R01) / s, (R02 + R20) / s, (R12 + R21) / s, 0.25 * s], axis=-1)], axis=-2)
+    q = np.take_along_axis(candidates, pivot[..., None, None], axis=-2)[..., 0, :]
+    q = np.where(q[..., 0:1] < 0.0, -q, q)
+    return quaternionNormalize(q)
@@ -0,0 +1,45 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Time scale conversions
+import numpy as np
+import datetime
+
+J2000 = datetime.datetime(2000, 1, 1, 12) # Reference epoch
+J2000_JULIAN_DATE = 2451545.0 # Julian date of reference epoch
+
+# TAI - UTC [s] from each leap second date (IERS Bulletin C)
+LEAP_SECOND_DATES = [[1972, 1], [1972, 7], [1973, 1], [1974, 1], [1975, 1], [1976, 1], [1977, 1], [1978, 1], [1979, 1],
+                     [1980, 1], [1981, 7], [1982, 7], [1983, 7], [1985, 7], [1988, 1], [1990, 1], [1991, 1], [1992, 7],
+                     [1993, 7], [1994, 7], [1996, 1], [1997, 7], [1999, 1], [2006, 1], [2009, 1], [2012, 7], [2015, 7],
+                     [2017, 1]]
+LEAP_SECOND_TIMES = np.array([(datetime.datetime(year, month, 1) - J2000).total_seconds() for year, month in LEAP_SECOND_DATES])
+LEAP_SECONDS = np.arange(10.0, 10.0 + len(LEAP_SECOND_DATES))
+TT_TAI = 32.184 # TT - TAI [s]
+
+def utc2tdb(t):
+    """
+    Convert UTC seconds past J2000 to TDB seconds past J2000, i.e. Timestep
+    epoch + time to the time argument of JPL ephemerides.
+
+    Args:
+        t (float/np.array): UTC seconds past J2000, counted as calendar
+                            seconds from 2000-01-01 12:00 UTC (see
+                            Timestep.getEpoch).
+
+    Returns:
+        t_tdb (float/np.array): TDB seconds past J2000.
+
+    Note:
+        - TDB = UTC + (TAI - UTC) + 32.184 + 0.001657 * sin(g) + 0.000014 * sin(2 * g)
+          with g the mean anomaly of the Earth. TAI - UTC is 10 s before 1972
+          and is not extrapolated beyond the last leap second.
+    """
+    t = np.asarray(t, dtype=float)
+    index = np.searchsorted(LEAP_SECOND_TIMES, t, side='right') - 1
+    tai_utc = np.where(index >= 0, LEAP_SECONDS[np.maximum(index, 0)], LEAP_SECONDS[0])
+    t_tt = t + tai_utc + TT_TAI
+    g = np.deg2rad(357.53 + 0.98560028 * t_tt / 86400)
+    t_tdb = t_tt + 0.001657 * np.sin(g) + 0.000014 * np.sin(2 * g)
+    if np.ndim(t_tdb) == 0:
+        return float(t_tdb)
+    return t_tdb
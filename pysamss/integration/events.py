@@ -0,0 +1,110 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Event detection - zero-crossing location of scalar event functions of the state matrix
+import numpy as np
+
+def brent(g, a, b, ga, gb, xtol=1e-3, maxiter=100):
+    """
+    Find a root of g in the bracket [a, b] using Brent's method.
+    See https://en.wikipedia.org/wiki/Brent%27s_method.
+
+    Args:
+        g (function): Scalar function g(x).
+        a (float): Bracket lower bound.
+        b (float): Bracket upper bound.
+        ga (float): g(a).
+        gb (float): g(b). Must have the opposite sign to ga (or be zero).
+        xtol (float): Absolute tolerance on the root. Default xtol = 1e-3.
+        maxiter (int): Maximum number of iterations. Default maxiter = 100.
+
+    Returns:
+        x (float): Root of g to within xtol.
+    """
+    if ga == 0.0:
+        return a
+    if gb == 0.0:
+        return b
+    c, gc = a, ga
+    d = e = b - a
+    for _ in range(0, maxiter):
+        if np.sign(gb) == np.sign(gc):
+            c, gc = a, ga
+            d = e = b - a
+        if abs(gc) < abs(gb):
+            a, b, c = b, c, b
+            ga, gb, gc = gb, gc, gb
+        tol = 2 * np.finfo(float).eps * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or gb == 0.0:
+            return b
+        if abs(e) >= tol and abs(ga) > abs(gb):
+            # Attempt interpolation (secant or inverse quadratic)
+            s = gb / ga
+            if a == c:
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                q = ga / gc
+                r = gb / gc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, ga = b, gb
+        if abs(d) > tol:
+            b += d
+        else:
+            b += tol if m > 0 else -tol
+        gb = g(b)
+    return b
+
+def isCrossing(g0, g1, direction):
+    """
+    Check whether an event function crosses zero between two evaluations.
+
+    Args:
+        g0 (float): Event function value at the start of the step.
+        g1 (float): Event function value at the end of the step.
+        direction (int): Crossing direction. 1 = rising (negative to
+                         positive), -1 = falling, 0 = either.
+
+    Returns:
+        crossing (bool): True if the event function crosses zero.
+    """
+    rising = g0 < 0.0 and g1 >= 0.0
+    falling = g0 > 0.0 and g1 <= 0.0
+    if direction > 0:
+        return rising
+    if direction < 0:
+        return falling
+    return rising or falling
+
+def altitudeEvent(timestep, vessel_name, celestial_body_name, altitude=0.0):
+    """
+    Create an event function for a Vessel passing through an altitude above a
+    CelestialBody.
+
+    Args:
+        timestep (obj): Timestep object containing the Vessel and CelestialBody.
+        vessel_name (str): Vessel name.
+        celestial_body_name (str): CelestialBody name.
+        altitude (float): Event altitude above CelestialBody radius [m].
+                          Default altitude = 0.0 (impact).
+
+    Returns:
+        event (function): Event function event(t, states) -> float.
+    """
+    i = timestep.getIndex(vessel_name)
+    j = timestep.getIndex(celestial_body_name)
+    radius = timestep.celestial_bodies[celestial_body_name].getRadius() + altitude
+    event = lambda t, states : np.linalg.norm(states[i, 3:6] - states[j, 3:6]) - radius
+    return event
@@ -0,0 +1,59 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Interpolation of state matrices between two times
+import numpy as np
+
+def hermite(t0, positions0, velocities0, t1, positions1, velocities1, t):
+    """
+    Cubic Hermite interpolation of positions and velocities between t0 and t1.
+    https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+
+    Args:
+        t0 (float): Start time (s).
+        positions0 (np.array): Positions (N, 3) at t0.
+        velocities0 (np.array): Velocities (N, 3) at t0.
+        t1 (float): End time (s).
+        positions1 (np.array): Positions (N, 3) at t1.
+        velocities1 (np.array): Velocities (N, 3) at t1.
+        t (float): Time to interpolate at (s).
+
+    Returns:
+        positions (np.array): Interpolated positions (N, 3).
+        velocities (np.array): Interpolated velocities (N, 3).
+    """
+    h = t1 - t0
+    s = (t - t0) / h
+    h00 = 2 * s**3 - 3 * s**2 + 1
+    h10 = s**3 - 2 * s**2 + s
+    h01 = -2 * s**3 + 3 * s**2
+    h11 = s**3 - s**2
+    positions = h00 * positions0 + h10 * h * velocities0 + h01 * positions1 + h11 * h * velocities1
+    h00_d = 6 * s**2 - 6 * s
+    h10_d = 3 * s**2 - 4 * s + 1
+    h01_d = -6 * s**2 + 6 * s
+    h11_d = 3 * s**2 - 2 * s
+    velocities = (h00_d * positions0 + h01_d * positions1) / h + h10_d * velocities0 + h11_d * velocities1
+    return positions, velocities
+
+def interpolateStates(t0, states0, t1, states1, t):
+    """
+    Interpolate state matrices between t0 and t1. Position and velocity use
+    cubic Hermite interpolation, attitude_dot is interpolated linearly and
+    attitude quaternions are linearly interpolated then normalised.
+
+    Args:
+        t0 (float): Start time (s).
+        states0 (np.array): State matrix (N, 13) at t0.
+        t1 (float): End time (s).
+        states1 (np.array): State matrix (N, 13) at t1.
+        t (float): Time to interpolate at (s).
+
+    Returns:
+        states (np.array): Interpolated state matrix (N, 13).
+    """
+    s = (t - t0) / (t1 - t0)
+    states = np.empty(np.shape(states0))
+    states[..., 3:6], states[..., 0:3] = hermite(t0, states0[..., 3:6], states0[..., 0:3], t1, states1[..., 3:6], states1[..., 0:3], t)
+    states[..., 6:13] = (1 - s) * states0[..., 6:13] + s * states1[..., 6:13]
+    states[..., 9:13] /= np.linalg.norm(states[..., 9:13], axis=-1)[..., None]
+    return states
@@ -0,0 +1,127 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Numba compiled simulation kernels. Numba is optional, if it is not installed
+# NUMBA_AVAILABLE is False and System falls back to the numpy backend.
+import numpy as np
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit when Numba is not installed.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function : function
+
+@njit(cache=True)
+def stateDerivativeKernel(states, inputs, masses, Iis, mus, states_d):
+    """
+    Get state derivative matrix including gravity due to CelestialBody objects.
+
+    Args:
+        states (np.array): State matrix (N, 13).
+        inputs (np.array): Input matrix (N, 6) of non-gravitational forces and torques.
+        masses (np.array): Masses (N,) [kg].
+        Iis (np.array): Inverse inertia matrices (N, 3, 3).
+        mus (np.array): Standard gravitational parameters (N_celestial_bodies,) of
+                        the first N_celestial_bodies rows [m**3.s**-2].
+        states_d (np.array): State derivative matrix (N, 13) to write to.
+    """
+    N = states.shape[0]
+    n = mus.shape[0]
+    for i in range(N):
+        # Gravity
+        ax = 0.0
+        ay = 0.0
+        az = 0.0
+        for j in range(n):
+            dx = states[j, 3] - states[i, 3]
+            dy = states[j, 4] - states[i, 4]
+            dz = states[j, 5] - states[i, 5]
+            r2 = dx * dx + dy * dy + dz * dz
+            if r2 > 0.0:
+                a = mus[j] / (r2 * np.sqrt(r2))
+                ax += a * dx
+                ay += a * dy
+                az += a * dz
+        m = masses[i]
+        states_d[i, 0] = inputs[i, 0] / m + ax
+        states_d[i, 1] = inputs[i, 1] / m + ay
+        states_d[i, 2] = inputs[i, 2] / m + az
+        states_d[i, 3] = states[i, 0]
+        states_d[i, 4] = states[i, 1]
+        states_d[i, 5] = states[i, 2]
+        for k in range(3):
+            states_d[i, 6 + k] = Iis[i, k, 0] * inputs[i, 3] + Iis[i, k, 1] * inputs[i, 4] + Iis[i, k, 2] * inputs[i, 5]
+        p = states[i, 6]
+        q = states[i, 7]
+        r = states[i, 8]
+        qw = states[i, 9]
+        qx = states[i, 10]
+        qy = states[i, 11]
+        qz = states[i, 12]
+        states_d[i, 9] = -0.5 * (p * qx + q * qy + r * qz)
+        states_d[i, 10] = 0.5 * (p * qw + r * qy - q * qz)
+        states_d[i, 11] = 0.5 * (q * qw - r * qx + p * qz)
+        states_d[i, 12] = 0.5 * (r * qw + q * qx - p * qy)
+
+@njit(cache=True)
+def simulateKernel(states, inputs, masses, Iis, mus, dt, steps, scheme):
+    """
+    Simulate the state matrix forward in place by a number of steps.
+    Gravity is recalculated at every stage and quaternions are renormalised
+    after every step.
+
+    Args:
+        states (np.array): State matrix (N, 13). Updated in place.
+        inputs (np.array): Input matrix (N, 6) of non-gravitational forces and
+                           torques applied during the first step only.
+        masses (np.array): Masses (N,) [kg].
+        Iis (np.array): Inverse inertia matrices (N, 3, 3).
+        mus (np.array): Standard gravitational parameters (N_celestial_bodies,).
+        dt (float): Timestep (s).
+        steps (int): Number of steps.
+        scheme (int): Integration scheme 0 = euler, 1 = rk4.
+    """
+    N = states.shape[0]
+    k1 = np.empty((N, 13))
+    k2 = np.empty((N, 13))
+    k3 = np.empty((N, 13))
+    k4 = np.empty((N, 13))
+    stage = np.empty((N, 13))
+    zero_inputs = np.zeros((N, 6))
+    for step in range(steps):
+        if step == 0:
+            U = inputs
+        else:
+            U = zero_inputs
+        stateDerivativeKernel(states, U, masses, Iis, mus, k1)
+        if scheme == 0:
+            for i in range(N):
+                for j in range(13):
+                    states[i, j] += dt * k1[i, j]
+        else:
+            for i in range(N):
+                for j in range(13):
+                    stage[i, j] = states[i, j] + 0.5 * dt * k1[i, j]
+            stateDerivativeKernel(stage, U, masses, Iis, mus, k2)
+            for i in range(N):
+                for j in range(13):
+                    stage[i, j] = states[i, j] + 0.5 * dt * k2[i, j]
+            stateDerivativeKernel(stage, U, masses, Iis, mus, k3)
+            for i in range(N):
+                for j in range(13):
+                    stage[i, j] = states[i, j] + dt * k3[i, j]
+            stateDerivativeKernel(stage, U, masses, Iis, mus, k4)
+            for i in range(N):
+                for j in range(13):
+                    states[i, j] += (dt / 6.0) * (k1[i, j] + 2.0 * k2[i, j] + 2.0 * k3[i, j] + k4[i, j])
+        # Renormalise quaternions
+        for i in range(N):
+            norm = np.sqrt(states[i, 9]**2 + states[i, 10]**2 + states[i, 11]**2 + states[i, 12]**2)
+            if norm > 0.0:
+                for j in range(9, 13):
+                    states[i, j] /= norm
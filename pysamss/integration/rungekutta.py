@@ -0,0 +1,104 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Explicit Runge-Kutta integration schemes operating on state matrices
+import numpy as np
+
+def euler(f, t0, states0, dt, states_d=None):
+    """
+    Perform Euler integration.
+    See https://en.wikipedia.org/wiki/Euler_method.
+
+    Args:
+        f (function): State derivative function f(t, states) -> states_d.
+        t0 (float): Initial time (s).
+        states0 (np.array): Initial state matrix (N, 13).
+        dt (float): Timestep (s).
+        states_d (np.array): State derivative matrix at states0. If states_d=None
+                             it is evaluated using f.
+
+    Returns:
+        states1 (np.array): Updated state matrix after time dt.
+    """
+    if states_d is None:
+        states_d = f(t0, states0)
+    states1 = states0 + states_d * dt
+    return states1
+
+def rk4(f, t0, states0, dt, states_d=None):
+    """
+    Perform Runge-Kutta integration.
+    https://en.wikipedia.org/wiki/Runge-Kutta_methods
+
+    Args:
+        f (function): State derivative function f(t, states) -> states_d.
+        t0 (float): Initial time (s).
+        states0 (np.array): Initial state matrix (N, 13).
+        dt (float): Timestep (s).
+        states_d (np.array): State derivative matrix at states0. If states_d=None
+                             it is evaluated using f.
+
+    Returns:
+        states1 (np.array): Updated state matrix after time dt.
+
+    Note:
+        - f is evaluated at every intermediate stage so any state or time
+          dependent inputs (i.e. gravity) should be recalculated inside f.
+    """
+    if states_d is None:
+        states_d = f(t0, states0)
+    k1 = states_d
+    k2 = f(t0 + 0.5 * dt, states0 + (0.5 * dt * k1))
+    k3 = f(t0 + 0.5 * dt, states0 + (0.5 * dt * k2))
+    k4 = f(t0 + dt, states0 + (dt * k3))
+    states1 = states0 + ((1 / 6) * (k1 + (2 * k2) + (2 * k3) + k4)) * dt
+    return states1
+
+def rk45(f, t0, states0, dt, states_d=None):
+    """
+    Perform Dormand-Prince 5(4) embedded Runge-Kutta integration.
+    https://en.wikipedia.org/wiki/Dormand-Prince_method
+
+    Args:
+        f (function): State derivative function f(t, states) -> states_d.
+        t0 (float): Initial time (s).
+        states0 (np.array): Initial state matrix (N, 13).
+        dt (float): Timestep (s).
+        states_d (np.array): State derivative matrix at states0. If states_d=None
+                             it is evaluated using f.
+
+    Returns:
+        states1 (np.array): Updated (5th order) state matrix after time dt.
+        error (np.array): Local error estimate (N, 13), difference between the
+                          5th and embedded 4th order solutions.
+    """
+    if states_d is None:
+        states_d = f(t0, states0)
+    k1 = states_d
+    k2 = f(t0 + (1 / 5) * dt, states0 + dt * ((1 / 5) * k1))
+    k3 = f(t0 + (3 / 10) * dt, states0 + dt * ((3 / 40) * k1 + (9 / 40) * k2))
+    k4 = f(t0 + (4 / 5) * dt, states0 + dt * ((44 / 45) * k1 - (56 / 15) * k2 + (32 / 9) * k3))
+    k5 = f(t0 + (8 / 9) * dt, states0 + dt * ((19372 / 6561) * k1 - (25360 / 2187) * k2 + (64448 / 6561) * k3 - (212 / 729) * k4))
+    k6 = f(t0 + dt, states0 + dt * ((9017 / 3168) * k1 - (355 / 33) * k2 + (46732 / 5247) * k3 + (49 / 176) * k4 - (5103 / 18656) * k5))
+    states1 = states0 + dt * ((35 / 384) * k1 + (500 / 1113) * k3 + (125 / 192) * k4 - (2187 / 6784) * k5 + (11 / 84) * k6)
+    k7 = f(t0 + dt, states1)
+    error = dt * ((71 / 57600) * k1 - (71 / 16695) * k3 + (71 / 1920) * k4 - (17253 / 339200) * k5 + (22 / 525) * k6 - (1 / 40) * k7)
+    return states1, error
+
+def errorNorm(states0, states1, error, rtol, atol):
+    """
+    Get scaled error norm for an embedded Runge-Kutta step. A step is
+    acceptable if the error norm <= 1.
+
+    Args:
+        states0 (np.array): State matrix at the start of the step.
+        states1 (np.array): State matrix at the end of the step.
+        error (np.array): Local error estimate.
+        rtol (float): Relative tolerance.
+        atol (float): Absolute tolerance.
+
+    Returns:
+        norm (float): Maximum scaled error.
+    """
+    scale = atol + rtol * np.maximum(np.abs(states0), np.abs(states1))
+    norm = np.max(np.abs(error) / scale, initial=0.0)
+    return norm
@@ -0,0 +1,42 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Vectorised state space model for RigidBody objects
+import numpy as np
+
+def stateDerivative(states, U, masses, Iis, out=None):
+    """
+    Get state derivative for one or more RigidBody objects. Equivalent to
+    state_d = np.dot(A, state) + np.dot(B, U) evaluated for each row.
+
+    Args:
+        states (np.array): State matrix (N, 13) or state vector (13,)
+                           [u, v, w, x, y, z, phi_d, theta_d, psi_d, qw, qx, qy, qz].
+        U (np.array): Input matrix (N, 6) or input vector (6,) [Fx, Fy, Fz, Mx, My, Mz].
+        masses (np.array): Masses (N,) or mass [kg].
+        Iis (np.array): Inverse inertia matrices (N, 3, 3) or (3, 3).
+        out (np.array): Preallocated array to write the state derivative to. If
+                        out=None a new array is allocated.
+
+    Returns:
+        states_d (np.array): State derivative matrix (N, 13) or vector (13,)
+                             [u_d, v_d, w_d, x_d, y_d, z_d, phi_dd, theta_dd, psi_dd, qw_d, qx_d, qy_d, qz_d].
+    """
+    if out is None:
+        states_d = np.empty(np.shape(states))
+    else:
+        states_d = out
+    p = states[..., 6]
+    q = states[..., 7]
+    r = states[..., 8]
+    qw = states[..., 9]
+    qx = states[..., 10]
+    qy = states[..., 11]
+    qz = states[..., 12]
+    np.divide(U[..., 0:3], np.asarray(masses)[..., None], out=states_d[..., 0:3])
+    states_d[..., 3:6] = states[..., 0:3]
+    np.einsum('...ij,...j->...i', Iis, U[..., 3:6], out=states_d[..., 6:9])
+    states_d[..., 9] = -0.5 * (p * qx + q * qy + r * qz)
+    states_d[..., 10] = 0.5 * (p * qw + r * qy - q * qz)
+    states_d[..., 11] = 0.5 * (q * qw - r * qx + p * qz)
+    states_d[..., 12] = 0.5 * (r * qw + q * qx - p * qy)
+    return states_d
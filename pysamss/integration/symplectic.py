@@ -0,0 +1,109 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Symplectic integration schemes operating on state matrices
+import numpy as np
+from ..helpermath.quaternion import quaternionMultiply
+
+# Yoshida 4th order coefficients
+W1 = 1 / (2 - 2**(1 / 3))
+W0 = -(2**(1 / 3)) / (2 - 2**(1 / 3))
+
+def composition(f, t0, states0, dt, cs, ds, states_d=None):
+    """
+    Perform a drift/kick composition step. Position and velocity are updated
+    by alternating drifts x += c * dt * v and kicks v += d * dt * a(x).
+    Attitude is updated separately (see integrateAttitude).
+    https://en.wikipedia.org/wiki/Leapfrog_integration
+
+    Args:
+        f (function): State derivative function f(t, states) -> states_d. Only
+                      the acceleration [u_d, v_d, w_d] is used for kicks.
+        t0 (float): Initial time (s).
+        states0 (np.array): Initial state matrix (N, 13).
+        dt (float): Timestep (s).
+        cs (list): Drift coefficients.
+        ds (list): Kick coefficients.
+        states_d (np.array): State derivative matrix at states0. If states_d=None
+                             it is evaluated using f.
+
+    Returns:
+        states1 (np.array): Updated state matrix after time dt.
+    """
+    if states_d is None:
+        states_d = f(t0, states0)
+    states1 = states0.copy()
+    t = t0
+    for c, d in zip(cs, ds):
+        if c != 0.0:
+            states1[..., 3:6] += (c * dt) * states1[..., 0:3]
+            t += c * dt
+        if d != 0.0:
+            states1[..., 0:3] += (d * dt) * f(t, states1)[..., 0:3]
+    states1[..., 6:9], states1[..., 9:13] = integrateAttitude(states0, states_d[..., 6:9], dt)
+    return states1
+
+def integrateAttitude(states0, alphas, dt):
+    """
+    Integrate attitude_dot and attitude over dt assuming constant angular
+    acceleration. The quaternion is rotated exactly using the midpoint
+    attitude_dot so its norm is preserved.
+
+    Args:
+        states0 (np.array): Initial state matrix (N, 13).
+        alphas (np.array): Angular accelerations [phi_dd, theta_dd, psi_dd] (N, 3).
+        dt (float): Timestep (s).
+
+    Returns:
+        attitude_dot (np.array): Updated attitude_dot (N, 3).
+        attitude (np.array): Updated attitude quaternions [qw, qx, qy, qz] (N, 4).
+    """
+    omega = states0[..., 6:9] + (0.5 * dt) * alphas
+    omega_norm = np.sqrt(np.sum(omega**2, axis=-1, keepdims=True))
+    theta = 0.5 * dt * omega_norm
+    # sin(theta) / |omega| -> 0.5 * dt as |omega| -> 0
+    sin_theta = np.where(omega_norm > 0.0, np.sin(theta) / np.where(omega_norm > 0.0, omega_norm, 1.0), 0.5 * dt)
+    rotation = np.concatenate([np.cos(theta), sin_theta * omega], axis=-1)
+    attitude = quaternionMultiply(states0[..., 9:13], rotation)
+    attitude_dot = states0[..., 6:9] + dt * alphas
+    return attitude_dot, attitude
+
+def leapfrog(f, t0, states0, dt, states_d=None):
+    """
+    Perform 2nd order leapfrog (drift-kick-drift) integration. One state
+    derivative evaluation per step.
+
+    Args:
+        f (function): State derivative function f(t, states) -> states_d.
+        t0 (float): Initial time (s).
+        states0 (np.array): Initial state matrix (N, 13).
+        dt (float): Timestep (s).
+        states_d (np.array): State derivative matrix at states0. If states_d=None
+                             it is evaluated using f.
+
+    Returns:
+        states1 (np.array): Updated state matrix after time dt.
+    """
+    states1 = composition(f, t0, states0, dt, [0.5, 0.5], [1.0, 0.0], states_d)
+    return states1
+
+def yoshida4(f, t0, states0, dt, states_d=None):
+    """
+    Perform 4th order Yoshida integration. Three state derivative evaluations
+    per step.
+    https://en.wikipedia.org/wiki/Leapfrog_integration#Yoshida_algorithms
+
+    Args:
+        f (function): State derivative function f(t, states) -> states_d.
+        t0 (float): Initial time (s).
+        states0 (np.array): Initial state matrix (N, 13).
+        dt (float): Timestep (s).
+        states_d (np.array): State derivative matrix at states0. If states_d=None
+                             it is evaluated using f.
+
+    Returns:
+        states1 (np.array): Updated state matrix after time dt.
+    """
+    cs = [0.5 * W1, 0.5 * (W0 + W1), 0.5 * (W0 + W1), 0.5 * W1]
+    ds = [W1, W0, W1, 0.0]
+    states1 = composition(f, t0, states0, dt, cs, ds, states_d)
+    return states1
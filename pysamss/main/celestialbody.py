@@ -9,6 +9,9 @@ import shutil
 from .rigidbody import RigidBody
 from .referenceframe import ReferenceFrame
 from ..helpermath.helpermath import *
+from ..helpermath.orbital import orbitalelements2cartesian
+from .ephemeris import Ephemeris
+from ..forcetorque.drag import Atmosphere
 
 class CelestialBody(RigidBody):
     """
@@ -21,12 +24,30 @@ class CelestialBody(RigidBody):
         state (np.array): State vector [u, v, w, x, y, z, phi_d, theta_d, psi_d, qw, qx, qy, qz].
         U (np.array): U vector [Fx, Fy, Fz, Mx, My, Mz].
         parent_name (str): Name of parent RigidBody object.
+        propagation (str): Propagation mode ['integrate', 'kepler', 'ephemeris'].
+                           See setPropagation.
+        orbital_elements (list): Orbital elements [a, e, omega, LAN, i, M0, t0]
+                                 about the parent. See setOrbitalElements.
+        ephemeris (Ephemeris): Ephemeris object. See setEphemeris.
+        zonal_harmonics (list): Zonal harmonic coefficients [J2, J3, ... Jn].
+                                See setZonalHarmonics.
+        atmosphere (Atmosphere): Atmosphere object. See setAtmosphere.
     """
-    def __init__(self, name=None, mass=0.0, radius=0.0, state=None, U=None, parent_name=None, texture=None):
+    def __init__(self, name=None, mass=0.0, radius=0.0, state=None, U=None, parent_name=None, texture=None, propagation='integrate', orbital_elements=None, ephemeris=None, zonal_harmonics=None, atmosphere=None):
         RigidBody.__init__(self, name=name, state=state, U=U, parent_name=parent_name)
         self.mass = mass
         self.radius = radius
-        self.I = self.calculateI()
+        self.setI(self.calculateI())
+        self.orbital_elements = None
+        if orbital_elements is not None:
+            self.setOrbitalElements(orbital_elements)
+        self.ephemeris = ephemeris
+        self.propagation = 'integrate'
+        self.setPropagation(propagation)
+        self.zonal_harmonics = None
+        if zonal_harmonics is not None:
+            self.setZonalHarmonics(zonal_harmonics)
+        self.atmosphere = atmosphere
         if texture is not None:
             self.setTexture(texture)
         else:
@@ -50,6 +71,15 @@ class CelestialBody(RigidBody):
         else:
             group.attrs.create('parent_name', np.string_(self.parent.name))
         group.create_dataset('I', data=self.I)
+        group.attrs.create('propagation', np.string_(self.propagation))
+        if self.orbital_elements is not None:
+            group.create_dataset('orbital_elements', data=self.orbital_elements)
+        if self.ephemeris is not None:
+            self.ephemeris.save(group.create_group('ephemeris'))
+        if self.zonal_harmonics is not None:
+            group.create_dataset('zonal_harmonics', data=self.zonal_harmonics)
+        if self.atmosphere is not None:
+            self.atmosphere.save(group.create_group('atmosphere'))
         if self.texture is None:
             group.attrs.create('texture', np.string_('None'))
         else:
@@ -72,6 +102,18 @@ class CelestialBody(RigidBody):
         if parent_name == 'None':
             parent_name = None
         self.setParentName(parent_name)
+        self.setI(np.array(group.get('I')))
+        if 'orbital_elements' in group:
+            self.setOrbitalElements(np.array(group.get('orbital_elements')))
+        if 'ephemeris' in group:
+            self.ephemeris = Ephemeris([])
+            self.ephemeris.load(group['ephemeris'])
+        self.propagation = group.attrs.get('propagation', np.string_('integrate')).decode('UTF-8')
+        if 'zonal_harmonics' in group:
+            self.setZonalHarmonics(np.array(group.get('zonal_harmonics')))
+        if 'atmosphere' in group:
+            self.atmosphere = Atmosphere()
+            self.atmosphere.load(group['atmosphere'])
         texture = group.attrs['texture'].decode('UTF-8')
         if texture == 'None':
             self.texture = None
@@ -96,6 +138,144 @@ class CelestialBody(RigidBody):
         """
         self.radius = radius
 
+    def getPropagation(self):
+        """
+        Get propagation mode.
+
+        Returns:
+            propagation (str): Propagation mode ['integrate', 'kepler', 'ephemeris'].
+        """
+        return self.propagation
+
+    def setPropagation(self, propagation):
+        """
+        Set propagation mode.
+
+        Args:
+            propagation (str): Propagation mode ['integrate', 'kepler', 'ephemeris'].
+
+        Note:
+            - 'integrate' integrates the CelestialBody position and velocity
+              numerically under gravity from all CelestialBody objects.
+            - 'kepler' evaluates position and velocity about the parent in
+              closed form from the orbital elements (see setOrbitalElements).
+              Gravitational forces on the CelestialBody are not calculated,
+              it still acts as a gravity source for other objects. Attitude
+              is integrated as normal.
+            - 'ephemeris' evaluates position and velocity from the ephemeris
+              (see setEphemeris). As for 'kepler' gravitational forces on the
+              CelestialBody are not calculated.
+        """
+        if propagation == 'kepler' and (self.orbital_elements is None or self.parent_name is None):
+            print('Error: "' + str(self.name) + '" requires a parent and orbital elements for kepler propagation.')
+            return
+        if propagation == 'ephemeris' and self.ephemeris is None:
+            print('Error: "' + str(self.name) + '" requires an ephemeris for ephemeris propagation.')
+            return
+        self.propagation = propagation
+
+    def getOrbitalElements(self):
+        """
+        Get orbital elements used for kepler propagation.
+
+        Returns:
+            orbital_elements (np.array): Orbital elements [a, e, omega, LAN, i, M0, t0].
+        """
+        return self.orbital_elements
+
+    def setOrbitalElements(self, orbital_elements):
+        """
+        Set orbital elements about the parent used for kepler propagation.
+
+        Args:
+            orbital_elements (list): Orbital elements [a, e, omega, LAN, i, M0, t0].
+                                     See helpermath.orbital.orbitalelements2cartesian.
+        """
+        self.orbital_elements = np.array(orbital_elements, dtype=float)
+
+    def getEphemeris(self):
+        """
+        Get ephemeris used for ephemeris propagation.
+
+        Returns:
+            ephemeris (Ephemeris): Ephemeris object.
+        """
+        return self.ephemeris
+
+    def setEphemeris(self, ephemeris):
+        """
+        Set ephemeris used for ephemeris propagation.
+
+        Args:
+            ephemeris (Ephemeris): Ephemeris object giving position and velocity
+                                   in universal coordinates (see
+                                   ephemeris.loadSPK).
+        """
+        self.ephemeris = ephemeris
+
+    def getZonalHarmonics(self):
+        """
+        Get zonal harmonic coefficients.
+
+        Returns:
+            zonal_harmonics (np.array): Zonal harmonic coefficients [J2, J3, ... Jn].
+        """
+        return self.zonal_harmonics
+
+    def setZonalHarmonics(self, zonal_harmonics):
+        """
+        Set zonal harmonic coefficients. Vessel objects orbiting the
+        CelestialBody feel the perturbing accelerations of its zonal gravity
+        field (see forcetorque.harmonics.ZonalHarmonics), i.e. [1.08263e-3]
+        for Earth J2.
+
+        Args:
+            zonal_harmonics (list): Unnormalised zonal harmonic coefficients
+                                    [J2, J3, ... Jn]. Referenced to radius with
+                                    the polar axis along bodyFixedRF.k.
+        """
+        self.zonal_harmonics = np.array(zonal_harmonics, dtype=float)
+
+    def getAtmosphere(self):
+        """
+        Get atmosphere.
+
+        Returns:
+            atmosphere (Atmosphere): Atmosphere object.
+        """
+        return self.atmosphere
+
+    def setAtmosphere(self, atmosphere):
+        """
+        Set atmosphere. Vessel objects orbiting the CelestialBody feel drag
+        from an atmosphere co-rotating with the CelestialBody, altitudes are
+        taken above radius (see forcetorque.drag).
+
+        Args:
+            atmosphere (Atmosphere): Atmosphere object, i.e. Atmosphere() for Earth.
+        """
+        self.atmosphere = atmosphere
+
+    def calculateKeplerState(self, delta_t):
+        """
+        Calculate position and velocity relative to the parent from the
+        orbital elements.
+
+        Args:
+            delta_t (float): Time since orbital elements epoch t0 [s].
+
+        Returns:
+            position (np.array): Position relative to parent x, y, z [m].
+            velocity (np.array): Velocity relative to parent u, v, w [m/s].
+
+        Note:
+            - delta_t is passed to orbitalelements2cartesian relative to t0 = 0
+              so that precision is not lost to the magnitude of Julian dates.
+        """
+        a, e, omega, LAN, i, M0, t0 = self.orbital_elements
+        position, velocity = orbitalelements2cartesian(a, e, omega, LAN, i, M0, 0.0, delta_t / 86400, self.parent)
+        return position, velocity
+
     def calculateI(self):
         """
         Calculate intertia matrix I.
@@ -142,7 +322,7 @@ class CelestialBody(RigidBody):
         """
         Nrad = 180
         position = self.getPosition()
-        attitude = np.rad2deg(quaternion2euler(self.getAttitude()))
+        attitude = np.rad2deg(quaternion2euler(self.state[9:13]))
         if self.texture is None:
             p = tvtk.Property(color=(1, 1, 1))
             sphere = tvtk.SphereSource(radius=self.radius, theta_resolution=Nrad, phi_resolution=Nrad)
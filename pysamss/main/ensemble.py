@@ -0,0 +1,227 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Ensemble Class
+import numpy as np
+from ..forcetorque.gravity import G, gravityAccelerations
+from ..integration.statespace import stateDerivative
+from ..integration.rungekutta import euler, rk4
+from ..integration.symplectic import leapfrog, yoshida4
+from ..helpermath.quaternion import quaternionRotate
+
+class Ensemble:
+    """
+    Ensemble class. Propagates members perturbed copies of a System together
+    as a (members, N, 13) state array for Monte Carlo dispersion studies.
+
+    Args:
+        system (obj): Nominal System object. The current Timestep, scheme, dt,
+                      endtime and saveinterval of the System are used.
+        members (int): Number of ensemble members.
+        seed (int): Random number generator seed. Default seed = None.
+
+    Note:
+        - Uses the System fixed step scheme ('euler', 'rk4', 'leapfrog' or
+          'yoshida4').
+        - Only direct gravity between integrated objects and constant thrust
+          are modelled. simulate raises ValueError for System configurations
+          the Ensemble does not support (see checkSystem).
+        - Ensemble members are not written to *.h5 files.
+    """
+    def __init__(self, system, members, seed=None):
+        self.system = system
+        self.members = members
+        self.rng = np.random.default_rng(seed)
+        self.dispersions = []
+        self.thrusts = {}
+        self.times = []
+        self.trajectories = []
+        self.mean = []
+        self.std = []
+
+    def addDispersion(self, name, quantity, sigma):
+        """
+        Add a normally distributed dispersion to a CelestialBody or Vessel.
+
+        Args:
+            name (str): Name of CelestialBody or Vessel object to disperse.
+            quantity (str): Quantity to disperse ['position', 'velocity', 'mass', 'thrust'].
+            sigma (float/np.array): Standard deviation. For 'position' [m] and
+                                    'velocity' [m/s] either a float (all axes)
+                                    or np.array([x, y, z]) in universalRF. For
+                                    'mass' and 'thrust' a fraction of the
+                                    nominal value.
+        """
+        self.dispersions.append([name, quantity, sigma])
+
+    def setThrust(self, name, force):
+        """
+        Set constant thrust force acting on a Vessel for the duration of the
+        simulation.
+
+        Args:
+            name (str): Vessel name.
+            force (np.array): Thrust force in Vessel bodyRF [Fx, Fy, Fz] (N).
+        """
+        self.thrusts[name] = np.array(force, dtype=float)
+
+    def checkSystem(self):
+        """
+        Check the System configuration is supported by the Ensemble.
+
+        Raises:
+            ValueError: If the System uses a feature the Ensemble does not
+                        model, i.e. rk45, multi-rate integration, Barnes-Hut
+                        or pruned gravity, kepler/ephemeris CelestialBody
+                        objects, encke Vessel objects, zonal harmonics, drag,
+                        events or conjunction screening.
+        """
+        system = self.system
+        unsupported = []
+        if system.scheme not in ['euler', 'rk4', 'leapfrog', 'yoshida4']:
+            unsupported.append("scheme '" + system.scheme + "'")
+        if system.celestial_body_dt is not None:
+            unsupported.append('multi-rate integration')
+        if system.gravity_solver != 'direct':
+            unsupported.append("gravity solver '" + system.gravity_solver + "'")
+        if system.gravity_tolerance is not None:
+            unsupported.append('gravity pruning')
+        if len(system.getPrescribedRows()) > 0:
+            unsupported.append('kepler/ephemeris propagation')
+        if len(system.getEnckeRows()[0]) > 0:
+            unsupported.append('encke propagation')
+        system.updateZonalHarmonics()
+        if system.zonal_harmonics:
+            unsupported.append('zonal harmonics')
+        system.updateDrag()
+        if system.drag:
+            unsupported.append('drag')
+        if system.events:
+            unsupported.append('events')
+        if system.conjunction_threshold is not None:
+            unsupported.append('conjunction screening')
+        if unsupported:
+            raise ValueError('Ensemble does not support ' + ', '.join(unsupported) + '.')
+
+    def getInitialConditions(self):
+        """
+        Get dispersed initial conditions for all ensemble members.
+
+        Returns:
+            states (np.array): State array (members, N, 13).
+            masses (np.array): Masses (members, N) [kg].
+            thrusts (np.array): Thrust forces in bodyRF (members, N, 3) [N].
+        """
+        current = self.system.current
+        current.bindStates()
+        names = [rigid_body.name for rigid_body in current.getRigidBodies()]
+        N = len(names)
+        states = np.repeat(current.states[None, :, :], self.members, axis=0)
+        masses = np.repeat(current.masses[None, :], self.members, axis=0)
+        thrusts = np.zeros((self.members, N, 3))
+        for name, force in self.thrusts.items():
+            thrusts[:, names.index(name)] = force
+        for name, quantity, sigma in self.dispersions:
+            i = names.index(name)
+            if quantity == 'position':
+                states[:, i, 3:6] += self.rng.normal(0.0, 1.0, (self.members, 3)) * sigma
+            elif quantity == 'velocity':
+                states[:, i, 0:3] += self.rng.normal(0.0, 1.0, (self.members, 3)) * sigma
+            elif quantity == 'mass':
+                masses[:, i] *= 1.0 + self.rng.normal(0.0, sigma, self.members)
+            elif quantity == 'thrust':
+                thrusts[:, i] *= 1.0 + self.rng.normal(0.0, sigma, self.members)[:, None]
+        return states, masses, thrusts
+
+    def getStatesD(self, states, masses, mus, Iis, thrusts):
+        """
+        Get state derivative array for all ensemble members.
+
+        Args:
+            states (np.array): State array (members, N, 13).
+            masses (np.array): Masses (members, N) [kg].
+            mus (np.array): Standard gravitational parameters (members, N_celestial_bodies).
+            Iis (np.array): Inverse inertia matrices (members, N, 3, 3).
+            thrusts (np.array): Thrust forces in bodyRF (members, N, 3) [N].
+
+        Returns:
+            states_d (np.array): State derivative array (members, N, 13).
+        """
+        n = mus.shape[-1]
+        positions = states[..., 3:6]
+        U = np.zeros(states.shape[:-1] + (6,))
+        U[..., 0:3] = masses[..., None] * gravityAccelerations(positions, positions[..., :n, :], mus)
+        if self.thrusts:
+            U[..., 0:3] += quaternionRotate(states[..., 9:13], thrusts) # Rotate thrust from bodyRF to universalRF
+        states_d = stateDerivative(states, U, masses, Iis)
+        return states_d
+
+    def simulate(self, trajectories=True):
+        """
+        Simulate all ensemble members forward from the System current time to
+        the System endtime. Every saveinterval timesteps the member mean and
+        standard deviation are recorded and, optionally, the full state array.
+
+        Args:
+            trajectories (bool): Keep the full (members, N, 13) state array at
+                                 each save. Default = True.
+
+        Returns:
+            times (np.array): Save times (K,) [s].
+            mean (np.array): Member mean state (K, N, 13).
+            std (np.array): Member standard deviation of state (K, N, 13).
+
+        Raises:
+            ValueError: If the System configuration is not supported (see checkSystem).
+        """
+        self.checkSystem()
+        current = self.system.current
+        states, masses, thrusts = self.getInitialConditions()
+        n = len(current.celestial_bodies)
+        mus = G * masses[:, :n]
+        Iis = current.Iis[None, :, :, :] * np.divide(current.masses, masses, out=np.ones_like(masses), where=masses != 0.0)[:, :, None, None]
+        scheme = {'euler' : euler, 'rk4' : rk4, 'leapfrog' : leapfrog, 'yoshida4' : yoshida4}[self.system.scheme]
+        dt = self.system.dt
+        f = lambda t, states : self.getStatesD(states, masses, mus, Iis, thrusts)
+        self.times = []
+        self.trajectories = []
+        self.mean = []
+        self.std = []
+        time = current.time
+        iterations = self.system.getIterations() # Same step count as System.simulateSystem
+        for i in range(0, iterations + 1):
+            if i % self.system.saveinterval == 0 or i == iterations:
+                self.times.append(time)
+                self.mean.append(np.mean(states, axis=0))
+                self.std.append(np.std(states, axis=0))
+                if trajectories:
+                    self.trajectories.append(states.copy())
+            if i == iterations:
+                break
+            states = scheme(f, time, states, dt)
+            time += dt
+        self.times = np.array(self.times)
+        self.mean = np.array(self.mean)
+        self.std = np.array(self.std)
+        if trajectories:
+            self.trajectories = np.array(self.trajectories)
+        return self.times, self.mean, self.std
+
+    def getTrajectories(self):
+        """
+        Get per-member trajectories from the last simulate call.
+
+        Returns:
+            trajectories (np.array): State array (K, members, N, 13) at each save time.
+        """
+        return self.trajectories
+
+    def getStatistics(self):
+        """
+        Get member mean and standard deviation from the last simulate call.
+
+        Returns:
+            times (np.array): Save times (K,) [s].
+            mean (np.array): Member mean state (K, N, 13).
+            std (np.array): Member standard deviation of state (K, N, 13).
+        """
+        return self.times, self.mean, self.std
@@ -0,0 +1,205 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Ephemeris Class. Evaluates positions and velocities from SPK type 2 Chebyshev
+# segments. jplephem is used to read .bsp kernels, if it is not installed
+# JPLEPHEM_AVAILABLE is False and only in memory segments can be used.
+import numpy as np
+from numpy.polynomial import chebyshev
+try:
+    from jplephem.spk import SPK
+    JPLEPHEM_AVAILABLE = True
+except ImportError:
+    JPLEPHEM_AVAILABLE = False
+
+class Ephemeris:
+    """
+    Ephemeris class. Position and velocity are summed over a chain of links,
+    i.e. solar system barycentre -> Earth-Moon barycentre -> Earth. Each link
+    is a list of SPK type 2 segments covering different time spans.
+
+    Args:
+        links (list): Links [[segment, ...], ...]. Each segment is
+                      [init, intlen, coefficients], see readSPKType2.
+        path (str): Path to .bsp kernel the links were read from (see loadSPK).
+        pairs (list): [center, target] NAIF ID pairs of the links.
+
+    Note:
+        - Times are seconds past J2000 in the kernel time scale (TDB).
+          System converts Timestep epochs (UTC) with
+          helpermath.timescales.utc2tdb before evaluating.
+        - The record used by each link is cached so repeated evaluations
+          within a record are a Chebyshev polynomial evaluation only.
+    """
+    def __init__(self, links, path=None, pairs=None):
+        self.links = links
+        self.path = path
+        self.pairs = pairs
+        self.records = [None] * len(links)
+
+    def save(self, group):
+        """
+        Save Ephemeris object to .h5 file. Kernel backed ephemerides are saved
+        as their path and pairs, otherwise the segments are saved.
+
+        Args:
+            group (h5py group): HDF5 file group to save Ephemeris object to.
+        """
+        if self.path is not None:
+            group.attrs.create('path', np.string_(self.path))
+            group.create_dataset('pairs', data=np.array(self.pairs))
+        else:
+            for i, link in enumerate(self.links):
+                for j, (init, intlen, coefficients) in enumerate(link):
+                    dataset = group.create_dataset(str(i) + '_' + str(j), data=coefficients)
+                    dataset.attrs.create('init', init)
+                    dataset.attrs.create('intlen', intlen)
+
+    def load(self, group):
+        """
+        Load Ephemeris object from .h5 file. Kernel backed ephemerides are
+        reloaded from their kernel (see loadSPK).
+
+        Args:
+            group (h5py group): HDF5 file group to load Ephemeris object from.
+
+        Raises:
+            ImportError: If the ephemeris is kernel backed and jplephem is not
+                         installed.
+            ValueError: If the kernel does not contain the saved pairs.
+        """
+        if 'path' in group.attrs:
+            self.path = group.attrs['path'].decode('UTF-8')
+            self.pairs = np.array(group.get('pairs')).tolist()
+            self.links = loadSPK(self.path, self.pairs).links
+        else:
+            links = {}
+            for key in group.keys():
+                i, j = [int(index) for index in key.split('_')]
+                dataset = group.get(key)
+                links.setdefault(i, {})[j] = [dataset.attrs['init'], dataset.attrs['intlen'], np.array(dataset)]
+            self.links = [[links[i][j] for j in sorted(links[i])] for i in sorted(links)]
+        self.records = [None] * len(self.links)
+
+    def getRecord(self, link, t):
+        """
+        Get the Chebyshev record of a link covering time t. The last record
+        used is cached.
+
+        Args:
+            link (int): Link index.
+            t (float): Time [s past J2000].
+
+        Returns:
+            record (list): [start, end, mid, radius, position coefficients
+                           (ncoef, 3), velocity coefficients (ncoef - 1, 3)].
+        """
+        record = self.records[link]
+        if record is not None and record[0] <= t <= record[1]:
+            return record
+        for init, intlen, coefficients in self.links[link]:
+            n = len(coefficients)
+            if init <= t <= init + n * intlen:
+                index = min(int((t - init) // intlen), n - 1)
+                start = init + index * intlen
+                position_coefficients = coefficients[index].T
+                velocity_coefficients = chebyshev.chebder(position_coefficients)
+                record = [start, start + intlen, start + 0.5 * intlen, 0.5 * intlen, position_coefficients, velocity_coefficients]
+                self.records[link] = record
+                return record
+        raise ValueError('Ephemeris does not cover t = ' + str(t) + ' s past J2000.')
+
+    def getState(self, t):
+        """
+        Get position and velocity at time t.
+
+        Args:
+            t (float): Time [s past J2000].
+
+        Returns:
+            position (np.array): Position vector x, y, z [m].
+            velocity (np.array): Velocity vector u, v, w [m/s].
+        """
+        position = np.zeros(3)
+        velocity = np.zeros(3)
+        for link in range(0, len(self.links)):
+            start, end, mid, radius, position_coefficients, velocity_coefficients = self.getRecord(link, t)
+            x = (t - mid) / radius
+            position += chebyshev.chebval(x, position_coefficients)
+            velocity += chebyshev.chebval(x, velocity_coefficients) / radius
+        return position * 1000, velocity * 1000 # Convert from km -> m and km/s -> m/s
+
+def readSPKType2(words):
+    """
+    Read an SPK type 2 segment from its array of double precision words.
+
+    Args:
+        words (np.array): Segment words. Records [MID, RADIUS, X coefficients,
+                          Y coefficients, Z coefficients] followed by INIT,
+                          INTLEN, RSIZE and N.
+
+    Returns:
+        segment (list): [init [s past J2000], intlen [s], coefficients (N, 3, ncoef) [km]].
+    """
+    init, intlen, rsize, n = words[-4:]
+    records = np.reshape(words[:-4], (int(n), int(rsize)))
+    coefficients = np.reshape(records[:, 2:], (int(n), 3, (int(rsize) - 2) // 3))
+    segment = [init, intlen, coefficients]
+    return segment
+
+def fitSPKType2(function, init, intlen, n, ncoef):
+    """
+    Fit an SPK type 2 segment to a position function, i.e. to generate a
+    synthetic kernel or to tabulate an analytic trajectory.
+
+    Args:
+        function (function): Position function function(t) -> position (..., 3)
+                             [km] for times t [s past J2000].
+        init (float): Segment start [s past J2000].
+        intlen (float): Record length [s].
+        n (int): Number of records.
+        ncoef (int): Number of Chebyshev coefficients per component.
+
+    Returns:
+        words (np.array): Segment words (see readSPKType2).
+    """
+    x = np.cos(np.pi * (np.arange(ncoef) + 0.5) / ncoef) # Chebyshev nodes
+    records = []
+    for index in range(0, n):
+        mid = init + (index + 0.5) * intlen
+        positions = np.array(function(mid + 0.5 * intlen * x))
+        coefficients = chebyshev.chebfit(x, positions, ncoef - 1) # (ncoef, 3)
+        records.append(np.concatenate([[mid, 0.5 * intlen], coefficients.T.flatten()]))
+    words = np.concatenate([np.concatenate(records), [init, intlen, 2 + 3 * ncoef, n]])
+    return words
+
+def loadSPK(path, pairs):
+    """
+    Load an Ephemeris object from the type 2 segments of a .bsp kernel.
+
+    Args:
+        path (str): Path to .bsp kernel.
+        pairs (list): [center, target] NAIF ID pairs to chain, i.e.
+                      [[0, 3], [3, 399]] for Earth.
+
+    Returns:
+        ephemeris (Ephemeris): Ephemeris object.
+
+    Raises:
+        ImportError: If jplephem is not installed.
+        ValueError: If a pair has no type 2 segments in the kernel.
+    """
+    if not JPLEPHEM_AVAILABLE:
+        raise ImportError('jplephem is required to load "' + path + '".')
+    kernel = SPK.open(path)
+    links = []
+    try:
+        for center, target in pairs:
+            segments = [readSPKType2(segment.daf.read_array(segment.start_i, segment.end_i)) for segment in kernel.segments
+                        if segment.center == center and segment.target == target and segment.data_type == 2]
+            if not segments:
+                raise ValueError('No type 2 segments for ' + str(center) + ' -> ' + str(target) + ' in "' + path + '".')
+            links.append(segments)
+    finally:
+        kernel.close()
+    ephemeris = Ephemeris(links, path, pairs)
+    return ephemeris
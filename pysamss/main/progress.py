@@ -0,0 +1,139 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Progress Class
+import numpy as np
+import time
+
+class Progress:
+    """
+    Progress class. Tracks progress of a long running operation and notifies
+    observer callbacks at a wall clock and/or step interval.
+
+    Args:
+        name (str): Operation name i.e. 'Simulate System'.
+        start (float): Start position i.e. simulation start time [s].
+        end (float): End position i.e. simulation end time [s].
+        observers (list): Observer callbacks observer(info). See getInfo for
+                          the contents of info.
+        wall_interval (float): Minimum wall clock time between notifications
+                               (s). Default wall_interval = 1.0.
+        step_interval (int): Number of steps between notifications. Default
+                             step_interval = None.
+
+    Note:
+        - If observers is empty update only counts steps.
+        - Observers are notified if either interval has elapsed and always
+          once more from finish.
+    """
+    def __init__(self, name, start, end, observers, wall_interval=1.0, step_interval=None):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.observers = observers
+        self.wall_interval = wall_interval
+        self.step_interval = step_interval
+        self.steps = 0
+        self.start_wall_time = time.perf_counter()
+        self.last_wall_time = self.start_wall_time
+        self.last_steps = 0
+
+    def update(self, position, steps=1):
+        """
+        Update progress following steps steps.
+
+        Args:
+            position (float): Current position i.e. simulation time [s].
+            steps (int): Number of steps taken since the last update. Default = 1.
+        """
+        self.steps += steps
+        if not self.observers:
+            return
+        if self.step_interval is not None and self.steps - self.last_steps >= self.step_interval:
+            self.notify(position)
+        elif self.wall_interval is not None and time.perf_counter() - self.last_wall_time >= self.wall_interval:
+            self.notify(position)
+
+    def finish(self, position):
+        """
+        Notify observers that the operation has finished.
+
+        Args:
+            position (float): Final position i.e. simulation time [s].
+        """
+        if self.observers:
+            self.notify(position, finished=True)
+
+    def notify(self, position, finished=False):
+        """
+        Notify observers of current progress.
+
+        Args:
+            position (float): Current position i.e. simulation time [s].
+            finished (bool): True if the operation has finished. Default = False.
+        """
+        info = self.getInfo(position, finished)
+        for observer in self.observers:
+            observer(info)
+        self.last_wall_time = self.start_wall_time + info['wall_time']
+        self.last_steps = self.steps
+
+    def getInfo(self, position, finished=False):
+        """
+        Get progress information.
+
+        Args:
+            position (float): Current position i.e. simulation time [s].
+            finished (bool): True if the operation has finished. Default = False.
+
+        Returns:
+            info (dict): Progress information with keys
+                         - 'name': Operation name.
+                         - 'progress': Progress (%).
+                         - 'position': Current position i.e. simulation time [s].
+                         - 'steps': Steps taken.
+                         - 'wall_time': Wall clock time elapsed (s).
+                         - 'step_rate': Steps per wall clock second.
+                         - 'rate': Position advanced per wall clock second i.e.
+                           sim-time/wall-time ratio.
+                         - 'eta': Estimated wall clock time remaining (s).
+                         - 'finished': True if the operation has finished.
+        """
+        wall_time = time.perf_counter() - self.start_wall_time
+        if self.end != self.start:
+            fraction = (position - self.start) / (self.end - self.start)
+        else:
+            fraction = 1.0
+        if wall_time > 0.0:
+            step_rate = self.steps / wall_time
+            rate = (position - self.start) / wall_time
+        else:
+            step_rate = np.inf
+            rate = np.inf
+        if finished:
+            eta = 0.0
+        elif fraction > 0.0:
+            eta = wall_time * (1 - fraction) / fraction
+        else:
+            eta = np.inf
+        info = {'name' : self.name,
+                'progress' : fraction * 100,
+                'position' : position,
+                'steps' : self.steps,
+                'wall_time' : wall_time,
+                'step_rate' : step_rate,
+                'rate' : rate,
+                'eta' : eta,
+                'finished' : finished}
+        return info
+
+def printProgress(info):
+    """
+    Observer callback printing progress on a single updating line.
+
+    Args:
+        info (dict): Progress information (see Progress.getInfo).
+    """
+    print(info['name'] + "; Progress: " + str(np.around(info['progress'], decimals = 2)) + " %. " +
+          str(np.around(info['step_rate'], decimals = 1)) + " steps/s. ETA: " + str(np.around(info['eta'], decimals = 1)) + " s.", end="\r")
+    if info['finished']:
+        print('\n')
@@ -4,6 +4,7 @@
 import numpy as np
 from mayavi import mlab
 from tvtk.api import tvtk
+from ..helpermath.quaternion import quaternion2array, quaternionNormalize, quaternions2rotationMatrices
 
 class ReferenceFrame:
     """
@@ -49,11 +50,12 @@ class ReferenceFrame:
         Rotate ReferenceFrame by quaternion.
 
         Args:
-            quaternion (Quaternion): Quaternion to rotate by.
+            quaternion (Quaternion/np.array): Quaternion to rotate by.
         """
-        i = quaternion.rotate(self.i)
-        j = quaternion.rotate(self.j)
-        k = quaternion.rotate(self.k)
+        R = quaternions2rotationMatrices(quaternionNormalize(quaternion2array(quaternion)))
+        i = np.dot(R, self.i)
+        j = np.dot(R, self.j)
+        k = np.dot(R, self.k)
         self.setIJK(i, j, k)
 
     def rotateAbs(self, quaternion):
@@ -62,15 +64,11 @@ class ReferenceFrame:
         univeralRF.
 
         Args:
-            quaternion (Quaternion): Quaternion to rotate by.
+            quaternion (Quaternion/np.array): Quaternion to rotate by.
         """
-        self.i = np.array([1, 0, 0])
-        self.j = np.array([0, 1, 0])
-        self.k = np.array([0, 0, 1])
-        i = quaternion.rotate(self.i)
-        j = quaternion.rotate(self.j)
-        k = quaternion.rotate(self.k)
-        self.setIJK(i, j, k)
+        # Columns of the rotation matrix are the rotated universalRF i, j, k vectors
+        R = quaternions2rotationMatrices(quaternionNormalize(quaternion2array(quaternion)))
+        self.setIJK(R[:, 0], R[:, 1], R[:, 2])
 
     def getIJK(self):
         """ Get i, j and k vectors. """
@@ -4,6 +4,7 @@
 import numpy as np
 from .referenceframe import ReferenceFrame
 from ..helpermath.helpermath import *
+from ..integration.statespace import stateDerivative
 
 class RigidBody:
     """
@@ -17,23 +18,29 @@ class RigidBody:
 
     Note:
         - CelestialBody and Vessel classes derive the majority of their methods from RigidBody class.
+        - state and U are updated in place so that they can be views into the
+          Timestep state and input matrices (see bindState).
+        - The inverse inertia matrix is cached and recalculated only after
+          setI is called.
     """
     def __init__(self, name=None, state=None, U=None, parent_name=None):
         self.name = name
         if state is None:
             self.state = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
         else:
-            self.state = state
+            self.state = np.array(state, dtype=float)
         if U is None:
             self.U = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
         else:
-            self.U = U
+            self.U = np.array(U, dtype=float)
         self.universalRF = None
         self.parentRF = None
         self.bodyRF = None
         self.bodyFixedRF = None
         self.parent_name = parent_name
         self.parent = None
+        self.state_d_buffer = np.zeros((4, 13)) # Preallocated state derivative buffers (k1, k2, k3, k4)
+        self.Ii = None # Cached inverse inertia matrix
     
     def getName(self):
         """
@@ -89,9 +96,24 @@ class RigidBody:
         Args:
             state (np.array): State vector to set.
         """
+        self.state[:] = state
+
+    def bindState(self, state, U):
+        """
+        Bind state and U vectors to externally owned arrays, typically rows of
+        the Timestep state and input matrices. Current values are copied into
+        the new arrays.
+
+        Args:
+            state (np.array): Array (13,) to use as the state vector.
+            U (np.array): Array (6,) to use as the input vector U.
+        """
+        state[:] = self.state
+        U[:] = self.U
         self.state = state
+        self.U = U
     
-    def getStateD(self, state0=None, A=None, B=None, U=None):
+    def getStateD(self, state0=None, A=None, B=None, U=None, out=None):
         """
         Get state derivative vector.
         [u_d, v_d, w_d, x_d, y_d, z_d, phi_dd, theta_dd, psi_dd, qw_d, qx_d, qy_d, qz_d].
@@ -101,16 +123,29 @@ class RigidBody:
             A (np.array): System matrix A. If A=None the current A matrix is used.
             B (np.array): Control matrix B. If B=None the current B matrix is used.
             U (np.array): Input vector U. If U=None the current U vector is used.
+            out (np.array): Preallocated array (13,) to write the state derivative to.
+                            If out=None a new array is allocated.
+
+        Note:
+            - If neither A nor B are given the state derivative is evaluated in
+              closed form (equivalent to np.dot(A, state0) + np.dot(B, U))
+              without building the A and B matrices.
         """
         if state0 is None:
             state0 = self.getState()
+        if U is None:
+            U = self.getU()
+        if A is None and B is None:
+            state_d = stateDerivative(state0, U, self.getMass(), self.getIi(), out=out)
+            return state_d
         if A is None:
-            A = self.getA()
+            A = self.getA(state0=state0)
         if B is None:
             B = self.getB()
-        if U is None:
-            U = self.getU()
         state_d = np.dot(A, state0) + np.dot(B, U)
+        if out is not None:
+            out[:] = state_d
+            state_d = out
         return state_d
 
     def getVelocity(self, local=None):
@@ -337,7 +372,7 @@ class RigidBody:
         Args:
             U (np.array): Input vector U.
         """
-        self.U = U
+        self.U[:] = U
 
     def addForce(self, force, local=None):
         """
@@ -494,17 +529,19 @@ class RigidBody:
             I (np.array): CelestialBody inertia matrix.
         """
         self.I = I
+        self.Ii = None # Invalidate cached inverse inertia matrix
     
     def getIi(self):
         """
-        Get inverse inertia matrix Ii.
+        Get inverse inertia matrix Ii. Calculated on first call after the
+        inertia matrix is set and cached.
 
         Returns:
             Ii (np.array): CelestialBody inverse inertia matrix.
         """
-        I = self.getI()
-        Ii = np.linalg.inv(I)
-        return Ii
+        if self.Ii is None:
+            self.Ii = np.linalg.inv(self.getI())
+        return self.Ii
     
     ### Integration schemes ###
 
@@ -551,21 +588,18 @@ class RigidBody:
         if state0 is None:
             state0 = self.getState()
         if state_d is None:
-            state_d = self.getStateD()
+            state_d = self.getStateD(out=self.state_d_buffer[0])
         # k1
         k1 = state_d
         # k2
         state_k2 = state0 + (0.5 * dt * k1)
-        A = self.getA(state0=state_k2)
-        k2 = self.getStateD(state0=state_k2, A=A)
+        k2 = self.getStateD(state0=state_k2, out=self.state_d_buffer[1])
         # k3
         state_k3 = state0 + (0.5 * dt * k2)
-        A = self.getA(state0=state_k3)
-        k3 = self.getStateD(state0=state_k3, A=A)
+        k3 = self.getStateD(state0=state_k3, out=self.state_d_buffer[2])
         # k4
         state_k4 = state0 + (dt * k3)
-        A = self.getA(state0=state_k4)
-        k4 = self.getStateD(state0=state_k4, A=A)
+        k4 = self.getStateD(state0=state_k4, out=self.state_d_buffer[3])
         # Calculate state1
         state1 = state0 + ((1 / 6) * (k1 + (2 * k2) + (2 * k3) + k4)) * dt
         return state1
@@ -585,4 +619,10 @@ class RigidBody:
         # Update state and U vectors.
         self.setState(state1)
         self.setU(np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
-        self.bodyRF.rotateAbs(Quaternion(state1[9:]))
\ No newline at end of file
+        self.updateReferenceFrames()
+
+    def updateReferenceFrames(self):
+        """
+        Update reference frames following a change in state.
+        """
+        self.bodyRF.rotateAbs(self.state[9:13])
\ No newline at end of file
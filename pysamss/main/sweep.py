@@ -0,0 +1,191 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Sweep Class
+import numpy as np
+import itertools
+import contextlib
+import concurrent.futures
+import multiprocessing.shared_memory
+import os
+import signal
+from .progress import Progress
+
+def runSweepTask(factory, params, index, record_times, shm_name, shape, timeout):
+    """
+    Run a single Sweep task in a worker process. States at record_times are
+    written into row index of the shared memory result array. Record times
+    that are not a multiple of dt are reached with a final partial step.
+
+    Args:
+        factory (function): System factory factory(**params) -> System.
+        params (dict): Parameters passed to factory.
+        index (int): Task index.
+        record_times (list): Simulation times to record states at [s].
+        shm_name (str): Name of the shared memory block holding the result array.
+        shape (tuple): Shape of the result array (tasks, K, N, 13).
+        timeout (float): Task timeout (s). None for no timeout.
+
+    Returns:
+        index (int): Task index.
+        status (str): Task status ['done', 'timeout', 'error']. 'error' if a
+                      record time could not be reached.
+    """
+    shm = multiprocessing.shared_memory.SharedMemory(name=shm_name)
+    results = np.ndarray(shape, dtype=float, buffer=shm.buf)
+    use_alarm = timeout is not None and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        def handler(signum, frame):
+            raise TimeoutError
+        signal.signal(signal.SIGALRM, handler)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    status = 'done'
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            system = factory(**params)
+            system.setSaveFiles(False)
+            for k, record_time in enumerate(record_times):
+                system.setEndTime(record_time)
+                system.simulateSystem()
+                remainder = record_time - system.current.time
+                if system.scheme != 'rk45' and remainder > 1e-9 * system.getDt():
+                    dt = system.getDt()
+                    system.setDt(remainder)
+                    system.simulateSystem()
+                    system.setDt(dt)
+                if not np.isclose(system.current.time, record_time, rtol=1e-9, atol=1e-9):
+                    status = 'error'
+                    break
+                results[index, k] = system.current.getStates()
+    except TimeoutError:
+        status = 'timeout'
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        del results
+        shm.close()
+    return index, status
+
+class Sweep:
+    """
+    Sweep class. Runs System variants over a parameter grid in a process pool.
+    States are written into a shared memory result array instead of *.h5 files.
+
+    Args:
+        factory (function): System factory factory(**params) -> System. Must be
+                            picklable (i.e. defined at module level).
+        grid (dict): Parameter grid {name : [value, ...]}. Every combination is
+                     run, in itertools.product order.
+        record_times (list): Simulation times to record states at [s]. If
+                             record_times=None only the state at the System
+                             endtime is recorded.
+        workers (int): Number of worker processes. Default = os.cpu_count().
+        timeout (float): Per-task wall clock timeout (s). Default = None.
+
+    Note:
+        - Results are ordered by task index regardless of completion order.
+        - Timeouts are enforced with SIGALRM and are ignored on platforms
+          without it.
+        - run is quiet unless progress observers are added (see addObserver).
+    """
+    def __init__(self, factory, grid, record_times=None, workers=None, timeout=None):
+        self.factory = factory
+        self.grid = grid
+        self.record_times = record_times
+        self.workers = workers
+        self.timeout = timeout
+        self.params = [dict(zip(grid.keys(), values)) for values in itertools.product(*grid.values())]
+        self.results = None
+        self.status = []
+        self.errors = []
+        self.observers = []
+
+    def getParams(self):
+        """
+        Get list of task parameters.
+
+        Returns:
+            params (list): List of parameter dicts in task order.
+        """
+        return self.params
+
+    def addObserver(self, observer):
+        """
+        Add progress observer callback. Observers are called as each task
+        completes and once when all tasks have completed.
+
+        Args:
+            observer (function): Observer callback observer(info). See
+                                 Progress.getInfo for the contents of info,
+                                 position is the number of completed tasks.
+        """
+        self.observers.append(observer)
+
+    def getObservers(self):
+        """
+        Get progress observer callbacks.
+
+        Returns:
+            observers (list): List of observer callbacks.
+        """
+        return self.observers
+
+    def getErrors(self):
+        """
+        Get task errors from the last run.
+
+        Returns:
+            errors (list): repr of the exception raised by each task that
+                           failed, None for other tasks, in task order.
+        """
+        return self.errors
+
+    def run(self):
+        """
+        Run all tasks.
+
+        Returns:
+            results (np.array): State array (tasks, K, N, 13). Rows of tasks
+                                that timed out or failed are NaN.
+            status (list): Task status ['done', 'timeout', 'error'] in task
+                           order. See getErrors for the cause of 'error'.
+        """
+        # Step 1: Build nominal System to get the result array shape
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            system = self.factory(**self.params[0])
+        record_times = self.record_times
+        if record_times is None:
+            record_times = [system.getEndTime()]
+        shape = (len(self.params), len(record_times), len(system.current.getRigidBodies()), 13)
+        # Step 2: Allocate shared memory result array
+        shm = multiprocessing.shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+        try:
+            results = np.ndarray(shape, dtype=float, buffer=shm.buf)
+            results[:] = np.nan
+            self.status = ['error'] * len(self.params)
+            self.errors = [None] * len(self.params)
+            # Step 3: Run tasks
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(runSweepTask, self.factory, params, index, record_times, shm.name, shape, self.timeout) for index, params in enumerate(self.params)]
+                progress = Progress('Sweep', 0, len(futures), self.observers, wall_interval=None, step_interval=1)
+                completed = 0
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        index, status = future.result()
+                        self.status[index] = status
+                        if status != 'done':
+                            results[index] = np.nan
+                        if status == 'error':
+                            self.errors[index] = 'Record time not reached.'
+                    except Exception as exception:
+                        index = futures.index(future)
+                        results[index] = np.nan
+                        self.errors[index] = repr(exception)
+                    completed += 1
+                    progress.update(completed)
+                progress.finish(completed)
+            self.results = results.copy()
+            del results
+        finally:
+            shm.close()
+            shm.unlink()
+        return self.results, self.status
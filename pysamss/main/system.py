@@ -11,14 +11,27 @@ from tvtk.api import tvtk # python wrappers for the C++ vtk ecosystem
 import shutil
 import datetime
 import julian
-from .timestep import Timestep
+from .timestep import Timestep, J2000_JULIAN_DATE
 from .referenceframe import ReferenceFrame
 from .celestialbody import CelestialBody
 from .vessel import Vessel
 from .stage import Stage
 from ..helpermath.helpermath import *
-from ..forcetorque.gravity import gravity
+from ..forcetorque.gravity import gravity, gravityAccelerations, significantSources, prunedGravityAccelerations
+from ..forcetorque.barneshut import Octree
+from ..forcetorque.harmonics import ZonalHarmonics
+from ..forcetorque.drag import dragForces, atmosphereVelocities
 from ..forcetorque.thrust import thrust
+from ..integration.statespace import stateDerivative
+from ..integration.rungekutta import euler, rk4, rk45, errorNorm
+from ..integration.symplectic import leapfrog, yoshida4
+from ..integration.interpolation import interpolateStates
+from ..integration.kernels import NUMBA_AVAILABLE, simulateKernel
+from ..integration.events import brent, isCrossing
+from ..helpermath.conjunction import screenConjunctions
+from ..helpermath.orbital import keplerPropagate
+from ..helpermath.timescales import utc2tdb
+from .progress import Progress
 
 class System:
     """
@@ -35,29 +48,174 @@ class System:
         self.dt = 0.1
         self.endtime = 100.0
         self.saveinterval = 1
+        self.save_files = True
+        self.checkpointinterval = None
         self.scheme = 'euler'
+        self.backend = 'numpy'
+        self.gravity_solver = 'direct'
+        self.theta = 0.5
+        self.octree = None
+        self.gravity_tolerance = None
+        self.gravity_update_interval = 100
+        self.gravity_sources = None
+        self.gravity_sources_age = 0
+        self.celestial_body_dt = None
+        self.rtol = 1e-9
+        self.atol = 1e-6
+        self.step_dt = None
+        self.step_error = 0.0
+        self.rejected_steps = 0
+        self.events = []
+        self.detected_events = []
+        self.event_tolerance = 1e-3
+        self.conjunction_threshold = None
+        self.conjunctions = []
+        self.encke_tolerance = 1e-2
+        self.encke_reference = None
+        self.zonal_harmonics = None
+        self.drag = None
+        self.observers = []
+        self.progress_interval = 1.0
+        self.progress_step_interval = None
 
     def save(self):
         """
-        Save system.
+        Save system. Does nothing if save_files is False (see setSaveFiles).
         """
-        # Create save file if it does not already exist
-        if not(os.path.exists(self.name + '.psm')):
-            open(self.name + '.psm', 'a').close()
+        if not self.save_files:
+            return
         # Create save directory if it does not already exist
         if not(os.path.exists(self.save_directory)):
             os.mkdir(self.save_directory)
         path = self.save_directory + '/' + str(int(self.current.savefile)) + '.h5'
-        f = h5py.File(path, 'a')
+        f = h5py.File(path, 'w')
         # System class
         f.attrs.create('name', np.string_(self.name))
         f.attrs.create('save_directory', np.string_(self.save_directory))
         f.attrs.create('dt', self.dt)
         f.attrs.create('endtime', self.endtime)
         f.attrs.create('saveinterval', int(self.saveinterval))
+        f.attrs.create('scheme', np.string_(self.scheme))
+        if self.scheme == 'rk45':
+            f.attrs.create('step_dt', self.step_dt)
+            f.attrs.create('step_error', self.step_error)
+            f.attrs.create('rejected_steps', self.rejected_steps)
         self.current.save(f)
         f.close()
-    
+        # Record latest savefile in save file
+        with open(self.name + '.psm', 'w') as psm:
+            psm.write(str(int(self.current.savefile)))
+
+    def checkpoint(self, force=False):
+        """
+        Save checkpoint of the current Timestep and integrator state to
+        *_checkpoint.h5. A checkpoint is taken every checkpointinterval
+        saves, immediately before the save is made, so resume continues with
+        the same savefile. The checkpoint is written to a temporary file first
+        so an interrupted write leaves the previous checkpoint intact.
+
+        Args:
+            force (bool): Save checkpoint regardless of checkpointinterval.
+                          Default = False.
+        """
+        if not self.save_files:
+            return
+        if not force and (self.checkpointinterval is None or self.current.savefile % self.checkpointinterval != 0):
+            return
+        path = self.name + '_checkpoint.h5'
+        f = h5py.File(path + '.tmp', 'w')
+        # System class
+        f.attrs.create('name', np.string_(self.name))
+        f.attrs.create('save_directory', np.string_(self.save_directory))
+        f.attrs.create('dt', self.dt)
+        f.attrs.create('endtime', self.endtime)
+        f.attrs.create('saveinterval', int(self.saveinterval))
+        f.attrs.create('scheme', np.string_(self.scheme))
+        f.attrs.create('backend', np.string_(self.backend))
+        f.attrs.create('gravity_solver', np.string_(self.gravity_solver))
+        f.attrs.create('theta', self.theta)
+        if self.gravity_tolerance is not None:
+            f.attrs.create('gravity_tolerance', self.gravity_tolerance)
+            f.attrs.create('gravity_update_interval', int(self.gravity_update_interval))
+        if self.gravity_sources is not None:
+            f.create_dataset('gravity_sources', data=self.gravity_sources)
+            f.attrs.create('gravity_sources_age', int(self.gravity_sources_age))
+        if self.celestial_body_dt is not None:
+            f.attrs.create('celestial_body_dt', self.celestial_body_dt)
+        if self.checkpointinterval is not None:
+            f.attrs.create('checkpointinterval', int(self.checkpointinterval))
+        f.attrs.create('rtol', self.rtol)
+        f.attrs.create('atol', self.atol)
+        if self.step_dt is not None:
+            f.attrs.create('step_dt', self.step_dt)
+        f.attrs.create('step_error', self.step_error)
+        f.attrs.create('rejected_steps', int(self.rejected_steps))
+        f.attrs.create('event_tolerance', self.event_tolerance)
+        if self.conjunction_threshold is not None:
+            f.attrs.create('conjunction_threshold', self.conjunction_threshold)
+        f.attrs.create('encke_tolerance', self.encke_tolerance)
+        if self.encke_reference is not None:
+            group = f.create_group('encke_reference')
+            for key, data in zip(['rows', 'parents', 'times', 'positions', 'velocities', 'mus'], self.encke_reference):
+                group.create_dataset(key, data=data)
+        self.current.save(f)
+        f.close()
+        os.replace(path + '.tmp', path)
+
+    def resume(self, path):
+        """
+        Resume system from the checkpoint saved alongside a *.psm file. Only
+        the checkpoint is read so resume time does not depend on the number of
+        saved timesteps.
+
+        Args:
+            path (str): Path to *.psm file.
+
+        Note:
+            - Events are not saved in checkpoints and must be added again.
+        """
+        self.setName(path[:-4])
+        self.save_directory = self.name + '_data'
+        checkpoint_path = self.name + '_checkpoint.h5'
+        if not(os.path.exists(checkpoint_path)):
+            print('Error: No checkpoint found at ' + checkpoint_path + '.')
+            return
+        f = h5py.File(checkpoint_path, 'r')
+        new_timestep = Timestep()
+        new_timestep.load(f)
+        self.setDt(f.attrs['dt'])
+        self.setEndTime(f.attrs['endtime'])
+        self.setSaveInterval(f.attrs['saveinterval'])
+        self.scheme = f.attrs['scheme'].decode('UTF-8')
+        self.backend = f.attrs['backend'].decode('UTF-8')
+        self.gravity_solver = f.attrs['gravity_solver'].decode('UTF-8')
+        self.theta = f.attrs['theta']
+        self.gravity_tolerance = f.attrs.get('gravity_tolerance')
+        self.gravity_update_interval = f.attrs.get('gravity_update_interval', 100)
+        if 'gravity_sources' in f:
+            self.gravity_sources = np.array(f.get('gravity_sources'))
+            self.gravity_sources_age = f.attrs['gravity_sources_age']
+        else:
+            self.gravity_sources = None
+            self.gravity_sources_age = 0
+        self.celestial_body_dt = f.attrs.get('celestial_body_dt')
+        self.checkpointinterval = f.attrs.get('checkpointinterval')
+        self.rtol = f.attrs['rtol']
+        self.atol = f.attrs['atol']
+        self.step_dt = f.attrs.get('step_dt')
+        self.step_error = f.attrs['step_error']
+        self.rejected_steps = f.attrs['rejected_steps']
+        self.event_tolerance = f.attrs['event_tolerance']
+        self.conjunction_threshold = f.attrs.get('conjunction_threshold')
+        self.encke_tolerance = f.attrs.get('encke_tolerance', 1e-2)
+        if 'encke_reference' in f:
+            self.encke_reference = [np.array(f['encke_reference'][key]) for key in ['rows', 'parents', 'times', 'positions', 'velocities', 'mus']]
+        else:
+            self.encke_reference = None
+        f.close()
+        self.timesteps = {new_timestep.time : new_timestep}
+        self.setCurrent(new_timestep)
+
     def load(self, path, every_nth=1, getAll=True):
         """
         Load system data.
@@ -72,8 +230,9 @@ class System:
         self.save_directory = self.name + '_data'
         self.timesteps = {}
         # Load data into timesteps dict
-        timestep_paths = glob.glob(self.save_directory + '/*.h5')[::every_nth]
         if getAll:
+            timestep_paths = glob.glob(self.save_directory + '/*.h5')[::every_nth]
+            progress = self.getProgress('Load', 0, len(timestep_paths))
             i = 0
             for timestep_path in timestep_paths:
                 f = h5py.File(timestep_path, 'r')
@@ -84,14 +243,19 @@ class System:
                     self.setEndTime(f.attrs['endtime'])
                     self.setSaveInterval(f.attrs['saveinterval'])
                 f.close()
-                self.timesteps[new_timestep.savefile] = new_timestep
+                self.timesteps[new_timestep.time] = new_timestep
                 i += 1
-                progress = (i / len(timestep_paths)) * 100
-                print("Load; Progress: " + str(np.around(progress, decimals = 2)) + " %.", end="\r")
-            print('\n')
+                progress.update(i)
+            progress.finish(i)
         else:
-            latest_index = max(range(len(timestep_paths)), key=lambda i: int(timestep_paths[i][len(self.save_directory + "/"):-3]))
-            timestep_path = timestep_paths[latest_index]
+            # Latest savefile is recorded in the *.psm file, older *.psm files are empty
+            with open(path, 'r') as psm:
+                latest = psm.read().strip()
+            if latest:
+                timestep_path = self.save_directory + '/' + latest + '.h5'
+            else:
+                timestep_paths = glob.glob(self.save_directory + '/*.h5')
+                timestep_path = max(timestep_paths, key=lambda timestep_path : int(timestep_path[len(self.save_directory + "/"):-3]))
             f = h5py.File(timestep_path, 'r')
             new_timestep = Timestep()
             new_timestep.load(f)
@@ -100,7 +264,7 @@ class System:
             self.setSaveInterval(f.attrs['saveinterval'])
             f.close()
             self.timesteps[new_timestep.time] = new_timestep
-        # Set current timestep to the last one in timesteps dict
+        # Set current timestep to the last one in timesteps dict, timesteps are keyed by time
         self.setCurrent(self.timesteps[max(list(self.timesteps.keys()))])
     
     def getName(self):
@@ -183,10 +347,145 @@ class System:
             dt (float): System dt.
         """
         self.dt = dt
+
+    def getIterations(self):
+        """
+        Get number of fixed steps of size dt from the current time to the
+        endtime. Steps within 1e-9 dt of the endtime are counted so floating
+        point error in the accumulated time does not drop a step.
+
+        Returns:
+            iterations (int): Number of steps.
+        """
+        iterations = max(0, int(np.floor((self.endtime - self.current.time) / self.dt + 1e-9)))
+        return iterations
     
+    def getSaveFiles(self):
+        """
+        Get save_files - whether timesteps are written to *.h5 files.
+
+        Returns:
+            save_files (bool): System save_files.
+        """
+        return self.save_files
+
+    def setSaveFiles(self, save_files):
+        """
+        Set save_files - whether timesteps are written to *.h5 files.
+
+        Args:
+            save_files (bool): System save_files.
+        """
+        self.save_files = save_files
+
+    def getCheckpointInterval(self):
+        """
+        Get checkpointinterval - number of saves between checkpoints.
+
+        Returns:
+            checkpointinterval (int): System checkpointinterval.
+        """
+        return self.checkpointinterval
+
+    def setCheckpointInterval(self, checkpointinterval):
+        """
+        Set checkpointinterval - number of saves between checkpoints. If
+        checkpointinterval=None (default) only a checkpoint at the end of
+        simulateSystem is saved.
+
+        Args:
+            checkpointinterval (int): System checkpointinterval.
+        """
+        self.checkpointinterval = checkpointinterval
+
+    def addObserver(self, observer):
+        """
+        Add progress observer callback. Observers are called during
+        simulateSystem and load at the progress interval (see
+        setProgressInterval) and once on completion.
+
+        Args:
+            observer (function): Observer callback observer(info). See
+                                 Progress.getInfo for the contents of info.
+
+        Note:
+            - No observers are added by default so simulateSystem and load
+              are quiet. Use pysamss.printProgress to print progress.
+        """
+        self.observers.append(observer)
+
+    def getObservers(self):
+        """
+        Get progress observer callbacks.
+
+        Returns:
+            observers (list): List of observer callbacks.
+        """
+        return self.observers
+
+    def setProgressInterval(self, progress_interval, progress_step_interval=None):
+        """
+        Set interval between progress observer notifications.
+
+        Args:
+            progress_interval (float): Minimum wall clock time between
+                                       notifications (s). None to disable.
+            progress_step_interval (int): Number of steps between
+                                          notifications. Default = None.
+        """
+        self.progress_interval = progress_interval
+        self.progress_step_interval = progress_step_interval
+
+    def getProgress(self, name, start=None, end=None):
+        """
+        Get Progress object notifying the System observers.
+
+        Args:
+            name (str): Operation name.
+            start (float): Start position. Default = current time.
+            end (float): End position. Default = endtime.
+
+        Returns:
+            progress (obj): Progress object.
+        """
+        if start is None:
+            start = self.current.time
+        if end is None:
+            end = self.endtime
+        progress = Progress(name, start, end, self.observers, self.progress_interval, self.progress_step_interval)
+        return progress
+
+    def getCelestialBodyDt(self):
+        """
+        Get CelestialBody timestep [s] used for multi-rate integration.
+
+        Returns:
+            celestial_body_dt (float): CelestialBody timestep. None if all
+                                       objects share dt.
+        """
+        return self.celestial_body_dt
+
+    def setCelestialBodyDt(self, celestial_body_dt):
+        """
+        Set CelestialBody timestep [s] for multi-rate integration. CelestialBody
+        objects are stepped at celestial_body_dt and Vessel objects are
+        sub-cycled at dt with CelestialBody states interpolated between
+        CelestialBody steps.
+
+        Args:
+            celestial_body_dt (float): CelestialBody timestep. Rounded to the
+                                       nearest multiple of dt. None disables
+                                       multi-rate integration.
+
+        Note:
+            - Only applies to fixed step schemes.
+        """
+        self.celestial_body_dt = celestial_body_dt
+
     def getSaveInterval(self):
         """
-        Get saveinterval - every nth timestep.
+        Get saveinterval - every nth timestep. For adaptive schemes data is
+        saved every saveinterval * dt seconds of simulation time.
 
         Returns:
             saveinterval (float): System saveinterval.
@@ -195,7 +494,8 @@ class System:
     
     def setSaveInterval(self, saveinterval):
         """
-        Set saveinterval - every nth timestep.
+        Set saveinterval - every nth timestep. For adaptive schemes data is
+        saved every saveinterval * dt seconds of simulation time.
 
         Args:
             saveinterval (float): System saveinterval.
@@ -207,10 +507,722 @@ class System:
         Set integration scheme to use for simulating the system.
 
         Args:
-            scheme (str): Integration scheme to use ['euler', 'rk4'].
+            scheme (str): Integration scheme to use ['euler', 'rk4', 'rk45',
+                          'leapfrog', 'yoshida4'].
+
+        Note:
+            - 'rk4' recalculates gravitational forces at every intermediate stage.
+            - 'rk45' is an adaptive Dormand-Prince scheme. dt is used as the
+              initial step size and step size is controlled by the System
+              tolerances (see setTolerances).
+            - 'leapfrog' (2nd order) and 'yoshida4' (4th order) are symplectic
+              schemes with bounded energy error for long duration runs.
+              Position/velocity and attitude are updated separately.
         """
         self.scheme = scheme
 
+    def getBackend(self):
+        """
+        Get backend used for simulating the system.
+
+        Returns:
+            backend (str): Backend ['numpy', 'numba'].
+        """
+        return self.backend
+
+    def setBackend(self, backend):
+        """
+        Set backend used for simulating the system.
+
+        Args:
+            backend (str): Backend to use ['numpy', 'numba'].
+
+        Note:
+            - 'numba' runs gravity, state derivative, integration and quaternion
+              renormalisation between saves as a single compiled kernel. If
+              the System uses features the kernel does not support a warning
+              is printed and the numpy backend is used (see
+              getKernelUnsupported).
+            - Falls back to 'numpy' if Numba is not installed.
+        """
+        if backend == 'numba' and not NUMBA_AVAILABLE:
+            print('Warning: Numba is not installed. Using "numpy" backend.')
+            backend = 'numpy'
+        self.backend = backend
+
+    def getGravitySolver(self):
+        """
+        Get solver used for calculating gravitational forces.
+
+        Returns:
+            gravity_solver (str): Gravity solver ['direct', 'barneshut'].
+            theta (float): Barnes-Hut opening angle.
+        """
+        return self.gravity_solver, self.theta
+
+    def setGravitySolver(self, gravity_solver, theta=0.5):
+        """
+        Set solver used for calculating gravitational forces.
+
+        Args:
+            gravity_solver (str): Gravity solver to use ['direct', 'barneshut'].
+            theta (float): Barnes-Hut opening angle. Smaller values are more
+                           accurate, theta = 0.0 gives the direct sum.
+                           Default theta = 0.5.
+
+        Note:
+            - 'direct' sums the gravitational force due to every CelestialBody
+              object on every object, O(N * N_celestial_bodies).
+            - 'barneshut' builds an octree of CelestialBody objects once per
+              step and approximates distant groups of CelestialBody objects
+              by their total mass at their centre of mass,
+              O(N log N_celestial_bodies). Later stages of the step refit the
+              tree to the moved CelestialBody objects (see getOctree).
+              Worthwhile for systems with many CelestialBody objects.
+            - The numba backend only supports 'direct'. With 'barneshut' the
+              numpy backend is used.
+        """
+        if gravity_solver not in ['direct', 'barneshut']:
+            print('Error: Unknown gravity solver "' + str(gravity_solver) + '".')
+            return
+        self.gravity_solver = gravity_solver
+        self.theta = theta
+        self.octree = None
+
+    def getOctree(self, source_positions):
+        """
+        Get the Barnes-Hut octree of CelestialBody objects for the current
+        step. The tree is built from source_positions on the first call of
+        each step (see calculateInputs) and refitted to source_positions on
+        later calls.
+
+        Args:
+            source_positions (np.array): CelestialBody positions (N_celestial_bodies, 3).
+
+        Returns:
+            octree (obj): Octree object of CelestialBody objects.
+        """
+        if self.octree is None or len(self.octree.mus) != len(source_positions):
+            self.octree = Octree(source_positions, self.current.mus)
+        else:
+            self.octree.update(source_positions, self.current.mus)
+        return self.octree
+
+    def getGravityPruning(self):
+        """
+        Get Vessel gravity source pruning settings.
+
+        Returns:
+            gravity_tolerance (float): Relative acceleration budget for
+                                       dropped sources. None if pruning is
+                                       disabled.
+            gravity_update_interval (int): Number of steps between
+                                           re-evaluations of significant sources.
+        """
+        return self.gravity_tolerance, self.gravity_update_interval
+
+    def setGravityPruning(self, gravity_tolerance, gravity_update_interval=100):
+        """
+        Set Vessel gravity source pruning. For each Vessel object only
+        CelestialBody objects that are significant (see significantSources)
+        are included in the gravitational force calculation.
+
+        Args:
+            gravity_tolerance (float): Relative acceleration budget for dropped
+                                       sources i.e. 1e-6. None disables pruning.
+            gravity_update_interval (int): Number of steps between
+                                           re-evaluations of significant
+                                           sources. Default = 100.
+
+        Note:
+            - When significant sources are evaluated the sum of the dropped
+              acceleration magnitudes acting on each Vessel object is at most
+              gravity_tolerance times the sum of all gravitational
+              acceleration magnitudes acting on it. Between evaluations the
+              dropped fraction drifts with the geometry, so
+              gravity_update_interval * dt should be short compared to the
+              orbital periods of the dropped sources.
+            - CelestialBody objects whose sphere of influence contains the
+              Vessel object are always kept.
+            - CelestialBody/CelestialBody interactions are not pruned.
+            - The numba backend does not support pruning. With pruning the
+              numpy backend is used.
+        """
+        self.gravity_tolerance = gravity_tolerance
+        self.gravity_update_interval = gravity_update_interval
+        self.gravity_sources = None
+        self.gravity_sources_age = 0
+
+    def getGravitySources(self):
+        """
+        Get significant gravity sources for each Vessel object.
+
+        Returns:
+            gravity_sources (np.array): Boolean matrix (N_vessels, N_celestial_bodies),
+                                        True where a CelestialBody acts on a
+                                        Vessel. None if pruning is disabled or
+                                        sources have not been evaluated.
+        """
+        return self.gravity_sources
+
+    def updateGravitySources(self, force=False):
+        """
+        Re-evaluate significant gravity sources for each Vessel object every
+        gravity_update_interval calls. Does nothing if pruning is disabled.
+
+        Args:
+            force (bool): Re-evaluate regardless of gravity_update_interval.
+                          Default = False.
+        """
+        if self.gravity_tolerance is None:
+            self.gravity_sources = None
+            return
+        n = len(self.current.celestial_bodies)
+        shape = (len(self.current.states) - n, n)
+        if force or self.gravity_sources is None or np.shape(self.gravity_sources) != shape or self.gravity_sources_age >= self.gravity_update_interval:
+            positions = self.current.states[:, 3:6]
+            # Sphere of influence radius r_soi = a * (m / M)**(2 / 5), a is approximated by the distance to the parent
+            soi_radii = np.full(n, np.inf)
+            for i, celestial_body in enumerate(self.current.celestial_bodies.values()):
+                if celestial_body.parent is not None:
+                    distance = np.linalg.norm(positions[i] - celestial_body.parent.getPosition())
+                    soi_radii[i] = distance * (celestial_body.getMass() / celestial_body.parent.getMass())**(2 / 5)
+            self.gravity_sources = significantSources(positions[n:], positions[:n], self.current.mus, self.gravity_tolerance, soi_radii)
+            self.gravity_sources_age = 0
+        self.gravity_sources_age += 1
+
+    def getTolerances(self):
+        """
+        Get relative and absolute tolerances used by adaptive schemes.
+
+        Returns:
+            rtol (float): Relative tolerance.
+            atol (float): Absolute tolerance.
+        """
+        return self.rtol, self.atol
+
+    def setTolerances(self, rtol, atol):
+        """
+        Set relative and absolute tolerances used by adaptive schemes. A step
+        is accepted if the local error estimate of every state element is
+        below atol + rtol * abs(state).
+
+        Args:
+            rtol (float): Relative tolerance.
+            atol (float): Absolute tolerance.
+        """
+        self.rtol = rtol
+        self.atol = atol
+
+    def getStepError(self):
+        """
+        Get the scaled local error estimate of the last accepted adaptive step.
+
+        Returns:
+            step_error (float): Scaled error estimate (<= 1 for accepted steps).
+        """
+        return self.step_error
+
+    def addEvent(self, name, function, terminal=False, direction=0):
+        """
+        Add an event to be detected during simulateSystem.
+
+        Args:
+            name (str): Event name.
+            function (function): Scalar event function event(t, states) -> float
+                                 of time and state matrix (N, 13). The event
+                                 occurs when it crosses zero. Use
+                                 Timestep.getIndex to find state matrix rows.
+            terminal (bool): Stop simulateSystem at the event. Default = False.
+            direction (int): Crossing direction. 1 = rising (negative to
+                             positive), -1 = falling, 0 = either. Default = 0.
+        """
+        self.events.append([name, function, terminal, direction])
+
+    def getEvents(self):
+        """
+        Get events.
+
+        Returns:
+            events (list): List of [name, function, terminal, direction].
+        """
+        return self.events
+
+    def getDetectedEvents(self):
+        """
+        Get detected events.
+
+        Returns:
+            detected_events (list): List of [name, time, states] in the order
+                                    they occurred.
+        """
+        return self.detected_events
+
+    def getEventTolerance(self):
+        """
+        Get event time tolerance.
+
+        Returns:
+            event_tolerance (float): Event time tolerance (s).
+        """
+        return self.event_tolerance
+
+    def setEventTolerance(self, event_tolerance):
+        """
+        Set event time tolerance.
+
+        Args:
+            event_tolerance (float): Event time tolerance (s).
+        """
+        self.event_tolerance = event_tolerance
+
+    def detectEvents(self, step, t0, states0, states1, dt):
+        """
+        Detect events over a step. Zero-crossings are found by comparing event
+        function values at the start and end of the step and refined using
+        Brent's method, re-integrating the step to each trial time.
+
+        Args:
+            step (function): Step function step(h) -> state matrix at t0 + h.
+            t0 (float): Step start time (s).
+            states0 (np.array): State matrix at t0.
+            states1 (np.array): State matrix at t0 + dt.
+            dt (float): Step size (s).
+
+        Returns:
+            dt (float): Step size to the first terminal event, or dt if no
+                        terminal event occurred.
+            states1 (np.array): State matrix at t0 + dt.
+            terminal (bool): True if a terminal event occurred.
+        """
+        # Evaluate prescribed CelestialBody objects at each trial time
+        integrate_step = step
+        step = lambda h : self.setPrescribedStates(t0 + h, integrate_step(h))
+        states1 = self.setPrescribedStates(t0 + dt, states1)
+        crossings = []
+        for name, function, terminal, direction in self.events:
+            g0 = function(t0, states0)
+            g1 = function(t0 + dt, states1)
+            if isCrossing(g0, g1, direction):
+                g = lambda h : function(t0 + h, step(h))
+                h = brent(g, 0.0, dt, g0, g1, self.event_tolerance)
+                if h < dt and np.sign(g(h)) == np.sign(g0): # Make sure the event has occurred at t0 + h
+                    h = min(dt, h + self.event_tolerance)
+                crossings.append([h, name, terminal])
+        crossings.sort(key=lambda crossing : crossing[0])
+        for h, name, terminal in crossings:
+            states = states1 if h == dt else step(h)
+            self.detected_events.append([name, t0 + h, states.copy()])
+            if terminal:
+                return h, states, True
+        return dt, states1, False
+
+    def getConjunctionThreshold(self):
+        """
+        Get conjunction screening distance [m].
+
+        Returns:
+            conjunction_threshold (float): Conjunction screening distance. None
+                                           if screening is disabled.
+        """
+        return self.conjunction_threshold
+
+    def setConjunctionThreshold(self, conjunction_threshold):
+        """
+        Set conjunction screening distance [m]. Pairs of Vessel objects closer
+        than conjunction_threshold are recorded after every step (see
+        getConjunctions).
+
+        Args:
+            conjunction_threshold (float): Conjunction screening distance. None
+                                           disables screening.
+
+        Note:
+            - The numba backend does not support screening. With screening
+              the numpy backend is used.
+        """
+        self.conjunction_threshold = conjunction_threshold
+
+    def getConjunctions(self):
+        """
+        Get conjunctions recorded during simulation.
+
+        Returns:
+            conjunctions (list): List of [time, name0, name1, distance] in the
+                                 order they occurred.
+        """
+        return self.conjunctions
+
+    def detectConjunctions(self):
+        """
+        Record pairs of Vessel objects in the current Timestep closer than
+        conjunction_threshold. Does nothing if screening is disabled.
+        """
+        if self.conjunction_threshold is None:
+            return
+        n = len(self.current.celestial_bodies)
+        names = list(self.current.vessels.keys())
+        pairs, distances = screenConjunctions(self.current.states[n:, 3:6], self.conjunction_threshold)
+        for (i, j), distance in zip(pairs, distances):
+            self.conjunctions.append([self.current.time, names[i], names[j], distance])
+
+    def getSavedConjunctions(self, conjunction_threshold):
+        """
+        Screen loaded timesteps for pairs of Vessel objects closer than
+        conjunction_threshold (see load).
+
+        Args:
+            conjunction_threshold (float): Conjunction screening distance [m].
+
+        Returns:
+            conjunctions (list): List of [time, name0, name1, distance] in time
+                                 order.
+        """
+        conjunctions = []
+        for timestep in sorted(self.timesteps.values(), key=lambda timestep : timestep.time):
+            names = list(timestep.vessels.keys())
+            positions = np.array([vessel.getPosition() for vessel in timestep.vessels.values()]).reshape(-1, 3)
+            pairs, distances = screenConjunctions(positions, conjunction_threshold)
+            for (i, j), distance in zip(pairs, distances):
+                conjunctions.append([timestep.time, names[i], names[j], distance])
+        return conjunctions
+
+    def getEnckeTolerance(self):
+        """
+        Get Encke rectification tolerance.
+
+        Returns:
+            encke_tolerance (float): Deviation from the reference orbit, relative
+                                     to the reference orbit radius, at which
+                                     the reference orbit is rectified.
+        """
+        return self.encke_tolerance
+
+    def setEnckeTolerance(self, encke_tolerance):
+        """
+        Set Encke rectification tolerance. After each step the reference orbit
+        of an encke Vessel object is reset to its osculating orbit about its
+        parent if its deviation exceeds encke_tolerance times the reference
+        orbit radius.
+
+        Args:
+            encke_tolerance (float): Relative rectification tolerance. Default = 1e-2.
+        """
+        self.encke_tolerance = encke_tolerance
+
+    def getEnckeRows(self):
+        """
+        Get state matrix rows of Vessel objects using encke propagation and of
+        their parents.
+
+        Returns:
+            rows (np.array): Vessel row indices into the current Timestep state matrix.
+            parents (np.array): Parent row indices into the current Timestep state matrix.
+        """
+        n = len(self.current.celestial_bodies)
+        celestial_bodies = list(self.current.celestial_bodies.keys())
+        rows = []
+        parents = []
+        for i, vessel in enumerate(self.current.vessels.values()):
+            if vessel.propagation == 'encke':
+                rows.append(n + i)
+                parents.append(celestial_bodies.index(vessel.parent_name))
+        return np.array(rows, dtype=int), np.array(parents, dtype=int)
+
+    def rectifyEncke(self, force=False):
+        """
+        Rectify Encke reference orbits. Reference orbits are reset to the
+        osculating orbit about the parent at the current time for Vessel
+        objects whose deviation exceeds encke_tolerance, or for all Vessel
+        objects if force is True or the encke Vessel objects have changed.
+
+        Args:
+            force (bool): Rectify all reference orbits. Default = False.
+        """
+        rows, parents = self.getEnckeRows()
+        if len(rows) == 0:
+            self.encke_reference = None
+            return
+        states = self.current.states
+        positions = states[rows, 3:6] - states[parents, 3:6]
+        velocities = states[rows, 0:3] - states[parents, 0:3]
+        if force or self.encke_reference is None or not np.array_equal(self.encke_reference[0], rows):
+            self.encke_reference = [rows, parents, np.full(len(rows), self.current.time), positions, velocities, self.current.mus[parents]]
+            return
+        reference_positions, reference_velocities, reference_accelerations = self.getEnckeReference(self.current.time)
+        deviations = np.linalg.norm(positions - reference_positions, axis=1)
+        rectify = deviations > self.encke_tolerance * np.linalg.norm(reference_positions, axis=1)
+        if np.any(rectify):
+            rows, parents, times, reference_positions, reference_velocities, mus = self.encke_reference
+            times[rectify] = self.current.time
+            reference_positions[rectify] = positions[rectify]
+            reference_velocities[rectify] = velocities[rectify]
+
+    def getEnckeReference(self, t):
+        """
+        Get Encke reference orbit states relative to the parents at time t.
+
+        Args:
+            t (float): Simulation time [s].
+
+        Returns:
+            positions (np.array): Reference positions (N_encke, 3) [m].
+            velocities (np.array): Reference velocities (N_encke, 3) [m/s].
+            accelerations (np.array): Reference two-body accelerations (N_encke, 3) [m.s**-2].
+        """
+        rows, parents, times, positions, velocities, mus = self.encke_reference
+        positions, velocities = keplerPropagate(positions, velocities, mus, t - times)
+        accelerations = -(mus / np.linalg.norm(positions, axis=1)**3)[:, None] * positions
+        return positions, velocities, accelerations
+
+    def getEnckeStates(self, t, states, reference=None):
+        """
+        Convert a state matrix to Encke variables. The position and velocity
+        of encke Vessel objects are replaced by their deviation from the
+        reference orbit about their parent.
+
+        Args:
+            t (float): Simulation time of states [s].
+            states (np.array): State matrix (N, 13).
+            reference (tuple): Reference orbit states at t (see
+                               getEnckeReference). Calculated if reference=None.
+
+        Returns:
+            encke_states (np.array): Encke state matrix (N, 13).
+        """
+        rows, parents = self.encke_reference[0:2]
+        if reference is None:
+            reference = self.getEnckeReference(t)
+        reference_positions, reference_velocities, reference_accelerations = reference
+        encke_states = states.copy()
+        encke_states[rows, 0:3] = states[rows, 0:3] - states[parents, 0:3] - reference_velocities
+        encke_states[rows, 3:6] = states[rows, 3:6] - states[parents, 3:6] - reference_positions
+        return encke_states
+
+    def getAbsoluteStates(self, t, encke_states, reference=None):
+        """
+        Convert an Encke state matrix back to a state matrix (see getEnckeStates).
+
+        Args:
+            t (float): Simulation time of encke_states [s].
+            encke_states (np.array): Encke state matrix (N, 13).
+            reference (tuple): Reference orbit states at t (see
+                               getEnckeReference). Calculated if reference=None.
+
+        Returns:
+            states (np.array): State matrix (N, 13).
+        """
+        rows, parents = self.encke_reference[0:2]
+        if reference is None:
+            reference = self.getEnckeReference(t)
+        reference_positions, reference_velocities, reference_accelerations = reference
+        states = self.setPrescribedStates(t, encke_states.copy())
+        states[rows, 0:3] = states[parents, 0:3] + reference_velocities + encke_states[rows, 0:3]
+        states[rows, 3:6] = states[parents, 3:6] + reference_positions + encke_states[rows, 3:6]
+        return states
+
+    def getEnckeStatesD(self, t, encke_states, states, states_d, reference=None):
+        """
+        Convert a state derivative matrix to Encke variables. The acceleration
+        of an encke Vessel object relative to its parent less the reference
+        two-body acceleration drives its deviation.
+
+        Args:
+            t (float): Simulation time [s].
+            encke_states (np.array): Encke state matrix (N, 13).
+            states (np.array): State matrix (N, 13) corresponding to encke_states.
+            states_d (np.array): State derivative matrix (N, 13) of states.
+            reference (tuple): Reference orbit states at t (see
+                               getEnckeReference). Calculated if reference=None.
+
+        Returns:
+            encke_states_d (np.array): Encke state derivative matrix (N, 13).
+
+        Note:
+            - Prescribed parents are not integrated, their acceleration is
+              taken from the System gravity model.
+        """
+        rows, parents = self.encke_reference[0:2]
+        if reference is None:
+            reference = self.getEnckeReference(t)
+        reference_positions, reference_velocities, reference_accelerations = reference
+        parent_accelerations = states_d[parents, 0:3].copy()
+        prescribed = np.isin(parents, self.getPrescribedRows())
+        if np.any(prescribed):
+            n = len(self.current.celestial_bodies)
+            parent_accelerations[prescribed] = gravityAccelerations(states[parents[prescribed], 3:6], states[:n, 3:6], self.current.mus)
+        encke_states_d = states_d.copy()
+        encke_states_d[rows, 0:3] = states_d[rows, 0:3] - parent_accelerations - reference_accelerations
+        encke_states_d[rows, 3:6] = encke_states[rows, 0:3]
+        return encke_states_d
+
+    def getEnckeScheme(self, scheme):
+        """
+        Wrap an integration scheme so that encke Vessel objects are integrated
+        in Encke variables. The wrapped scheme takes and returns ordinary state
+        matrices.
+
+        Args:
+            scheme (function): Integration scheme scheme(f, t0, states0, dt, states_d).
+
+        Returns:
+            encke_scheme (function): Wrapped integration scheme.
+        """
+        def encke_scheme(f, t0, states0, dt, states_d=None):
+            reference0 = self.getEnckeReference(t0)
+            encke_states0 = self.getEnckeStates(t0, states0, reference0)
+            def encke_f(t, encke_states):
+                reference = self.getEnckeReference(t)
+                states = self.getAbsoluteStates(t, encke_states, reference)
+                return self.getEnckeStatesD(t, encke_states, states, f(t, states), reference)
+            if states_d is not None:
+                states_d = self.getEnckeStatesD(t0, encke_states0, states0, states_d, reference0)
+            result = scheme(encke_f, t0, encke_states0, dt, states_d)
+            if isinstance(result, tuple): # Adaptive schemes also return an error estimate
+                return (self.getAbsoluteStates(t0 + dt, result[0]),) + result[1:]
+            return self.getAbsoluteStates(t0 + dt, result)
+        return encke_scheme
+
+    def getPrescribedRows(self):
+        """
+        Get state matrix rows of CelestialBody objects with prescribed
+        trajectories, i.e. using kepler or ephemeris propagation.
+
+        Returns:
+            prescribed_rows (np.array): Row indices into the current Timestep state matrix.
+        """
+        prescribed_rows = [i for i, celestial_body in enumerate(self.current.celestial_bodies.values()) if celestial_body.propagation != 'integrate']
+        return np.array(prescribed_rows, dtype=int)
+
+    def setPrescribedStates(self, t, states):
+        """
+        Set positions and velocities of CelestialBody objects using kepler or
+        ephemeris propagation at time t. Parents are evaluated before their
+        children so kepler bodies may orbit other prescribed bodies.
+        Ephemerides are evaluated at the Timestep epoch + t converted from UTC
+        to TDB (see helpermath.timescales.utc2tdb).
+
+        Args:
+            t (float): Simulation time [s].
+            states (np.array): State matrix (M, 13) with at least the
+                               CelestialBody rows. Modified in place.
+
+        Returns:
+            states (np.array): State matrix (M, 13).
+        """
+        rows = {name : i for i, name in enumerate(self.current.celestial_bodies.keys())}
+        for name, celestial_body in self.current.celestial_bodies.items():
+            i = rows[name]
+            if celestial_body.propagation == 'kepler':
+                parent = rows[celestial_body.parent_name]
+                delta_t = self.current.epoch + t - (celestial_body.orbital_elements[6] - J2000_JULIAN_DATE) * 86400
+                position, velocity = celestial_body.calculateKeplerState(delta_t)
+                states[i, 0:3] = states[parent, 0:3] + velocity
+                states[i, 3:6] = states[parent, 3:6] + position
+            elif celestial_body.propagation == 'ephemeris':
+                position, velocity = celestial_body.ephemeris.getState(utc2tdb(self.current.epoch + t))
+                states[i, 0:3] = velocity
+                states[i, 3:6] = position
+        return states
+
+    def getZonalHarmonics(self):
+        """
+        Get zonal gravity fields and the Vessel objects they act on. Built on
+        first use and by updateZonalHarmonics.
+
+        Returns:
+            zonal_harmonics (list): [[body_row, vessel_rows, model, pole], ...]
+                                    for each CelestialBody with zonal
+                                    harmonics (see CelestialBody.setZonalHarmonics).
+        """
+        if self.zonal_harmonics is None:
+            self.updateZonalHarmonics()
+        return self.zonal_harmonics
+
+    def updateZonalHarmonics(self):
+        """
+        Update zonal gravity fields and the state matrix rows of the Vessel
+        objects orbiting each CelestialBody with zonal harmonics. The polar
+        axis is taken from the CelestialBody bodyFixedRF.
+        """
+        n = len(self.current.celestial_bodies)
+        self.zonal_harmonics = []
+        for body_row, celestial_body in enumerate(self.current.celestial_bodies.values()):
+            if celestial_body.zonal_harmonics is None:
+                continue
+            vessel_rows = np.array([n + i for i, vessel in enumerate(self.current.vessels.values()) if vessel.parent_name == celestial_body.name], dtype=int)
+            if len(vessel_rows) == 0:
+                continue
+            model = ZonalHarmonics(celestial_body.zonal_harmonics, celestial_body.radius)
+            pole = np.array(celestial_body.bodyFixedRF.k, dtype=float)
+            self.zonal_harmonics.append([body_row, vessel_rows, model, pole / np.linalg.norm(pole)])
+
+    def getDrag(self):
+        """
+        Get atmospheres and the Vessel objects they act on. Built on first use
+        and by updateDrag.
+
+        Returns:
+            drag (list): [vessel_rows, parent_rows, radii, areas,
+                         drag_coefficients, [[atmosphere, indices], ...]]
+                         or [] if no Vessel orbits a CelestialBody with an
+                         atmosphere. indices index vessel_rows.
+        """
+        if self.drag is None:
+            self.updateDrag()
+        return self.drag
+
+    def updateDrag(self):
+        """
+        Update the state matrix rows, cross-sections (see
+        Vessel.getCrossSection) and drag coefficients of the Vessel objects
+        orbiting each CelestialBody with an atmosphere.
+        """
+        n = len(self.current.celestial_bodies)
+        body_rows = {name : i for i, name in enumerate(self.current.celestial_bodies.keys())}
+        vessels = [[n + i, vessel] for i, vessel in enumerate(self.current.vessels.values())
+                   if vessel.parent_name in body_rows and self.current.celestial_bodies[vessel.parent_name].atmosphere is not None]
+        self.drag = []
+        if not vessels:
+            return
+        vessel_rows = np.array([row for row, vessel in vessels], dtype=int)
+        parent_rows = np.array([body_rows[vessel.parent_name] for row, vessel in vessels], dtype=int)
+        radii = np.array([self.current.celestial_bodies[vessel.parent_name].radius for row, vessel in vessels], dtype=float)
+        areas = np.array([vessel.getCrossSection() for row, vessel in vessels], dtype=float)
+        drag_coefficients = np.array([vessel.drag_coefficient for row, vessel in vessels], dtype=float)
+        atmospheres = []
+        for parent_row in np.unique(parent_rows):
+            atmosphere = list(self.current.celestial_bodies.values())[parent_row].atmosphere
+            atmospheres.append([atmosphere, np.flatnonzero(parent_rows == parent_row)])
+        self.drag = [vessel_rows, parent_rows, radii, areas, drag_coefficients, atmospheres]
+
+    def getDragForces(self, states):
+        """
+        Get drag forces acting on all Vessel objects orbiting a CelestialBody
+        with an atmosphere in one batched call. Altitudes are taken above the
+        parent radius and velocities relative to an atmosphere co-rotating
+        with the parent.
+
+        Args:
+            states (np.array): State matrix (N, 13).
+
+        Returns:
+            forces (np.array): Drag force matrix (N, 3) [Fx, Fy, Fz].
+        """
+        forces = np.zeros((len(states), 3))
+        if not self.getDrag():
+            return forces
+        vessel_rows, parent_rows, radii, areas, drag_coefficients, atmospheres = self.drag
+        positions = states[vessel_rows, 3:6]
+        parent_states = states[parent_rows]
+        altitudes = np.linalg.norm(positions - parent_states[:, 3:6], axis=1) - radii
+        densities = np.zeros(len(vessel_rows))
+        for atmosphere, indices in atmospheres:
+            densities[indices] = atmosphere.getDensities(altitudes[indices])
+        velocities = states[vessel_rows, 0:3] - atmosphereVelocities(positions, parent_states)
+        forces[vessel_rows] = dragForces(velocities, densities, areas, drag_coefficients)
+        return forces
+
     def getCelestialBodyInteractions(self):
         """
         Get list of CelestialBody interactions.
@@ -237,53 +1249,413 @@ class System:
                 vessels_interactions.append([celestial_body, vessel])
         return vessels_interactions
 
+    def getInputs(self, states, inputs=None, source_positions=None, rows=None, t=None):
+        """
+        Get input matrix for a given state matrix. Gravitational forces due to
+        CelestialBody objects are calculated for all objects in one pass using
+        the System gravity solver (see setGravitySolver). Zonal harmonic
+        perturbations are added for all Vessel objects orbiting each
+        CelestialBody in one pass (see updateZonalHarmonics).
+
+        Args:
+            states (np.array): State matrix (M, 13). Row order follows
+                               Timestep.getRigidBodies.
+            inputs (np.array): Input matrix (M, 6) of non-gravitational forces
+                               and torques. If inputs=None zero is used.
+            source_positions (np.array): CelestialBody positions (N_celestial_bodies, 3).
+                                         If source_positions=None the CelestialBody
+                                         rows of states are used.
+            rows (slice): Rows of the Timestep state matrix that states
+                          corresponds to. If rows=None the first M rows are used.
+            t (float): Simulation time of states [s]. If t is given and
+                       source_positions=None prescribed CelestialBody objects are
+                       evaluated at t, otherwise their rows of states are used.
+
+        Returns:
+            inputs (np.array): Input matrix (M, 6) [Fx, Fy, Fz, Mx, My, Mz].
+
+        Note:
+            - Gravitational forces on prescribed CelestialBody objects are not
+              calculated.
+        """
+        if inputs is None:
+            inputs = np.zeros((len(states), 6))
+        else:
+            inputs = inputs.copy()
+        if rows is None:
+            rows = slice(0, len(states))
+        n = len(self.current.celestial_bodies)
+        start = rows.start if rows.start is not None else 0
+        prescribed_rows = self.getPrescribedRows() - start
+        prescribed_rows = prescribed_rows[(prescribed_rows >= 0) & (prescribed_rows < len(states))]
+        if t is not None and source_positions is None and start == 0 and len(prescribed_rows) > 0:
+            states = self.setPrescribedStates(t, states.copy())
+        positions = states[:, 3:6]
+        if source_positions is None:
+            source_positions = positions[:n]
+        masses = self.current.masses[rows]
+        # Rows up to m use the System gravity solver, Vessel rows use only their significant sources when pruning
+        m = len(states)
+        if self.gravity_sources is not None:
+            m = min(len(states), max(0, n - start))
+        accelerations = np.zeros(np.shape(positions))
+        targets = np.ones(m, dtype=bool)
+        targets[prescribed_rows[prescribed_rows < m]] = False
+        if self.gravity_solver == 'barneshut':
+            accelerations[:m][targets] = self.getOctree(source_positions).getAccelerations(positions[:m][targets], self.theta)
+        else:
+            accelerations[:m][targets] = gravityAccelerations(positions[:m][targets], source_positions, self.current.mus)
+        if m < len(states):
+            sources = self.gravity_sources[start + m - n:start + len(states) - n]
+            accelerations[m:] = prunedGravityAccelerations(positions[m:], source_positions, self.current.mus, sources)
+        for body_row, vessel_rows, model, pole in self.getZonalHarmonics():
+            vessel_rows = vessel_rows - start
+            vessel_rows = vessel_rows[(vessel_rows >= 0) & (vessel_rows < len(states))]
+            if len(vessel_rows) > 0:
+                accelerations[vessel_rows] += model.getAccelerations(positions[vessel_rows] - source_positions[body_row], self.current.mus[body_row], pole)
+        inputs[:, 0:3] += masses[:, None] * accelerations
+        return inputs
+
+    def getStatesD(self, states, inputs=None, source_positions=None, rows=None, t=None):
+        """
+        Get state derivative matrix for a given state matrix.
+
+        Args:
+            states (np.array): State matrix (M, 13).
+            inputs (np.array): Input matrix (M, 6) of non-gravitational forces
+                               and torques. If inputs=None zero is used.
+            source_positions (np.array): CelestialBody positions (N_celestial_bodies, 3).
+                                         If source_positions=None the CelestialBody
+                                         rows of states are used.
+            rows (slice): Rows of the Timestep state matrix that states
+                          corresponds to. If rows=None the first M rows are used.
+            t (float): Simulation time of states [s] (see getInputs).
+
+        Returns:
+            states_d (np.array): State derivative matrix (M, 13).
+        """
+        if rows is None:
+            rows = slice(0, len(states))
+        U = self.getInputs(states, inputs, source_positions, rows, t)
+        states_d = stateDerivative(states, U, self.current.masses[rows], self.current.Iis[rows])
+        return states_d
+
+    def calculateInputs(self):
+        """
+        Add drag and gravitational forces to the current Timestep input
+        matrix. Called once per step, significant gravity sources are
+        re-evaluated and the Barnes-Hut octree is rebuilt here (see
+        setGravityPruning and getOctree).
+
+        Returns:
+            external_inputs (np.array): Input matrix (N, 6) of forces and torques
+                                        added to the current Timestep before
+                                        gravity was calculated, including drag.
+
+        Note:
+            - Drag forces are held constant over the step (see getDragForces).
+        """
+        self.updateGravitySources()
+        self.octree = None
+        self.current.inputs[self.current.test_particles, 3:6] = 0.0 # Torques on test particles are ignored
+        self.current.inputs[:, 0:3] += self.getDragForces(self.current.states)
+        external_inputs = self.current.inputs.copy()
+        self.current.inputs[:] = self.getInputs(self.current.states, external_inputs)
+        return external_inputs
+
+    def updateRigidBodies(self, dt):
+        """
+        Reset the current Timestep input matrix, evaluate prescribed CelestialBody
+        objects, update reference frames, iterate on time, rectify Encke
+        reference orbits and screen for conjunctions following a step of size
+        dt.
+
+        Args:
+            dt (float): Step size [s].
+        """
+        self.current.inputs[:] = 0.0
+        self.setPrescribedStates(self.current.time + dt, self.current.states)
+        self.current.updateReferenceFrames()
+        self.current.setTime(self.current.time + dt)
+        if self.encke_reference is not None:
+            self.rectifyEncke()
+        self.detectConjunctions()
+
+    def getScheme(self):
+        """
+        Get fixed step integration scheme function for the System scheme.
+        Wrapped by getEnckeScheme if there are encke Vessel objects.
+
+        Returns:
+            scheme (function): Integration scheme scheme(f, t0, states0, dt, states_d).
+        """
+        schemes = {'euler' : euler, 'rk4' : rk4, 'leapfrog' : leapfrog, 'yoshida4' : yoshida4}
+        if self.encke_reference is not None:
+            return self.getEnckeScheme(schemes[self.scheme])
+        return schemes[self.scheme]
+
     def simulateSystem(self):
         """
         Simulate the system forward from current time.
+
+        Note:
+            - The state and U vectors of all objects are bound to the current
+              Timestep state and input matrices so each timestep is integrated
+              as a whole.
+            - CelestialBody objects using kepler or ephemeris propagation are
+              evaluated at every stage of each step, their integrated
+              positions and velocities are discarded.
+            - Vessel objects using encke propagation are integrated as
+              deviations from reference orbits about their parents.
+            - Vessel objects orbiting a CelestialBody with zonal harmonics
+              feel its zonal gravity field (see updateZonalHarmonics).
+            - Vessel objects orbiting a CelestialBody with an atmosphere feel
+              drag (see getDragForces).
+            - Events added with addEvent are detected after each step. A
+              terminal event ends the simulation at the event time.
+            - A checkpoint is saved every checkpointinterval saves and at the
+              end of the simulation (see checkpoint and resume).
         """
-        celestial_body_interactions = self.getCelestialBodyInteractions()
-        vessels_interactions = self.getVesselsInteractions()
-        iterations = int((self.endtime - self.current.time) / self.dt)
+        self.current.bindStates()
+        self.setPrescribedStates(self.current.time, self.current.states)
+        self.updateZonalHarmonics()
+        self.updateDrag()
+        if self.celestial_body_dt is not None and len(self.getEnckeRows()[0]) > 0:
+            print('Warning: Encke propagation is not supported with multi-rate integration. Integrating Vessel objects directly.')
+            self.encke_reference = None
+        else:
+            self.rectifyEncke()
+        use_kernel = False
+        if self.backend == 'numba':
+            unsupported = self.getKernelUnsupported()
+            if unsupported:
+                print('Warning: The numba backend does not support ' + ', '.join(unsupported) + '. Using "numpy" backend.')
+            use_kernel = not unsupported
+        if self.scheme == 'rk45':
+            self.simulateSystemAdaptive()
+        elif self.celestial_body_dt is not None:
+            self.simulateSystemMultiRate()
+        elif use_kernel:
+            self.simulateSystemKernel()
+        else:
+            self.simulateSystemFixed()
+        self.checkpoint(force=True)
+
+    def simulateSystemFixed(self):
+        """
+        Simulate the system forward from current time using a fixed step
+        scheme.
+        """
+        scheme = self.getScheme()
+        iterations = self.getIterations()
+        progress = self.getProgress('Simulate System')
         for i in range(0, iterations):
+            # Step 0: Save checkpoint
+            if i % self.saveinterval == 0:
+                self.checkpoint()
             # Step 1: Calculate forces
-            # Celestial Bodies:
-            ## Gravity
-            for interaction in celestial_body_interactions:
-                obj0 = self.current.celestial_bodies[interaction[0]]
-                obj1 = self.current.celestial_bodies[interaction[1]]
-                gravityForce = gravity(obj0, obj1)
-                obj0.addForce(-gravityForce)
-                obj1.addForce(gravityForce)
-            # Vessels:
-            ## Gravity
-            for interaction in vessels_interactions:
-                obj0 = self.current.celestial_bodies[interaction[0]]
-                obj1 = self.current.vessels[interaction[1]]
-                gravityForce = gravity(obj0, obj1)
-                obj1.addForce(gravityForce)
+            ## Gravity - CelestialBody/CelestialBody and CelestialBody/Vessel interactions
+            external_inputs = self.calculateInputs()
             # Step 2: Save data - included at this stage so that U is populated
             if i % self.saveinterval == 0:
                 #self.current.setSaveFile(int(i / self.saveinterval))
                 self.current.setSaveFile(self.current.savefile + 1)
                 self.save()
             # Step 3: Simulate timestep
-            if self.scheme == 'euler':
-                # Celestial Bodies:
-                for celestial_body in self.current.celestial_bodies.values():
-                    celestial_body.simulate(self.dt, celestial_body.euler)
-                # Vessels:
-                for vessel in self.current.vessels.values():
-                    vessel.simulate(self.dt, vessel.euler)
-            elif self.scheme == 'rk4':
-                # Celestial Bodies:
-                for celestial_body in self.current.celestial_bodies.values():
-                    celestial_body.simulate(self.dt, celestial_body.rk4)
-                # Vessels:
-                for vessel in self.current.vessels.values():
-                    vessel.simulate(self.dt, vessel.rk4)
+            f = lambda t, states : self.getStatesD(states, external_inputs, t=t)
+            states_d = stateDerivative(self.current.states, self.current.inputs, self.current.masses, self.current.Iis)
+            states1 = scheme(f, self.current.time, self.current.states, self.dt, states_d)
+            # Step 4: Detect events
+            dt, terminal = self.dt, False
+            if self.events:
+                step = lambda h : scheme(f, self.current.time, self.current.states, h, states_d)
+                dt, states1, terminal = self.detectEvents(step, self.current.time, self.current.states, states1, self.dt)
+            self.current.states[:] = states1
+            # Step 5: Iterate on time
+            self.updateRigidBodies(dt)
+            if terminal:
+                break
+            progress.update(self.current.time)
+        progress.finish(self.current.time)
+
+    def getKernelUnsupported(self):
+        """
+        Get features of the System configuration not supported by the
+        compiled kernel backend (see simulateSystemKernel). The kernel only
+        calculates direct gravity between integrated objects with external
+        inputs held constant between saves.
+
+        Returns:
+            unsupported (list): Names of unsupported features. Empty if the
+                                kernel supports the System.
+        """
+        unsupported = []
+        if self.scheme not in ['euler', 'rk4']:
+            unsupported.append("scheme '" + self.scheme + "'")
+        if self.celestial_body_dt is not None:
+            unsupported.append('multi-rate integration')
+        if self.gravity_solver != 'direct':
+            unsupported.append("gravity solver '" + self.gravity_solver + "'")
+        if self.gravity_tolerance is not None:
+            unsupported.append('gravity pruning')
+        if self.conjunction_threshold is not None:
+            unsupported.append('conjunction screening')
+        if len(self.getPrescribedRows()) > 0:
+            unsupported.append('kepler/ephemeris propagation')
+        if len(self.getEnckeRows()[0]) > 0:
+            unsupported.append('encke propagation')
+        if self.events:
+            unsupported.append('events')
+        if self.getZonalHarmonics():
+            unsupported.append('zonal harmonics')
+        if self.getDrag():
+            unsupported.append('drag')
+        return unsupported
+
+    def kernelSupported(self):
+        """
+        Check the compiled kernel backend supports the System configuration.
+
+        Returns:
+            supported (bool): True if getKernelUnsupported is empty.
+        """
+        return not self.getKernelUnsupported()
+
+    def simulateSystemKernel(self):
+        """
+        Simulate the system forward from current time using the compiled
+        kernel backend. The kernel runs saveinterval timesteps between saves,
+        reference frames are updated before each save.
+        """
+        scheme = ['euler', 'rk4'].index(self.scheme)
+        iterations = self.getIterations()
+        progress = self.getProgress('Simulate System')
+        i = 0
+        while i < iterations:
+            # Step 0: Save checkpoint
+            self.checkpoint()
+            # Step 1: Calculate forces
+            external_inputs = self.calculateInputs()
+            # Step 2: Save data
+            self.current.setSaveFile(self.current.savefile + 1)
+            self.save()
+            # Step 3: Simulate timesteps up to the next save
+            steps = min(self.saveinterval, iterations - i)
+            simulateKernel(self.current.states, external_inputs, self.current.masses, self.current.Iis, self.current.mus, self.dt, steps, scheme)
             # Step 4: Iterate on time
-            self.current.setTime(self.current.time + self.dt)
-            self.current.setDatetime(self.current.date_time + datetime.timedelta(0, self.dt))
-            progress = (i / iterations) * 100
-            print("Simulate System; Progress: " + str(np.around(progress, decimals = 2)) + " %.", end="\r")
-        print('\n')
\ No newline at end of file
+            self.updateRigidBodies(steps * self.dt)
+            i += steps
+            progress.update(self.current.time, steps)
+        progress.finish(self.current.time)
+
+    def simulateSystemMultiRate(self):
+        """
+        Simulate the system forward from current time using multi-rate
+        integration. CelestialBody objects are stepped at celestial_body_dt,
+        Vessel objects are sub-cycled at dt using CelestialBody states
+        interpolated between CelestialBody steps.
+        """
+        scheme = self.getScheme()
+        n = len(self.current.celestial_bodies)
+        substeps = max(1, int(round(self.celestial_body_dt / self.dt)))
+        iterations = self.getIterations()
+        progress = self.getProgress('Simulate System')
+        for i in range(0, iterations):
+            # Step 1: Step CelestialBody objects to the end of the next CelestialBody step
+            if i % substeps == 0:
+                t0 = self.current.time
+                t1 = t0 + min(substeps, iterations - i) * self.dt
+                celestial_body_inputs = self.current.inputs[:n].copy()
+                f_celestial_bodies = lambda t, states : self.getStatesD(states, celestial_body_inputs, t=t)
+                celestial_body_states0 = self.current.states[:n].copy()
+                celestial_body_states1 = self.setPrescribedStates(t1, scheme(f_celestial_bodies, t0, celestial_body_states0, t1 - t0))
+                interpolate = lambda t : interpolateStates(t0, celestial_body_states0, t1, celestial_body_states1, t)
+            # Step 2: Save checkpoint and calculate forces
+            if i % self.saveinterval == 0:
+                self.checkpoint()
+            external_inputs = self.calculateInputs()
+            # Step 3: Save data
+            if i % self.saveinterval == 0:
+                self.current.setSaveFile(self.current.savefile + 1)
+                self.save()
+            # Step 4: Simulate Vessel timestep against interpolated CelestialBody states
+            def f(t, states):
+                states_d = np.zeros(np.shape(states))
+                states_d[n:] = self.getStatesD(states[n:], external_inputs[n:], interpolate(t)[:, 3:6], slice(n, None))
+                return states_d
+            states_d = stateDerivative(self.current.states, self.current.inputs, self.current.masses, self.current.Iis)
+            states_d[:n] = 0.0
+            def step(h):
+                states = scheme(f, self.current.time, self.current.states, h, states_d)
+                states[:n] = interpolate(self.current.time + h)
+                return states
+            states1 = step(self.dt)
+            # Step 5: Detect events
+            dt, terminal = self.dt, False
+            if self.events:
+                dt, states1, terminal = self.detectEvents(step, self.current.time, self.current.states, states1, self.dt)
+            self.current.states[:] = states1
+            # Step 6: Iterate on time
+            self.updateRigidBodies(dt)
+            if terminal:
+                break
+            progress.update(self.current.time)
+        progress.finish(self.current.time)
+
+    def simulateSystemAdaptive(self):
+        """
+        Simulate the system forward from current time using an adaptive step
+        size scheme. Steps are shortened so that data is saved every
+        saveinterval * dt seconds of simulation time and the simulation ends
+        exactly at endtime.
+        """
+        progress = self.getProgress('Simulate System')
+        scheme = rk45 if self.encke_reference is None else self.getEnckeScheme(rk45)
+        save_time = self.saveinterval * self.dt
+        next_save = self.current.time
+        if self.step_dt is None:
+            self.step_dt = self.dt
+        while self.endtime - self.current.time > 1e-9 * max(1.0, abs(self.endtime)):
+            save = self.current.time >= next_save - 1e-9 * max(1.0, abs(next_save))
+            if save:
+                self.checkpoint()
+            # Step 1: Calculate forces
+            external_inputs = self.calculateInputs()
+            # Step 2: Save data
+            if save:
+                self.current.setSaveFile(self.current.savefile + 1)
+                self.save()
+                next_save += save_time
+            # Step 3: Simulate timestep, rejecting steps until the error estimate is within tolerance
+            f = lambda t, states : self.getStatesD(states, external_inputs, t=t)
+            states_d = stateDerivative(self.current.states, self.current.inputs, self.current.masses, self.current.Iis)
+            while True:
+                dt = min(self.step_dt, next_save - self.current.time, self.endtime - self.current.time)
+                states1, error = scheme(f, self.current.time, self.current.states, dt, states_d)
+                error_norm = errorNorm(self.current.states, states1, error, self.rtol, self.atol)
+                if error_norm <= 1.0:
+                    break
+                self.rejected_steps += 1
+                self.step_dt = dt * max(0.2, 0.9 * error_norm**-0.2)
+            # Step 4: Detect events
+            terminal = False
+            if self.events:
+                step = lambda h : scheme(f, self.current.time, self.current.states, h, states_d)[0]
+                dt, states1, terminal = self.detectEvents(step, self.current.time, self.current.states, states1, dt)
+            self.current.states[:] = states1
+            self.step_error = error_norm
+            # Step 5: Update step size for next step
+            if error_norm == 0.0:
+                factor = 5.0
+            else:
+                factor = min(5.0, 0.9 * error_norm**-0.2)
+            if dt < self.step_dt: # Step was shortened to hit a save time or endtime
+                self.step_dt = max(self.step_dt, dt * factor)
+            else:
+                self.step_dt = dt * factor
+            # Step 6: Iterate on time
+            self.updateRigidBodies(dt)
+            if terminal:
+                break
+            progress.update(self.current.time)
+        progress.finish(self.current.time)
\ No newline at end of file
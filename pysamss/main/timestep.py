@@ -13,6 +13,10 @@ from .referenceframe import ReferenceFrame
 from .celestialbody import CelestialBody
 from .vessel import Vessel
 from .stage import Stage
+from ..forcetorque.gravity import G
+from ..helpermath.helpermath import northEastDownVectors
+from ..helpermath.quaternion import quaternionNormalize, quaternions2rotationMatrices
+from ..helpermath.timescales import J2000, J2000_JULIAN_DATE
 
 class Timestep:
     """
@@ -21,21 +25,33 @@ class Timestep:
     Args:
         time (float): Simulation time [s]. Default time = 0.0.
         datetime (obj): Datetime object. Default datetime = 2020-03-20 03:50:00 (2020 vernal equinox).
+
+    Note:
+        - Time is kept as a float epoch, seconds past J2000 at simulation
+          time 0. The datetime and Julian date at simulation time are derived
+          from epoch + time when requested.
     """
     def __init__(self, time=None, date_time=None):
         if time is None:
             self.time = 0.0
         else:
             self.time = time
+        self.epoch = 0.0
         if date_time is None:
-            self.date_time = datetime.datetime(2020, 3, 20, 3, 50)
+            self.setDatetime(datetime.datetime(2020, 3, 20, 3, 50))
         else:
-            self.date_time = date_time
+            self.setDatetime(date_time)
         self.savefile = 0
         self.universalRF = ReferenceFrame(name='UniversalRF')
         self.reference_frames = {self.universalRF.name : self.universalRF}
         self.celestial_bodies = {}
         self.vessels = {}
+        self.states = np.zeros((0, 13))
+        self.inputs = np.zeros((0, 6))
+        self.masses = np.zeros(0)
+        self.mus = np.zeros(0)
+        self.Iis = np.zeros((0, 3, 3))
+        self.test_particles = np.zeros(0, dtype=bool)
     
     def save(self, f):
         """
@@ -45,6 +61,7 @@ class Timestep:
             f (hdf5 file): HDF5 file to save to.
         """
         f.attrs.create('time', self.time)
+        f.attrs.create('epoch', self.epoch)
         f.attrs.create('juliandate', self.getJulianDate())
         f.attrs.create('savefile', self.savefile)
         # ReferenceFrame class
@@ -76,7 +93,10 @@ class Timestep:
         self.vessels = {}
         # Get/set data
         self.setTime(f.attrs['time'])
-        self.setDatetime(julian.from_jd(f.attrs['juliandate']))
+        if 'epoch' in f.attrs:
+            self.setEpoch(f.attrs['epoch'])
+        else: # Files saved before epoch was added
+            self.setDatetime(julian.from_jd(f.attrs['juliandate']))
         self.setSaveFile(f.attrs['savefile'])
         # ReferenceFrame class
         for reference_frame in f['reference_frames']:
@@ -117,32 +137,50 @@ class Timestep:
         """
         self.time = time
     
+    def getEpoch(self):
+        """
+        Get epoch - seconds past J2000 at simulation time 0.
+
+        Returns:
+            epoch (float): Timestep epoch [s].
+        """
+        return self.epoch
+
+    def setEpoch(self, epoch):
+        """
+        Set epoch - seconds past J2000 at simulation time 0.
+
+        Args:
+            epoch (float): Timestep epoch [s].
+        """
+        self.epoch = epoch
+
     def getDatetime(self):
         """
-        Get date_time.
+        Get date_time at simulation time.
 
         Returns:
             date_time (obj): Timestep date_time.
         """
-        return self.date_time
+        return J2000 + datetime.timedelta(seconds=self.epoch + self.time)
     
     def setDatetime(self, date_time):
         """
-        Set date_time.
+        Set date_time at simulation time.
 
         Args:
             date_time (obj): date_time to set for Timestep.
         """
-        self.date_time = date_time
+        self.epoch = (date_time - J2000).total_seconds() - self.time
     
     def getJulianDate(self):
         """
-        Get julian_date.
+        Get julian_date at simulation time.
 
         Returns:
             julian_date (float): Julian date.
         """
-        return julian.to_jd(self.date_time)
+        return J2000_JULIAN_DATE + (self.epoch + self.time) / 86400
     
     def getSaveFile(self):
         """
@@ -162,6 +200,143 @@ class Timestep:
         """
         self.savefile = savefile
         
+    def getRigidBodies(self):
+        """
+        Get CelestialBody and Vessel objects in state matrix order (celestial
+        bodies first, then vessels).
+
+        Returns:
+            rigid_bodies (list): List of CelestialBody and Vessel objects.
+        """
+        rigid_bodies = list(self.celestial_bodies.values()) + list(self.vessels.values())
+        return rigid_bodies
+
+    def getIndex(self, name):
+        """
+        Get the state matrix row of a CelestialBody or Vessel object.
+
+        Args:
+            name (str): CelestialBody or Vessel name.
+
+        Returns:
+            index (int): Row index into states and inputs.
+        """
+        names = [rigid_body.name for rigid_body in self.getRigidBodies()]
+        index = names.index(name)
+        return index
+
+    def bindStates(self):
+        """
+        Gather the state and U vectors of all CelestialBody and Vessel objects
+        into the contiguous states (N, 13) and inputs (N, 6) matrices. Each
+        object's state and U vectors become views into a row of these matrices.
+        Masses, standard gravitational parameters and inverse inertia matrices
+        are gathered at the same time.
+
+        Note:
+            - Rows of test particle Vessel objects are flagged in test_particles.
+              Their attitude rates are set to zero and their inverse inertia
+              matrices are left as zero.
+        """
+        rigid_bodies = self.getRigidBodies()
+        states = np.zeros((len(rigid_bodies), 13))
+        inputs = np.zeros((len(rigid_bodies), 6))
+        masses = np.zeros(len(rigid_bodies))
+        Iis = np.zeros((len(rigid_bodies), 3, 3))
+        test_particles = np.zeros(len(rigid_bodies), dtype=bool)
+        test_particles[len(self.celestial_bodies):] = [vessel.test_particle for vessel in self.vessels.values()]
+        for i, rigid_body in enumerate(rigid_bodies):
+            rigid_body.bindState(states[i], inputs[i])
+            masses[i] = rigid_body.getMass()
+            if not test_particles[i]:
+                Iis[i] = rigid_body.getIi()
+        self.states = states
+        self.inputs = inputs
+        self.masses = masses
+        self.mus = G * masses[:len(self.celestial_bodies)] # Only CelestialBody objects are sources of gravity
+        self.Iis = Iis
+        self.test_particles = test_particles
+        self.states[test_particles, 6:9] = 0.0 # Test particle attitude is fixed
+
+    def updateReferenceFrames(self):
+        """
+        Update bodyRF of all CelestialBody and Vessel objects and
+        northeastdownRF of all Vessel objects from the state matrix. Rotation
+        matrices and north, east, down vectors are calculated for all objects
+        in one pass.
+
+        Note:
+            - Test particle Vessel objects are skipped. Their attitude is fixed
+              so bodyRF does not change, use Vessel.getNorthEastDownRF for
+              their current north, east, down vectors.
+        """
+        # Step 1: Update bodyRF - columns of the rotation matrix are the rotated universalRF i, j, k vectors
+        rigid_bodies = self.getRigidBodies()
+        rows = np.flatnonzero(~self.test_particles)
+        Rs = quaternions2rotationMatrices(quaternionNormalize(self.states[rows, 9:13]))
+        for row, R in zip(rows, Rs):
+            rigid_bodies[row].bodyRF.setIJK(R[:, 0], R[:, 1], R[:, 2])
+        # Step 2: Update Vessel northeastdownRF
+        vessels = [vessel for vessel in self.vessels.values() if vessel.parent is not None and not vessel.test_particle]
+        if vessels:
+            positions = np.array([vessel.getPosition() for vessel in vessels])
+            parent_positions = np.array([vessel.parent.getPosition() for vessel in vessels])
+            parent_ks = np.array([vessel.parentRF.k for vessel in vessels])
+            parent_radii = np.array([vessel.parent.getRadius() for vessel in vessels])
+            i, j, k = northEastDownVectors(positions, parent_positions, parent_ks, parent_radii)
+            for n, vessel in enumerate(vessels):
+                if vessel.northeastdownRF is None:
+                    vessel.northeastdownRF = ReferenceFrame()
+                vessel.northeastdownRF.setIJK(i[n], j[n], k[n])
+
+    def getStates(self):
+        """
+        Get state matrix (N, 13). Row order follows getRigidBodies.
+
+        Returns:
+            states (np.array): State matrix.
+        """
+        return self.states
+
+    def getInputs(self):
+        """
+        Get input matrix (N, 6). Row order follows getRigidBodies.
+
+        Returns:
+            inputs (np.array): Input matrix.
+        """
+        return self.inputs
+
+    def getMasses(self):
+        """
+        Get masses of all CelestialBody and Vessel objects as of the last
+        bindStates call.
+
+        Returns:
+            masses (np.array): Masses (N,) [kg].
+        """
+        return self.masses
+
+    def getMus(self):
+        """
+        Get standard gravitational parameters G * m of all CelestialBody
+        objects as of the last bindStates call.
+
+        Returns:
+            mus (np.array): Standard gravitational parameters (N_celestial_bodies,) [m**3.s**-2].
+        """
+        return self.mus
+
+    def getIis(self):
+        """
+        Get inverse inertia matrices of all CelestialBody and Vessel objects as
+        of the last bindStates call.
+
+        Returns:
+            Iis (np.array): Inverse inertia matrices (N, 3, 3).
+        """
+        return self.Iis
+
     def setRelationships(self):
         """
         Set parent and universalRF, parentRF, bodyRF relationships.
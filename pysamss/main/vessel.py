@@ -18,17 +18,27 @@ class Vessel(RigidBody):
         state (np.array): State vector [u, v, w, x, y, z, phi_d, theta_d, psi_d, qw, qx, qy, qz].
         U (np.array): U vector [Fx, Fy, Fz, Mx, My, Mz].
         parent_name (str): Name of parent RigidBody object.
+        test_particle (bool): If True the Vessel is propagated as a
+                              translational-only test particle. See
+                              setTestParticle.
+        propagation (str): Propagation mode ['integrate', 'encke']. See
+                           setPropagation.
+        drag_coefficient (float): Drag coefficient. See setDragCoefficient.
     """
-    def __init__(self, name=None, stages=[], state=None, U=None, parent_name=None):
+    def __init__(self, name=None, stages=[], state=None, U=None, parent_name=None, test_particle=False, propagation='integrate', drag_coefficient=2.2):
         RigidBody.__init__(self, name=name, state=state, U=U, parent_name=parent_name)
         self.stages = stages
         if self.stages: # if self.stages isn't empty
-            self.mass = self.getMass()
-            self.length = self.getLength()
-            self.I = self.calculateI()
-            self.CoM = self.getCoM()
+            self.updateMassProperties()
             self.CoT = self.getCoT()
+        else:
+            self.mass = 0.0
         self.northeastdownRF = None
+        self.test_particle = False
+        self.setTestParticle(test_particle)
+        self.propagation = 'integrate'
+        self.setPropagation(propagation)
+        self.drag_coefficient = drag_coefficient
     
     def save(self, group):
         """
@@ -55,6 +65,9 @@ class Vessel(RigidBody):
         group.create_dataset('I', data=self.I)
         group.create_dataset('CoM', data=self.CoM)
         group.create_dataset('CoT', data=self.CoT)
+        group.attrs.create('test_particle', self.test_particle)
+        group.attrs.create('propagation', np.string_(self.propagation))
+        group.attrs.create('drag_coefficient', self.drag_coefficient)
     
     def load(self, group):
         """
@@ -82,7 +95,100 @@ class Vessel(RigidBody):
         self.setI(np.array(group.get('I')))
         self.setCoM(np.array(group.get('CoM')))
         self.setCoT(np.array(group.get('CoT')))
+        self.setTestParticle(bool(group.attrs.get('test_particle', False)))
+        self.setPropagation(group.attrs.get('propagation', np.string_('integrate')).decode('UTF-8'))
+        self.setDragCoefficient(group.attrs.get('drag_coefficient', 2.2))
     
+    def getTestParticle(self):
+        """
+        Get test particle flag.
+
+        Returns:
+            test_particle (bool): True if the Vessel is a test particle.
+        """
+        return self.test_particle
+
+    def setTestParticle(self, test_particle):
+        """
+        Set test particle flag. Test particles are propagated translation only:
+        their attitude rate is set to zero, torques are ignored and their
+        reference frames are not updated each step, so large populations cost
+        little more than the vectorised position/velocity update.
+
+        Args:
+            test_particle (bool): True if the Vessel is a test particle.
+
+        Note:
+            - Call Timestep.bindStates (done by System.simulateSystem) after
+              changing the flag of a Vessel that is already in a Timestep.
+        """
+        self.test_particle = test_particle
+        if test_particle:
+            self.state[6:9] = 0.0
+
+    def getPropagation(self):
+        """
+        Get propagation mode.
+
+        Returns:
+            propagation (str): Propagation mode ['integrate', 'encke'].
+        """
+        return self.propagation
+
+    def setPropagation(self, propagation):
+        """
+        Set propagation mode.
+
+        Args:
+            propagation (str): Propagation mode ['integrate', 'encke'].
+
+        Note:
+            - 'integrate' integrates the Vessel position and velocity in
+              universal coordinates.
+            - 'encke' integrates only the deviation of the Vessel from a
+              two-body reference orbit about its parent. The reference orbit
+              is rectified when the deviation grows (see
+              System.setEnckeTolerance). Smooth, small deviations allow much
+              larger steps than integrating the full orbit.
+        """
+        if propagation == 'encke' and self.parent_name is None:
+            print('Error: "' + str(self.name) + '" requires a parent for encke propagation.')
+            return
+        self.propagation = propagation
+
+    def getDragCoefficient(self):
+        """
+        Get drag coefficient.
+
+        Returns:
+            drag_coefficient (float): Drag coefficient.
+        """
+        return self.drag_coefficient
+
+    def setDragCoefficient(self, drag_coefficient):
+        """
+        Set drag coefficient. Drag acts on the Vessel when its parent has an
+        atmosphere (see CelestialBody.setAtmosphere and forcetorque.drag).
+
+        Args:
+            drag_coefficient (float): Drag coefficient referenced to
+                                      getCrossSection, i.e. 2.2 for a
+                                      satellite, 0.5 for a launch vehicle.
+        """
+        self.drag_coefficient = drag_coefficient
+
+    def getCrossSection(self):
+        """
+        Get cross-sectional area from the largest Stage radius.
+
+        Returns:
+            cross_section (float): Cross-sectional area (m**2).
+        """
+        if not self.stages:
+            return 0.0
+        cross_section = np.pi * max([stage.radius for stage in self.stages])**2
+        return cross_section
+
     def getStages(self):
         """
         Get Vessel stages.
@@ -100,10 +206,26 @@ class Vessel(RigidBody):
             stages (list): List of Stage objects.
         """
         self.stages = stages
+        if self.stages:
+            self.updateMassProperties()
 
-    def getMass(self):
+    def updateMassProperties(self):
         """
-        Get vessel mass.
+        Recalculate and cache vessel mass, length, inertia matrix and CoM from
+        stages.
+
+        Note:
+            - Called by setStages and updateMass. Call after changing Stage
+              objects directly.
+        """
+        self.mass = self.calculateMass()
+        self.length = self.getLength()
+        self.setI(self.calculateI())
+        self.CoM = self.calculateCoM()
+
+    def calculateMass(self):
+        """
+        Calculate vessel mass from stages.
 
         Returns:
             mass (float): Vessel mass (kg).
@@ -122,10 +244,10 @@ class Vessel(RigidBody):
         """
         # Step 1: Update mass, I and CoM.
         self.stages[0].updateMass(m_dot) # Burn fuel m_dot in stages[0]
-        self.mass = self.getMass() # Update mass of vessel
-        self.I = self.calculateI() # Update inertia tensor of vessel
+        self.mass = self.calculateMass() # Update mass of vessel
+        self.setI(self.calculateI()) # Update inertia tensor of vessel
         dCoM = self.getCoM_delta() # Get how much the CoM has moved
-        self.CoM = self.getCoM() # Update the CoM
+        self.CoM = self.calculateCoM() # Update the CoM
         # Step 2: Update vessel position due to moving CoM.
         R = referenceFrames2rotationMatrix(self.bodyRF, self.parentRF) # rotationMatrix bodyRF -> parentRF
         position_delta = np.dot(R, dCoM)
@@ -177,6 +299,16 @@ class Vessel(RigidBody):
         Get vessel CoM.
         [x, y, z]
 
+        Returns:
+            CoM (np.array): Vessel CoM in bodyRF relative to most forward point (m).
+        """
+        return self.CoM
+
+    def calculateCoM(self):
+        """
+        Calculate vessel CoM from stages.
+        [x, y, z]
+
         Returns:
             CoM (np.array): Vessel CoM in bodyRF relative to most forward point (m).
         """
@@ -264,23 +396,9 @@ class Vessel(RigidBody):
             northeastdownRF (ReferenceFrame obj): Current north, east, down
                                                   reference frame.
         """
-        # Step 1: Get parent position, parent north pole position and vessel position
-        parentPosition = self.parent.getPosition()
-        parentRadius = self.parent.getRadius()
-        parent_k = self.parentRF.k
-        parentNorthPolePosition = parentPosition + (parent_k * parentRadius)
-        vesselPosition = self.getPosition()
-        # Step 2: Get i, j, k vectors for north, east, down reference frame
-        vecVesselParent = parentPosition - vesselPosition
-        vecVesselParentNorthPole = parentNorthPolePosition - vesselPosition
-        k = vecVesselParent # k is the vector joining vesselPosition to parentPosition
-        j = np.cross(vecVesselParent, vecVesselParentNorthPole) # j is normal to the three points
-        i = np.cross(j, k) # i is normal to j and k and completes i, j, k
-        # Step 3: Normalise i, j, k vectors
-        i = i / np.linalg.norm(i)
-        j = j / np.linalg.norm(j)
-        k = k / np.linalg.norm(k)
-        # Step 4: Create the north, east, down reference frame
+        # Step 1: Get i, j, k vectors for north, east, down reference frame
+        i, j, k = northEastDownVectors(self.getPosition(), self.parent.getPosition(), self.parentRF.k, self.parent.getRadius())
+        # Step 2: Create the north, east, down reference frame
         northeastdownRF = ReferenceFrame()
         northeastdownRF.setIJK(i, j, k)
         return northeastdownRF
@@ -414,6 +532,12 @@ class Vessel(RigidBody):
         # Update state and U vectors.
         self.setState(state1)
         self.setU(np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
-        self.bodyRF.rotateAbs(Quaternion(state1[9:]))
+        self.updateReferenceFrames()
+
+    def updateReferenceFrames(self):
+        """
+        Update reference frames following a change in state.
+        """
+        self.bodyRF.rotateAbs(self.state[9:13])
         # Update NorthEastDownRF
         self.updateNorthEastDownRF()
\ No newline at end of file
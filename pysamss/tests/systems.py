@@ -0,0 +1,23 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Shared System builders for end to end tests
+import numpy as np
+
+from pysamss.main.system import System
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+
+MU_EARTH = 6.67408e-11 * 5.972e24
+
+def circularOrbitSystem(name, radius=7.0e6):
+    system = System(name)
+    system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6))
+    system.current.addVessel(Vessel('Sat', [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth'))
+    system.current.vessels['Sat'].setPosition(np.array([radius, 0.0, 0.0]))
+    system.current.vessels['Sat'].setVelocity(np.array([0.0, np.sqrt(MU_EARTH / radius), 0.0]))
+    system.setSaveInterval(10**9)
+    return system
+
+def orbitRadius(system):
+    return np.linalg.norm(system.current.vessels['Sat'].getPosition() - system.current.celestial_bodies['Earth'].getPosition())
@@ -0,0 +1,52 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Barnes-Hut octree tests
+import numpy as np
+import time
+
+from pysamss.forcetorque.gravity import gravityAccelerations
+from pysamss.forcetorque.barneshut import Octree, barnesHutAccelerations
+
+def relativeError(accelerations, expected):
+    return np.linalg.norm(accelerations - expected, axis=1) / np.linalg.norm(expected, axis=1)
+
+def clusteredSources(rng, n_clusters, n_bodies):
+    # Planetary systems: n_clusters well separated groups of n_bodies bodies
+    centres = rng.normal(size=(n_clusters, 1, 3)) * 1.0e13
+    positions = (centres + rng.normal(size=(n_clusters, n_bodies, 3)) * 1.0e10).reshape(-1, 3)
+    mus = rng.uniform(1.0e10, 1.0e20, len(positions))
+    return positions, mus
+
+def test_octree():
+    rng = np.random.default_rng(0)
+    positions = rng.normal(size=(500, 3)) * 1.0e11
+    mus = rng.uniform(1.0e10, 1.0e20, 500)
+    direct = gravityAccelerations(positions, positions, mus)
+    octree = Octree(positions, mus)
+    assert np.max(relativeError(octree.getAccelerations(positions, 0.0), direct)) < 1e-10
+    assert np.max(relativeError(octree.getAccelerations(positions, 0.5), direct)) < 0.05
+    # Refitting to moved sources keeps the tree exact for theta = 0.0 and accurate for theta = 0.5
+    moved = positions + rng.normal(size=(500, 3)) * 1.0e9
+    direct = gravityAccelerations(moved, moved, mus)
+    octree.update(moved)
+    assert np.max(relativeError(octree.getAccelerations(moved, 0.0), direct)) < 1e-10
+    assert np.allclose(octree.coms[0], np.dot(mus, moved) / np.sum(mus))
+    assert np.max(relativeError(octree.getAccelerations(moved, 0.5), direct)) < 0.05
+    # Empty tree
+    assert np.all(Octree(np.zeros((0, 3)), np.zeros(0)).getAccelerations(positions) == 0.0)
+
+def test_barnesHutAccelerations_benchmark():
+    rng = np.random.default_rng(0)
+    positions, mus = clusteredSources(rng, 50, 40)
+    times = {}
+    for name, function in [['direct', lambda: gravityAccelerations(positions, positions, mus)],
+                           ['barneshut', lambda: barnesHutAccelerations(positions, positions, mus, 0.5)]]:
+        times[name] = np.inf
+        for i in range(0, 3):
+            start = time.perf_counter()
+            accelerations = function()
+            times[name] = min(times[name], time.perf_counter() - start)
+        if name == 'direct':
+            direct = accelerations
+    assert np.max(relativeError(accelerations, direct)) < 0.05
+    assert times['barneshut'] < times['direct']
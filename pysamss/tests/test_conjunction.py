@@ -0,0 +1,60 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Conjunction screening tests
+import numpy as np
+
+from pysamss.main.system import System
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+from pysamss.helpermath.conjunction import screenConjunctions
+
+MU_EARTH = 6.67408e-11 * 5.972e24
+
+def test_screenConjunctions():
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-1.0e6, 1.0e6, (2000, 3))
+    pairs, distances = screenConjunctions(positions, 2.0e4)
+    r = np.linalg.norm(positions[:, None, :] - positions[None, :, :], axis=2)
+    i, j = np.nonzero(np.triu(r < 2.0e4, 1))
+    assert np.array_equal(pairs, np.stack([i, j], axis=1))
+    assert np.allclose(distances, r[i, j])
+    assert len(screenConjunctions(positions[:1], 2.0e4)[0]) == 0
+
+def test_simulateSystem_conjunctions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = System('conjunctions')
+    system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6))
+    radius = 7.0e6
+    speed = np.sqrt(MU_EARTH / radius)
+    omega = speed / radius
+    # Sat0 and Sat1 on counter-rotating orbits meet at angle 0.1 rad after 0.1 / omega seconds, Sat2 is never close
+    for name, position, velocity in [['Sat0', [radius, 0.0, 0.0], [0.0, speed, 0.0]],
+                                     ['Sat1', [radius * np.cos(0.2), radius * np.sin(0.2), 0.0], [speed * np.sin(0.2), -speed * np.cos(0.2), 0.0]],
+                                     ['Sat2', [0.0, 0.0, radius], [speed, 0.0, 0.0]]]:
+        system.current.addVessel(Vessel(name, [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth'))
+        system.current.vessels[name].setPosition(np.array(position))
+        system.current.vessels[name].setVelocity(np.array(velocity))
+    system.setScheme('rk4')
+    system.setDt(2.0)
+    system.setEndTime(120.0)
+    system.setSaveInterval(1)
+    system.setConjunctionThreshold(1.0e5)
+    system.simulateSystem()
+    conjunctions = system.getConjunctions()
+    assert len(conjunctions) > 0
+    assert all([conjunction[1:3] == ['Sat0', 'Sat1'] for conjunction in conjunctions])
+    closest = min(conjunctions, key=lambda conjunction : conjunction[3])
+    assert abs(closest[0] - 0.1 / omega) < 1.0
+    loaded = System('loaded')
+    loaded.load('conjunctions.psm')
+    saved_conjunctions = loaded.getSavedConjunctions(1.0e5)
+    assert [conjunction[0:3] for conjunction in saved_conjunctions] == [conjunction[0:3] for conjunction in conjunctions]
+    # Conjunction threshold is restored on resume
+    resumed = System('resumed')
+    resumed.resume('conjunctions.psm')
+    assert resumed.getConjunctionThreshold() == 1.0e5
+    resumed.setConjunctionThreshold(None)
+    resumed.checkpoint(force=True)
+    resumed.resume('conjunctions.psm')
+    assert resumed.getConjunctionThreshold() is None
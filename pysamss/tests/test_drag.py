@@ -0,0 +1,51 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Atmospheric drag tests
+import numpy as np
+
+from pysamss.main.system import System
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+from pysamss.forcetorque.drag import EARTH_ATMOSPHERE, Atmosphere, drag
+
+MU_EARTH = 6.67408e-11 * 5.972e24
+
+def test_atmosphere():
+    atmosphere = Atmosphere()
+    assert np.allclose(atmosphere.getDensities(EARTH_ATMOSPHERE[:, 0]), EARTH_ATMOSPHERE[:, 1])
+    assert np.isclose(atmosphere.getDensities([10.0e3])[0], 1.225 * np.exp(-10.0e3 / 7.249e3))
+    assert atmosphere.getDensities([1.5e6])[0] == 0.0
+    # Scale heights calculated from the table interpolate log density linearly
+    tabulated = Atmosphere(EARTH_ATMOSPHERE[:, 0], EARTH_ATMOSPHERE[:, 1])
+    altitudes = np.linspace(0.0, 1.0e6, 1001)
+    assert np.allclose(np.log(tabulated.getDensities(altitudes)), np.interp(altitudes, EARTH_ATMOSPHERE[:, 0], np.log(EARTH_ATMOSPHERE[:, 1])))
+
+def test_simulateSystem_drag(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    radius = 6.371e6 + 200.0e3
+    altitudes = {}
+    for name, atmosphere in [['vacuum', None], ['drag', Atmosphere()]]:
+        system = System(name)
+        system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6, atmosphere=atmosphere))
+        system.current.addVessel(Vessel('Sat', [Stage(100, 0.5, 1, np.array([0, 0, 0]))], parent_name='Earth', drag_coefficient=2.2))
+        system.current.vessels['Sat'].setPosition(np.array([radius, 0.0, 0.0]))
+        system.current.vessels['Sat'].setVelocity(np.array([0.0, np.sqrt(MU_EARTH / radius), 0.0]))
+        system.setScheme('rk4')
+        system.setDt(10.0)
+        system.setEndTime(3000.0)
+        system.setSaveInterval(10**9)
+        system.simulateSystem()
+        position = system.current.vessels['Sat'].getPosition() - system.current.celestial_bodies['Earth'].getPosition()
+        velocity = system.current.vessels['Sat'].getVelocity() - system.current.celestial_bodies['Earth'].getVelocity()
+        altitudes[name] = 1 / (2 / np.linalg.norm(position) - np.dot(velocity, velocity) / MU_EARTH) # Semi-major axis
+    # Circular orbit decay rate da/dt = -rho * Cd * A / m * sqrt(mu * a)
+    vessel = system.current.vessels['Sat']
+    expected = -2.789e-10 * 2.2 * vessel.getCrossSection() / vessel.getMass() * np.sqrt(MU_EARTH * radius) * 3000.0
+    assert abs(altitudes['vacuum'] - radius) < 1.0
+    assert abs((altitudes['drag'] - radius) - expected) < 0.05 * abs(expected)
+    # Batched forces match drag
+    system.current.vessels['Sat'].state[0:3] += 100.0
+    forces = system.getDragForces(system.current.states)
+    assert np.allclose(forces[1], drag(system.current.celestial_bodies['Earth'], vessel))
+    assert np.all(forces[0] == 0.0)
@@ -0,0 +1,108 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Ensemble tests
+import numpy as np
+import pytest
+
+from pysamss.main.ensemble import Ensemble
+from pysamss.forcetorque.gravity import G
+from pysamss.tests.systems import circularOrbitSystem
+
+def test_ensemble_nominal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('ensemble')
+    system.setScheme('rk4')
+    system.setDt(10.0)
+    system.setEndTime(500.0)
+    system.setSaveInterval(10)
+    ensemble = Ensemble(system, 4)
+    times, mean, std = ensemble.simulate()
+    assert np.allclose(times, np.arange(0.0, 501.0, 100.0))
+    assert ensemble.getTrajectories().shape == (6, 4, 2, 13)
+    assert np.allclose(std, 0.0)
+    system.simulateSystem()
+    assert np.allclose(mean[-1, 1, 3:6], system.current.vessels['Sat'].getPosition())
+
+def test_ensemble_dispersion():
+    system = circularOrbitSystem('ensemble')
+    system.setScheme('rk4')
+    system.setDt(10.0)
+    system.setEndTime(500.0)
+    ensemble = Ensemble(system, 100, seed=0)
+    ensemble.addDispersion('Sat', 'velocity', 1.0)
+    times, mean, std = ensemble.simulate(trajectories=False)
+    assert np.allclose(std[0, 1, 0:3], 1.0, rtol=0.3)
+    assert np.all(std[-1, 1, 3:6] > 100.0)
+    assert np.allclose(std[:, 0], 0.0)
+
+def test_ensemble_unsupported():
+    system = circularOrbitSystem('ensemble')
+    system.setScheme('rk4')
+    system.current.celestial_bodies['Earth'].setZonalHarmonics([1.08263e-3])
+    system.current.vessels['Sat'].setPropagation('encke')
+    with pytest.raises(ValueError, match='encke propagation, zonal harmonics'):
+        Ensemble(system, 4).simulate()
+    system = circularOrbitSystem('ensemble')
+    system.setScheme('rk45')
+    system.setGravitySolver('barneshut')
+    with pytest.raises(ValueError, match="scheme 'rk45', gravity solver 'barneshut'"):
+        Ensemble(system, 4).simulate()
+
+def test_ensemble_iterations():
+    # endtime / dt = 0.3 / 0.1 is not exactly representable, the Ensemble takes the same 3 steps as the System
+    system = circularOrbitSystem('ensemble')
+    system.setScheme('rk4')
+    system.setDt(0.1)
+    system.setEndTime(0.3)
+    system.setSaveFiles(False)
+    ensemble = Ensemble(system, 2)
+    times, mean, std = ensemble.simulate()
+    assert system.getIterations() == 3
+    assert np.isclose(times[-1], 0.3)
+    system.simulateSystem()
+    assert np.isclose(system.current.getTime(), times[-1])
+    assert np.allclose(mean[-1], system.current.getStates())
+
+def test_ensemble_initialConditions():
+    system = circularOrbitSystem('ensemble')
+    ensembles = []
+    for i in range(0, 2):
+        ensemble = Ensemble(system, 1000, seed=0)
+        ensemble.addDispersion('Sat', 'position', np.array([1.0, 2.0, 3.0]))
+        ensemble.addDispersion('Sat', 'mass', 0.1)
+        ensemble.setThrust('Sat', [10.0, 0.0, 0.0])
+        ensemble.addDispersion('Sat', 'thrust', 0.2)
+        ensembles.append(ensemble.getInitialConditions())
+    states, masses, thrusts = ensembles[0]
+    # Seeded ensembles are reproducible
+    for nominal, repeat in zip(ensembles[0], ensembles[1]):
+        assert np.array_equal(nominal, repeat)
+    assert states.shape == (1000, 2, 13) and masses.shape == (1000, 2) and thrusts.shape == (1000, 2, 3)
+    # Only the dispersed quantities of the dispersed object vary
+    assert np.array_equal(states[:, 0], np.repeat(system.current.getStates()[None, 0], 1000, axis=0))
+    assert np.array_equal(states[:, 1, 0:3], np.repeat(system.current.getStates()[None, 1, 0:3], 1000, axis=0))
+    assert np.allclose(np.std(states[:, 1, 3:6], axis=0), [1.0, 2.0, 3.0], rtol=0.1)
+    assert np.all(masses[:, 0] == 5.972e24)
+    assert np.isclose(np.std(masses[:, 1]) / 1000.0, 0.1, rtol=0.1)
+    assert np.all(thrusts[:, 0] == 0.0) and np.all(thrusts[:, 1, 1:3] == 0.0)
+    assert np.isclose(np.std(thrusts[:, 1, 0]) / 10.0, 0.2, rtol=0.1)
+
+def test_ensemble_statesD():
+    system = circularOrbitSystem('ensemble')
+    system.current.vessels['Sat'].setAttitudeDot(np.array([0.01, 0.02, 0.03]))
+    ensemble = Ensemble(system, 2)
+    states, masses, thrusts = ensemble.getInitialConditions()
+    mus = G * masses[:, :1]
+    Iis = np.repeat(system.current.Iis[None], 2, axis=0)
+    # Without thrust every member matches System.getStatesD
+    states_d = ensemble.getStatesD(states, masses, mus, Iis, thrusts)
+    assert np.allclose(states_d[0], system.getStatesD(system.current.getStates()))
+    assert np.allclose(states_d[1], states_d[0])
+    # Thrust is rotated from Vessel bodyRF to universalRF
+    ensemble.setThrust('Sat', [1000.0, 0.0, 0.0])
+    thrusts[:, 1] = [1000.0, 0.0, 0.0]
+    states[1, 1, 9:13] = [np.cos(np.pi / 4), 0.0, 0.0, np.sin(np.pi / 4)] # Yaw 90 degrees
+    thrust_d = ensemble.getStatesD(states, masses, mus, Iis, thrusts) - states_d
+    assert np.allclose(thrust_d[0, 1, 0:3], [1.0, 0.0, 0.0])
+    assert np.allclose(thrust_d[1, 1, 0:3], [0.0, 1.0, 0.0])
+    assert np.allclose(thrust_d[:, 0], 0.0)
@@ -0,0 +1,127 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Ephemeris tests
+import numpy as np
+import pytest
+import struct
+import datetime
+
+from pysamss.main.system import System
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+from pysamss.main.ephemeris import JPLEPHEM_AVAILABLE, Ephemeris, readSPKType2, fitSPKType2, loadSPK
+from pysamss.main.timestep import J2000
+from pysamss.helpermath.timescales import utc2tdb
+
+RADIUS = 1.496e8 # [km]
+OMEGA = 2 * np.pi / (365.25 * 86400) # [rad/s]
+MOON_RADIUS = 3.844e5 # [km]
+MOON_OMEGA = 2 * np.pi / (27.32 * 86400) # [rad/s]
+
+def circle(t, radius, omega):
+    t = np.asarray(t)
+    return radius * np.stack([np.cos(omega * t), np.sin(omega * t), np.zeros(np.shape(t))], axis=-1)
+
+def syntheticEphemeris():
+    # Synthetic kernel: barycentre -> Earth-Moon barycentre and Earth-Moon barycentre -> Moon, 20 x 16 day records
+    words0 = fitSPKType2(lambda t : circle(t, RADIUS, OMEGA), -10 * 16 * 86400, 16 * 86400, 20, 13)
+    words1 = fitSPKType2(lambda t : circle(t, MOON_RADIUS, MOON_OMEGA), -10 * 16 * 86400, 16 * 86400, 20, 13)
+    ephemeris = Ephemeris([[readSPKType2(words0)], [readSPKType2(words1)]])
+    return ephemeris
+
+def test_ephemeris():
+    ephemeris = syntheticEphemeris()
+    for t in [-1.0e7, 0.0, 1234.5, 1.0e7]:
+        position, velocity = ephemeris.getState(t)
+        assert np.allclose(position, 1000 * (circle(t, RADIUS, OMEGA) + circle(t, MOON_RADIUS, MOON_OMEGA)), rtol=0.0, atol=0.1)
+        velocity_expected = 1000 * (RADIUS * OMEGA * np.array([-np.sin(OMEGA * t), np.cos(OMEGA * t), 0.0]) +
+                                    MOON_RADIUS * MOON_OMEGA * np.array([-np.sin(MOON_OMEGA * t), np.cos(MOON_OMEGA * t), 0.0]))
+        assert np.allclose(velocity, velocity_expected, rtol=0.0, atol=1e-6 * np.linalg.norm(velocity_expected))
+    ephemeris.getState(1234.5)
+    record = ephemeris.records[0]
+    ephemeris.getState(1300.0)
+    assert ephemeris.records[0] is record # Cached record reused within the same interval
+
+def writeSPK(path, segments):
+    # Empty little-endian DAF/SPK file: file record, summary record, name record
+    from jplephem.daf import DAF, FTPSTR
+    file_record = struct.pack('<8sII60sIII8s603s28s297s', b'DAF/SPK ', 2, 6, b'pysamss test'.ljust(60), 2, 2, 385,
+                              b'LTL-IEEE', b'\0' * 603, FTPSTR, b'\0' * 297)
+    with open(path, 'wb') as f:
+        f.write(file_record + struct.pack('<ddd', 0.0, 0.0, 0.0).ljust(1024, b'\0') + b' ' * 1024)
+    with open(path, 'r+b') as f:
+        daf = DAF(f)
+        for center, target, words in segments:
+            init, intlen, rsize, n = words[-4:]
+            daf.add_array(b'pysamss test', (init, init + n * intlen, target, center, 1, 2), words)
+
+def test_loadSPK(tmp_path, monkeypatch):
+    if not JPLEPHEM_AVAILABLE:
+        pytest.skip('jplephem is not installed')
+    monkeypatch.chdir(tmp_path)
+    words0 = fitSPKType2(lambda t : circle(t, RADIUS, OMEGA), -10 * 16 * 86400, 16 * 86400, 20, 13)
+    words1 = fitSPKType2(lambda t : circle(t, MOON_RADIUS, MOON_OMEGA), -10 * 16 * 86400, 16 * 86400, 20, 13)
+    writeSPK('test.bsp', [[0, 3, words0], [3, 301, words1]])
+    ephemeris = loadSPK('test.bsp', [[0, 3], [3, 301]])
+    expected = syntheticEphemeris()
+    for t in [-1.0e7, 0.0, 1234.5, 1.0e7]:
+        assert np.array_equal(ephemeris.getState(t)[0], expected.getState(t)[0])
+    with pytest.raises(ValueError, match='No type 2 segments for 3 -> 399'):
+        loadSPK('test.bsp', [[0, 3], [3, 399]])
+    # Kernel backed ephemerides are saved as their path and pairs and reloaded from the kernel
+    system = System('kernel')
+    system.current.addCelestialBody(CelestialBody('Moon', 7.348e22, 1.737e6, ephemeris=ephemeris, propagation='ephemeris'))
+    system.current.setDatetime(datetime.datetime(2000, 1, 1, 12))
+    system.setDt(10.0)
+    system.setEndTime(100.0)
+    system.setSaveInterval(10**9)
+    system.simulateSystem()
+    loaded = System('loaded')
+    loaded.load('kernel.psm', getAll=False)
+    loaded_ephemeris = loaded.current.celestial_bodies['Moon'].getEphemeris()
+    assert loaded_ephemeris.path == 'test.bsp' and loaded_ephemeris.pairs == [[0, 3], [3, 301]]
+    assert np.array_equal(loaded.current.celestial_bodies['Moon'].getPosition(), expected.getState(utc2tdb(loaded.current.getTime()))[0])
+    assert np.array_equal(loaded_ephemeris.getState(1234.5)[0], expected.getState(1234.5)[0])
+
+def test_loadSPK_unavailable(monkeypatch):
+    monkeypatch.setattr('pysamss.main.ephemeris.JPLEPHEM_AVAILABLE', False)
+    with pytest.raises(ImportError, match='jplephem is required'):
+        loadSPK('test.bsp', [[0, 3]])
+
+def test_utc2tdb():
+    # TDB - UTC = (TAI - UTC) + 32.184 s + periodic terms < 2 ms
+    for date_time, tai_utc in [[datetime.datetime(2000, 1, 1, 12), 32.0], [datetime.datetime(2016, 12, 31, 23, 59, 59), 36.0],
+                               [datetime.datetime(2017, 1, 1), 37.0], [datetime.datetime(2026, 10, 16), 37.0]]:
+        t = (date_time - J2000).total_seconds()
+        assert abs(utc2tdb(t) - t - tai_utc - 32.184) < 2e-3
+    t = np.array([0.0, 1.0e9])
+    assert np.allclose(utc2tdb(t), [utc2tdb(0.0), utc2tdb(1.0e9)])
+
+def test_simulateSystem_ephemeris(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = System('ephemeris')
+    system.current.addCelestialBody(CelestialBody('Moon', 7.348e22, 1.737e6, ephemeris=syntheticEphemeris(), propagation='ephemeris'))
+    system.current.addVessel(Vessel('Probe', [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Moon'))
+    system.current.setDatetime(datetime.datetime(2000, 1, 1, 12))
+    position, velocity = system.current.celestial_bodies['Moon'].getEphemeris().getState(utc2tdb(0.0))
+    mu = 6.67408e-11 * 7.348e22
+    system.current.vessels['Probe'].setPosition(position + np.array([2.0e6, 0.0, 0.0]))
+    system.current.vessels['Probe'].setVelocity(velocity + np.array([0.0, np.sqrt(mu / 2.0e6), 0.0]))
+    system.setScheme('rk4')
+    system.setDt(10.0)
+    system.setEndTime(3600.0)
+    system.setSaveInterval(60)
+    system.simulateSystem()
+    position, velocity = system.current.celestial_bodies['Moon'].getEphemeris().getState(utc2tdb(3600.0))
+    assert np.array_equal(system.current.celestial_bodies['Moon'].getPosition(), position)
+    assert np.array_equal(system.current.celestial_bodies['Moon'].getVelocity(), velocity)
+    # The ephemeris Moon is a gravity source but no gravity is calculated for it
+    system.calculateInputs()
+    r = position - system.current.vessels['Probe'].getPosition()
+    assert np.allclose(system.current.vessels['Probe'].getU()[0:3], 1000 * mu * r / np.linalg.norm(r)**3, rtol=1e-12, atol=0.0)
+    assert np.array_equal(system.current.celestial_bodies['Moon'].getU(), np.zeros(6))
+    loaded = System('loaded')
+    loaded.load('ephemeris.psm', getAll=False)
+    assert loaded.current.celestial_bodies['Moon'].getPropagation() == 'ephemeris'
+    assert np.array_equal(loaded.current.celestial_bodies['Moon'].getEphemeris().getState(utc2tdb(3600.0))[0], position)
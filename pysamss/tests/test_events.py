@@ -0,0 +1,62 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Event detection tests
+import numpy as np
+
+from pysamss.integration.events import brent, isCrossing, altitudeEvent
+from pysamss.tests.systems import MU_EARTH, circularOrbitSystem, orbitRadius
+
+def test_brent():
+    calls = []
+    def g(x):
+        calls.append(x)
+        return x**3 - 2 * x - 5
+    root = 2.0945514815423265
+    assert abs(brent(g, 2.0, 3.0, g(2.0), g(3.0), xtol=1e-12) - root) < 1e-12
+    assert len(calls) < 15 # Superlinear convergence, bisection alone takes ~40 evaluations
+    # Reversed bracket and loose tolerance
+    assert abs(brent(g, 3.0, 2.0, g(3.0), g(2.0), xtol=1e-3) - root) < 1e-3
+    # Roots at the bracket ends are returned without evaluating g
+    calls.clear()
+    assert brent(g, root, 3.0, 0.0, g(3.0)) == root
+    assert brent(g, 2.0, root, g(2.0), 0.0) == root
+    assert len(calls) == 2
+    # Discontinuous sign change converges to the step
+    step = lambda x : 1.0 if x >= 0.3 else -1.0
+    assert abs(brent(step, 0.0, 1.0, -1.0, 1.0, xtol=1e-9) - 0.3) < 1e-9
+
+def test_isCrossing():
+    assert isCrossing(-1.0, 1.0, 1) and isCrossing(-1.0, 1.0, 0) and not isCrossing(-1.0, 1.0, -1)
+    assert isCrossing(1.0, -1.0, -1) and isCrossing(1.0, -1.0, 0) and not isCrossing(1.0, -1.0, 1)
+    # Reaching zero is a crossing, leaving zero is not
+    assert isCrossing(-1.0, 0.0, 1) and isCrossing(1.0, 0.0, -1)
+    assert not isCrossing(0.0, 1.0, 0) and not isCrossing(0.0, -1.0, 0)
+    assert not isCrossing(1.0, 2.0, 0) and not isCrossing(-2.0, -1.0, 0)
+
+def test_altitudeEvent():
+    system = circularOrbitSystem('events')
+    system.current.bindStates()
+    event = altitudeEvent(system.current, 'Sat', 'Earth', 300e3)
+    assert np.isclose(event(0.0, system.current.getStates()), 7.0e6 - 6.371e6 - 300e3)
+    states = system.current.getStates().copy()
+    states[0, 3:6] = [1.0e5, 0.0, 0.0]
+    assert np.isclose(event(0.0, states), 7.0e6 - 1.0e5 - 6.371e6 - 300e3)
+
+def test_simulateSystem_events(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('events')
+    system.current.vessels['Sat'].setVelocity(np.zeros(3))
+    system.setScheme('rk4')
+    system.setDt(10.0)
+    system.setEndTime(1000.0)
+    system.addEvent('impact', altitudeEvent(system.current, 'Sat', 'Earth'), terminal=True)
+    system.addEvent('300km', altitudeEvent(system.current, 'Sat', 'Earth', 300e3), direction=1)
+    system.simulateSystem()
+    # Radial free fall from rest: t = sqrt(r0^3 / (2 * mu)) * (sqrt(x * (1 - x)) + arccos(sqrt(x))), x = r / r0
+    x = 6.371e6 / 7.0e6
+    impact_time = np.sqrt(7.0e6**3 / (2 * MU_EARTH)) * (np.sqrt(x * (1 - x)) + np.arccos(np.sqrt(x)))
+    detected_events = system.getDetectedEvents()
+    assert [event[0] for event in detected_events] == ['impact']
+    assert abs(detected_events[0][1] - impact_time) < 2e-3
+    assert abs(system.current.getTime() - detected_events[0][1]) < 1e-12
+    assert abs(orbitRadius(system) - 6.371e6) < 10.0
@@ -0,0 +1,37 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Gravity tests
+import numpy as np
+
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.forcetorque.gravity import G, gravity, gravityAccelerations
+
+def test_gravityAccelerations():
+    earth = CelestialBody('Earth', 5.972e24, 6.371e6, state=np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]))
+    moon = CelestialBody('Moon', 7.348e22, 1.737e6, state=np.array([0.0, 0.0, 0.0, 3.844e8, 1e7, -2e6, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]))
+    positions = np.array([earth.getPosition(), moon.getPosition()])
+    mus = G * np.array([earth.getMass(), moon.getMass()])
+    accelerations = gravityAccelerations(positions, positions, mus)
+    assert np.allclose(accelerations[0] * earth.getMass(), -gravity(earth, moon))
+    assert np.allclose(accelerations[1] * moon.getMass(), gravity(earth, moon))
+
+def test_gravityAccelerations_batch():
+    rng = np.random.default_rng(0)
+    source_positions = rng.normal(size=(4, 3)) * 1.0e8
+    positions = np.concatenate([source_positions, rng.normal(size=(3, 3)) * 1.0e8])
+    mus = rng.uniform(1.0e10, 1.0e14, 4)
+    accelerations = gravityAccelerations(positions, source_positions, mus)
+    # Pairwise sum, sources do not act on themselves
+    for i, position in enumerate(positions):
+        expected = np.zeros(3)
+        for source_position, mu in zip(source_positions, mus):
+            r = source_position - position
+            if np.linalg.norm(r) > 0.0:
+                expected += mu * r / np.linalg.norm(r)**3
+        assert np.allclose(accelerations[i], expected, rtol=1e-12, atol=0.0)
+    # Total force between sources is zero
+    assert np.allclose(np.dot(mus, accelerations[:4]), 0.0, rtol=0.0, atol=1e-12 * np.max(np.abs(mus[:, None] * accelerations[:4])))
+    # Leading dimensions are broadcast
+    batch = gravityAccelerations(np.stack([positions, 2 * positions]), np.stack([source_positions, 2 * source_positions]), np.stack([mus, mus]))
+    assert np.allclose(batch[0], accelerations)
+    assert np.allclose(batch[1], 0.25 * accelerations)
@@ -0,0 +1,73 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Zonal harmonics tests
+import numpy as np
+
+from pysamss.main.system import System
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+from pysamss.forcetorque.harmonics import ZonalHarmonics
+
+MU_EARTH = 6.67408e-11 * 5.972e24
+J_EARTH = [1.08263e-3, -2.54e-6, -1.62e-6, -2.3e-7, 5.4e-7]
+R_EARTH = 6.378137e6
+
+def potential(positions, J):
+    r = np.linalg.norm(positions, axis=1)
+    s = positions[:, 2] / r
+    V = np.zeros_like(r)
+    for n, Jn in enumerate(J, 2):
+        V -= MU_EARTH / r * Jn * (R_EARTH / r)**n * np.polynomial.legendre.legval(s, np.eye(n + 1)[n])
+    return V
+
+def test_zonalHarmonics():
+    rng = np.random.default_rng(0)
+    positions = rng.normal(size=(100, 3))
+    positions *= rng.uniform(6.6e6, 4.2e7, 100)[:, None] / np.linalg.norm(positions, axis=1)[:, None]
+    # J2 only matches the closed form
+    accelerations = ZonalHarmonics(J_EARTH[:1], R_EARTH).getAccelerations(positions, MU_EARTH)
+    x, y, z = positions.T
+    r = np.linalg.norm(positions, axis=1)
+    factor = -1.5 * J_EARTH[0] * MU_EARTH * R_EARTH**2 / r**5
+    expected = np.stack([factor * x * (1 - 5 * z**2 / r**2), factor * y * (1 - 5 * z**2 / r**2), factor * z * (3 - 5 * z**2 / r**2)], axis=1)
+    assert np.allclose(accelerations, expected, rtol=1e-10, atol=0.0)
+    # J2 - J6 match the gradient of the potential
+    accelerations = ZonalHarmonics(J_EARTH, R_EARTH).getAccelerations(positions, MU_EARTH)
+    h = 1.0
+    gradient = np.stack([(potential(positions + h * e, J_EARTH) - potential(positions - h * e, J_EARTH)) / (2 * h) for e in np.eye(3)], axis=1)
+    assert np.allclose(accelerations, gradient, rtol=1e-5, atol=1e-12)
+    # Rotated pole rotates the field
+    pole = np.array([0.0, 1.0, 0.0])
+    rotated = positions[:, [0, 2, 1]] * [1, 1, -1] # Rotation taking z -> y
+    accelerations_rotated = ZonalHarmonics(J_EARTH, R_EARTH).getAccelerations(rotated, MU_EARTH, pole)
+    assert np.allclose(accelerations_rotated, accelerations[:, [0, 2, 1]] * [1, 1, -1])
+
+def test_simulateSystem_zonalHarmonics(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    radius = 7.0e6
+    inclination = np.pi / 4
+    system = System('harmonics')
+    system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, R_EARTH, zonal_harmonics=J_EARTH[:1]))
+    system.current.addVessel(Vessel('Sat', [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth'))
+    system.current.vessels['Sat'].setPosition(np.array([radius, 0.0, 0.0]))
+    speed = np.sqrt(MU_EARTH / radius)
+    system.current.vessels['Sat'].setVelocity(np.array([0.0, speed * np.cos(inclination), speed * np.sin(inclination)]))
+    period = 2 * np.pi * np.sqrt(radius**3 / MU_EARTH)
+    system.setScheme('rk4')
+    system.setDt(period / 200)
+    system.setEndTime(10 * period)
+    system.setSaveInterval(10**9)
+    system.simulateSystem()
+    # Nodal regression rate -3/2 * n * J2 * (R / a)**2 * cos(i)
+    position = system.current.vessels['Sat'].getPosition() - system.current.celestial_bodies['Earth'].getPosition()
+    velocity = system.current.vessels['Sat'].getVelocity() - system.current.celestial_bodies['Earth'].getVelocity()
+    h = np.cross(position, velocity)
+    LAN = np.arctan2(h[0], -h[1])
+    expected = -1.5 * (2 * np.pi / period) * J_EARTH[0] * (R_EARTH / radius)**2 * np.cos(inclination) * 10 * period
+    assert abs(LAN - expected) < 0.05 * abs(expected)
+    # Settings are saved with the CelestialBody
+    system.save()
+    loaded = System('loaded')
+    loaded.load('harmonics.psm', getAll=False)
+    assert np.allclose(loaded.current.celestial_bodies['Earth'].getZonalHarmonics(), J_EARTH[:1])
@@ -0,0 +1,95 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Progress tests
+import numpy as np
+import pytest
+
+from pysamss.main.progress import Progress, printProgress
+from pysamss.tests.systems import circularOrbitSystem
+
+class Clock:
+    # Fake wall clock advanced by hand
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+def test_progress_stepInterval():
+    infos = []
+    progress = Progress('Test', 0.0, 100.0, [infos.append], wall_interval=None, step_interval=10)
+    for i in range(1, 26):
+        progress.update(4.0 * i)
+    progress.finish(100.0)
+    assert [info['steps'] for info in infos] == [10, 20, 25]
+    assert [info['position'] for info in infos] == [40.0, 80.0, 100.0]
+    assert [info['finished'] for info in infos] == [False, False, True]
+    # Several steps per update count towards the interval
+    infos.clear()
+    progress = Progress('Test', 0.0, 100.0, [infos.append], wall_interval=None, step_interval=10)
+    progress.update(50.0, steps=15)
+    progress.update(60.0, steps=4)
+    progress.update(70.0, steps=6)
+    assert [info['steps'] for info in infos] == [15, 25]
+
+def test_progress_wallInterval(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr('pysamss.main.progress.time.perf_counter', clock)
+    infos = []
+    progress = Progress('Test', 0.0, 100.0, [infos.append], wall_interval=1.0)
+    for i in range(1, 8):
+        clock.time = 0.4 * i
+        progress.update(float(i))
+    # Notified once 1.0 s has elapsed since the last notification
+    assert [info['steps'] for info in infos] == [3, 6]
+    assert np.allclose([info['wall_time'] for info in infos], [1.2, 2.4])
+
+def test_progress_info(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr('pysamss.main.progress.time.perf_counter', clock)
+    progress = Progress('Test', 100.0, 200.0, [])
+    info = progress.getInfo(100.0)
+    assert info['progress'] == 0.0 and info['rate'] == np.inf and info['eta'] == np.inf
+    for i in range(0, 5):
+        progress.update(125.0)
+    clock.time = 2.0
+    info = progress.getInfo(125.0)
+    assert info['name'] == 'Test' and info['steps'] == 5 and info['wall_time'] == 2.0
+    assert info['progress'] == 25.0
+    assert info['step_rate'] == 2.5 and info['rate'] == 12.5
+    assert info['eta'] == 6.0
+    assert progress.getInfo(200.0, finished=True)['eta'] == 0.0
+    assert Progress('Test', 0.0, 0.0, []).getInfo(0.0)['progress'] == 100.0
+
+def test_progress_noObservers(monkeypatch):
+    monkeypatch.setattr(Progress, 'notify', lambda self, position, finished=False : pytest.fail('Notified without observers.'))
+    progress = Progress('Test', 0.0, 1.0, [], wall_interval=0.0, step_interval=1)
+    progress.update(0.5)
+    progress.update(1.0)
+    progress.finish(1.0)
+    assert progress.steps == 2
+
+def test_printProgress(capsys):
+    info = {'name' : 'Test', 'progress' : 12.3456, 'step_rate' : 67.89, 'eta' : 1.23, 'finished' : False}
+    printProgress(info)
+    assert capsys.readouterr().out == 'Test; Progress: 12.35 %. 67.9 steps/s. ETA: 1.2 s.\r'
+    info['finished'] = True
+    printProgress(info)
+    assert capsys.readouterr().out.endswith('\n\n')
+
+def test_simulateSystem_observers(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('observers')
+    system.setDt(10.0)
+    system.setEndTime(1000.0)
+    system.simulateSystem()
+    assert capsys.readouterr().out == '' # Quiet by default
+    infos = []
+    system.addObserver(infos.append)
+    system.setProgressInterval(None, 25)
+    system.setEndTime(2000.0)
+    system.simulateSystem()
+    assert [info['steps'] for info in infos] == [25, 50, 75, 100, 100]
+    assert np.isclose(infos[1]['progress'], 50.0)
+    assert infos[-1]['finished'] and infos[-1]['eta'] == 0.0
+    assert infos[-1]['rate'] > 0.0
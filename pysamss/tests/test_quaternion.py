@@ -0,0 +1,37 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Quaternion tests
+import numpy as np
+from pyquaternion import Quaternion
+
+from pysamss.helpermath.quaternion import *
+from pysamss.tests.systems import circularOrbitSystem
+
+def test_quaternion():
+    rng = np.random.default_rng(0)
+    q = quaternionNormalize(rng.normal(size=(100, 4)))
+    v = rng.normal(size=(100, 3))
+    quaternions = [Quaternion(qi) for qi in q]
+    assert np.allclose(quaternionRotate(q, v), [quaternion.rotate(vi) for quaternion, vi in zip(quaternions, v)])
+    assert np.allclose(quaternionMultiply(q[:-1], q[1:]), [(q0 * q1).elements for q0, q1 in zip(quaternions[:-1], quaternions[1:])])
+    assert np.allclose(quaternionMultiply(q, quaternionConjugate(q)), [1.0, 0.0, 0.0, 0.0])
+    R = quaternions2rotationMatrices(q)
+    assert np.allclose(R, [quaternion.rotation_matrix for quaternion in quaternions])
+    assert np.allclose(rotationMatrices2quaternions(R), q * np.sign(q[:, 0:1]))
+    assert np.allclose(rotationMatrices2quaternions(np.diag([1.0, -1.0, -1.0])), [0.0, 1.0, 0.0, 0.0])
+
+def test_updateReferenceFrames(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('frames')
+    vessel = system.current.vessels['Sat']
+    vessel.setAttitudeDot(np.array([0.01, 0.02, 0.03]))
+    system.setScheme('rk4')
+    system.setDt(10.0)
+    system.setEndTime(100.0)
+    system.simulateSystem()
+    attitude = Quaternion(vessel.state[9:13])
+    assert np.allclose(vessel.bodyRF.i, attitude.rotate([1.0, 0.0, 0.0]))
+    assert np.allclose(vessel.bodyRF.k, attitude.rotate([0.0, 0.0, 1.0]))
+    northeastdownRF = vessel.getNorthEastDownRF()
+    assert np.allclose(vessel.northeastdownRF.i, northeastdownRF.i)
+    assert np.allclose(vessel.northeastdownRF.k, -vessel.getPosition() / np.linalg.norm(vessel.getPosition()))
@@ -0,0 +1,74 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Runge-Kutta scheme tests
+import numpy as np
+
+from pysamss.integration.rungekutta import euler, rk4, rk45, errorNorm
+from pysamss.tests.systems import MU_EARTH, circularOrbitSystem, orbitRadius
+
+def decay(t, states):
+    return -states
+
+def test_rk4():
+    states0 = np.array([[1.0, 2.0], [-3.0, 4.0]])
+    errors = []
+    for dt in [0.2, 0.1]:
+        states1 = rk4(decay, 0.0, states0, dt)
+        errors.append(np.max(np.abs(states1 - states0 * np.exp(-dt))))
+    assert 25.0 < errors[0] / errors[1] < 40.0 # Local error O(dt**5)
+    # Exact for cubic time dependence (Simpson's rule), stages are evaluated at t0 + c * dt
+    states1 = rk4(lambda t, states : 4 * t**3 * np.ones_like(states), 1.0, np.zeros(2), 0.5)
+    assert np.allclose(states1, 1.5**4 - 1.0, rtol=1e-14, atol=0.0)
+    # Precomputed states_d is used for the first stage
+    assert np.allclose(euler(decay, 0.0, states0, 0.1, states_d=np.ones((2, 2))), states0 + 0.1)
+
+def test_rk45():
+    states0 = np.array([[1.0, 2.0], [-3.0, 4.0]])
+    errors = []
+    estimates = []
+    for dt in [0.2, 0.1]:
+        states1, error = rk45(decay, 0.0, states0, dt)
+        errors.append(np.max(np.abs(states1 - states0 * np.exp(-dt))))
+        estimates.append(np.max(np.abs(error)))
+    assert errors[0] < estimates[0] and errors[1] < estimates[1] # 5th order solution is within the 4th order error estimate
+    assert 25.0 < estimates[0] / estimates[1] < 40.0 # Error estimate O(dt**5)
+    # 5th order solution exact for quartic time dependence, 4th order embedded solution exact for cubic
+    states1, error = rk45(lambda t, states : 5 * t**4 * np.ones_like(states), 1.0, np.zeros(2), 0.5)
+    assert np.allclose(states1, 1.5**5 - 1.0, rtol=1e-14, atol=0.0)
+    states1, error = rk45(lambda t, states : 4 * t**3 * np.ones_like(states), 1.0, np.zeros(2), 0.5)
+    assert np.allclose(error, 0.0, rtol=0.0, atol=1e-14)
+
+def test_errorNorm():
+    states0 = np.array([[1.0, -100.0, 0.0]])
+    states1 = np.array([[2.0, -50.0, 0.0]])
+    error = np.array([[1e-6, 1e-3, 1e-6]])
+    # Scale is atol + rtol * max(|states0|, |states1|) per element, norm is the largest scaled error
+    assert np.isclose(errorNorm(states0, states1, error, 1e-3, 1e-6), 1.0)
+    error[0, 2] = 0.0
+    assert np.isclose(errorNorm(states0, states1, error, 1e-3, 1e-6), 1e-3 / (1e-6 + 1e-3 * 100.0))
+    assert errorNorm(np.zeros((0, 13)), np.zeros((0, 13)), np.zeros((0, 13)), 1e-3, 1e-6) == 0.0
+
+def test_simulateSystem_rk4(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('rk4')
+    period = 2 * np.pi * np.sqrt(7.0e6**3 / MU_EARTH)
+    system.setScheme('rk4')
+    system.setDt(60.0)
+    system.setEndTime(np.floor(period / 60.0) * 60.0)
+    system.simulateSystem()
+    assert abs(orbitRadius(system) - 7.0e6) < 100.0
+
+def test_simulateSystem_rk45(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('rk45')
+    period = 2 * np.pi * np.sqrt(7.0e6**3 / MU_EARTH)
+    system.setScheme('rk45')
+    system.setTolerances(1e-10, 1e-8)
+    system.setDt(60.0)
+    system.setEndTime(period)
+    system.setSaveInterval(10)
+    system.simulateSystem()
+    assert np.isclose(system.current.time, period)
+    assert system.getStepError() <= 1.0
+    assert len(list((tmp_path / 'rk45_data').glob('*.h5'))) == int(np.ceil(period / 600.0))
+    assert abs(orbitRadius(system) - 7.0e6) < 1.0
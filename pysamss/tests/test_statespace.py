@@ -0,0 +1,82 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# State space tests
+import numpy as np
+
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.timestep import Timestep
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+from pysamss.integration.statespace import stateDerivative
+
+def test_stateDerivative():
+    body = CelestialBody('Earth', 5.972e24, 6.371e6)
+    body.setState(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 0.1, 0.2, 0.3, 1.0, 0.0, 0.0, 0.0]))
+    body.setU(np.array([1e20, 2e20, 3e20, 1e30, 2e30, 3e30]))
+    expected_state_d = np.dot(body.getA(), body.getState()) + np.dot(body.getB(), body.getU())
+    state_d = stateDerivative(body.getState(), body.getU(), body.getMass(), body.getIi())
+    assert np.allclose(state_d, expected_state_d)
+
+def test_stateDerivative_batch():
+    rng = np.random.default_rng(0)
+    states = rng.normal(size=(5, 13))
+    states[:, 9:13] /= np.linalg.norm(states[:, 9:13], axis=1)[:, None]
+    U = rng.normal(size=(5, 6))
+    masses = rng.uniform(1.0, 10.0, 5)
+    Iis = rng.normal(size=(5, 3, 3))
+    states_d = stateDerivative(states, U, masses, Iis)
+    # Each row matches the single object form
+    for i in range(0, 5):
+        assert np.allclose(states_d[i], stateDerivative(states[i], U[i], masses[i], Iis[i]))
+    assert np.allclose(states_d[:, 0:3], U[:, 0:3] / masses[:, None])
+    assert np.array_equal(states_d[:, 3:6], states[:, 0:3])
+    assert np.allclose(states_d[:, 6:9], np.einsum('ijk,ik->ij', Iis, U[:, 3:6]))
+    # Quaternion derivative 0.5 * q * [0, p, q, r] is orthogonal to q, preserving its norm
+    assert np.allclose(np.einsum('ij,ij->i', states_d[:, 9:13], states[:, 9:13]), 0.0)
+    # Leading dimensions broadcast and out is written in place
+    out = np.empty((2, 5, 13))
+    assert stateDerivative(np.stack([states, states]), np.stack([U, U]), np.stack([masses, masses]), np.stack([Iis, Iis]), out=out) is out
+    assert np.allclose(out[1], states_d)
+
+def test_bindStates():
+    timestep = Timestep()
+    timestep.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6))
+    timestep.addCelestialBody(CelestialBody('Moon', 7.348e22, 1.737e6, parent_name='Earth'))
+    timestep.celestial_bodies['Moon'].setPosition(np.array([3.844e8, 0.0, 0.0]))
+    timestep.bindStates()
+    assert timestep.getStates().shape == (2, 13)
+    assert np.allclose(timestep.getStates()[1, 3:6], [3.844e8, 0.0, 0.0])
+    timestep.getStates()[0, 3:6] = [1.0, 2.0, 3.0]
+    assert np.allclose(timestep.celestial_bodies['Earth'].getPosition(), [1.0, 2.0, 3.0])
+    timestep.celestial_bodies['Moon'].addForce(np.array([1.0, 0.0, 0.0]))
+    assert np.allclose(timestep.getInputs()[1], [1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+
+def test_getStateD_out():
+    body = CelestialBody('Earth', 5.972e24, 6.371e6)
+    body.setAttitudeDot(np.array([0.1, 0.2, 0.3]))
+    body.setU(np.array([1e20, 0.0, 0.0, 1e30, 0.0, 0.0]))
+    out = np.zeros(13)
+    state_d = body.getStateD(out=out)
+    assert state_d is out
+    assert np.allclose(out, body.getStateD(A=body.getA(), B=body.getB()))
+
+def test_massPropertiesCache():
+    timestep = Timestep()
+    timestep.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6))
+    timestep.addVessel(Vessel('Vessel', [Stage(1000.0, 1.0, 10.0, np.array([0.0, 0.0, 0.0])), Stage(500.0, 1.0, 5.0, np.array([-10.0, 0.0, 0.0]))], parent_name='Earth'))
+    vessel = timestep.vessels['Vessel']
+    Ii = vessel.getIi()
+    assert vessel.getIi() is Ii
+    assert np.allclose(np.dot(Ii, vessel.getI()), np.eye(3))
+    # updateMass invalidates mass, I, Ii and CoM
+    vessel.updateMass(-100.0)
+    assert vessel.getMass() == 1400.0
+    assert vessel.getIi() is not Ii
+    assert np.allclose(np.dot(vessel.getIi(), vessel.getI()), np.eye(3))
+    assert np.allclose(vessel.getCoM(), vessel.calculateCoM())
+    # setI invalidates Ii
+    vessel.setI(2 * np.eye(3))
+    assert np.allclose(vessel.getIi(), 0.5 * np.eye(3))
+    # setStages invalidates mass
+    vessel.setStages(vessel.getStages()[:1])
+    assert vessel.getMass() == vessel.getStages()[0].getMass()
@@ -0,0 +1,107 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Sweep tests
+import numpy as np
+import multiprocessing.shared_memory
+import os
+import time
+
+from pysamss.main.sweep import Sweep, runSweepTask
+from pysamss.tests.systems import MU_EARTH, circularOrbitSystem
+
+def orbitFactory(radius, dt):
+    system = circularOrbitSystem('sweep', radius)
+    system.setScheme('rk4')
+    system.setDt(dt)
+    system.setEndTime(600.0)
+    return system
+
+def slowFactory(radius, dt):
+    if radius > 7.0e6:
+        time.sleep(10.0)
+    return orbitFactory(radius, dt)
+
+def failingFactory(radius, dt):
+    if radius > 7.0e6:
+        raise ValueError('radius')
+    return orbitFactory(radius, dt)
+
+def test_sweep(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sweep = Sweep(orbitFactory, {'radius' : [7.0e6, 8.0e6], 'dt' : [10.0, 20.0]}, record_times=[300.0, 600.0], workers=2)
+    results, status = sweep.run()
+    assert results.shape == (4, 2, 2, 13)
+    assert status == ['done'] * 4
+    assert sweep.getParams()[1] == {'radius' : 7.0e6, 'dt' : 20.0}
+    # Results are in grid order and match a serial run
+    system = orbitFactory(8.0e6, 20.0)
+    system.setSaveFiles(False)
+    system.simulateSystem()
+    assert np.allclose(results[3, 1], system.current.getStates())
+    assert np.allclose(np.linalg.norm(results[:2, :, 1, 3:6], axis=-1), 7.0e6)
+    assert os.listdir(tmp_path) == []
+
+def test_sweep_timeout(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sweep = Sweep(slowFactory, {'radius' : [7.0e6, 8.0e6], 'dt' : [10.0]}, workers=2, timeout=1.0)
+    results, status = sweep.run()
+    assert status == ['done', 'timeout']
+    assert np.all(np.isfinite(results[0]))
+    assert np.all(np.isnan(results[1]))
+
+def shortFactory(radius, dt):
+    system = orbitFactory(radius, dt)
+    system.setEndTime(1.0)
+    return system
+
+def test_sweep_recordTimes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    record_times = [0.3, 0.65, 0.7]
+    sweep = Sweep(shortFactory, {'radius' : [7.0e6], 'dt' : [0.1]}, record_times=record_times, workers=1)
+    results, status = sweep.run()
+    assert status == ['done']
+    # Record times that are not multiples of dt are still reached exactly
+    omega = np.sqrt(MU_EARTH / 7.0e6**3)
+    expected = 7.0e6 * np.stack([np.cos(omega * np.array(record_times)), np.sin(omega * np.array(record_times))], axis=1)
+    assert np.allclose(results[0, :, 1, 3:5], expected, rtol=0.0, atol=1e-3)
+
+def test_sweep_progress(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    sweep = Sweep(failingFactory, {'radius' : [6.9e6, 7.0e6, 8.0e6], 'dt' : [10.0]}, workers=2)
+    infos = []
+    sweep.addObserver(infos.append)
+    results, status = sweep.run()
+    # Failures are reported through status and getErrors, not stdout
+    assert status == ['done', 'done', 'error']
+    assert sweep.getErrors() == [None, None, repr(ValueError('radius'))]
+    assert np.all(np.isnan(results[2]))
+    assert capsys.readouterr().out == ''
+    assert [info['position'] for info in infos] == [1, 2, 3, 3]
+    assert infos[-1]['finished'] and infos[-1]['progress'] == 100.0
+
+def test_sweep_params():
+    sweep = Sweep(orbitFactory, {'radius' : [7.0e6, 8.0e6], 'dt' : [10.0, 20.0, 30.0]})
+    # itertools.product order, last parameter varies fastest
+    assert sweep.getParams() == [{'radius' : radius, 'dt' : dt} for radius in [7.0e6, 8.0e6] for dt in [10.0, 20.0, 30.0]]
+
+def test_runSweepTask(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shape = (2, 2, 2, 13)
+    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+    try:
+        results = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        results[:] = np.nan
+        # States at each record time are written to the task row, a partial step reaches 0.25
+        assert runSweepTask(shortFactory, {'radius' : 7.0e6, 'dt' : 0.1}, 1, [0.25, 0.5], shm.name, shape, None) == (1, 'done')
+        omega = np.sqrt(MU_EARTH / 7.0e6**3)
+        for k, record_time in enumerate([0.25, 0.5]):
+            assert np.allclose(results[1, k, 1, 3:5], 7.0e6 * np.array([np.cos(omega * record_time), np.sin(omega * record_time)]), rtol=0.0, atol=1e-3)
+        assert np.all(np.isnan(results[0]))
+        # Record times already passed cannot be reached
+        assert runSweepTask(shortFactory, {'radius' : 7.0e6, 'dt' : 0.1}, 0, [0.5, 0.2], shm.name, shape, None) == (0, 'error')
+        assert np.all(np.isfinite(results[0, 0])) and np.all(np.isnan(results[0, 1]))
+        del results
+    finally:
+        shm.close()
+        shm.unlink()
+    assert os.listdir(tmp_path) == []
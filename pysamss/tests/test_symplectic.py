@@ -0,0 +1,64 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# Symplectic scheme tests
+import numpy as np
+
+from pysamss.integration.symplectic import leapfrog, yoshida4, integrateAttitude
+from pysamss.tests.systems import MU_EARTH, circularOrbitSystem, orbitRadius
+
+def oscillator(t, states):
+    # Unit harmonic oscillator, acceleration = -position
+    states_d = np.zeros_like(states)
+    states_d[..., 0:3] = -states[..., 3:6]
+    states_d[..., 3:6] = states[..., 0:3]
+    return states_d
+
+def oscillatorStates():
+    states = np.zeros((1, 13))
+    states[0, 0:3] = [0.0, 1.0, 0.0]
+    states[0, 3:6] = [1.0, 0.0, 0.0]
+    states[0, 9] = 1.0
+    return states
+
+def test_composition():
+    for scheme, order in [[leapfrog, 2], [yoshida4, 4]]:
+        errors = []
+        for steps in [50, 100]:
+            states = oscillatorStates()
+            dt = 2 * np.pi / steps
+            for i in range(0, steps):
+                states = scheme(oscillator, i * dt, states, dt)
+            errors.append(np.max(np.abs(states - oscillatorStates())))
+        assert 0.8 * 2**order < errors[0] / errors[1] < 1.2 * 2**order
+        # Symmetric compositions are time reversible
+        states = scheme(oscillator, 0.0, oscillatorStates(), 0.1)
+        assert np.allclose(scheme(oscillator, 0.1, states, -0.1), oscillatorStates(), rtol=0.0, atol=1e-14)
+
+def test_integrateAttitude():
+    states = oscillatorStates()
+    states[0, 6:9] = [0.0, 0.0, 0.2]
+    attitude_dot, attitude = integrateAttitude(states, np.zeros((1, 3)), 0.5)
+    assert np.allclose(attitude_dot, states[:, 6:9])
+    assert np.allclose(attitude, [[np.cos(0.05), 0.0, 0.0, np.sin(0.05)]]) # Exact rotation by 0.1 rad about z
+    # Constant angular acceleration uses the midpoint rate and preserves the quaternion norm
+    attitude_dot, attitude = integrateAttitude(states, np.array([[0.0, 0.0, 0.4]]), 0.5)
+    assert np.allclose(attitude_dot, [[0.0, 0.0, 0.4]])
+    assert np.allclose(attitude, [[np.cos(0.075), 0.0, 0.0, np.sin(0.075)]])
+    attitude_dot, attitude = integrateAttitude(states, np.array([[0.3, -0.7, 0.4]]), 10.0)
+    assert np.isclose(np.linalg.norm(attitude), 1.0, rtol=0.0, atol=1e-15)
+
+def test_simulateSystem_symplectic(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for scheme in ['leapfrog', 'yoshida4']:
+        system = circularOrbitSystem(scheme)
+        system.current.vessels['Sat'].setVelocity(np.array([0.0, 1.1 * np.sqrt(MU_EARTH / 7.0e6), 0.0]))
+        system.current.vessels['Sat'].setAttitudeDot(np.array([0.01, 0.02, 0.03]))
+        sat = system.current.vessels['Sat']
+        energy = lambda : 0.5 * np.dot(sat.getVelocity(), sat.getVelocity()) - MU_EARTH / orbitRadius(system)
+        energy0 = energy()
+        system.setScheme(scheme)
+        system.setDt(60.0)
+        system.setEndTime(6.0e4)
+        system.simulateSystem()
+        assert abs(energy() / energy0 - 1) < 1e-3
+        assert np.isclose(np.linalg.norm(sat.getState()[9:13]), 1.0)
@@ -0,0 +1,257 @@
+# Date: 16/10/2026
+# Author: Callum Bruce
+# System tests
+import numpy as np
+import pytest
+import os
+import datetime
+import julian
+
+from pysamss.main.system import System
+from pysamss.main.celestialbody import CelestialBody
+from pysamss.main.vessel import Vessel
+from pysamss.main.stage import Stage
+from pysamss.forcetorque.barneshut import Octree
+from pysamss.tests.systems import MU_EARTH, circularOrbitSystem
+
+def test_simulateSystem_multirate(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    positions = []
+    for celestial_body_dt in [None, 60.0]:
+        system = circularOrbitSystem('multirate' + str(celestial_body_dt))
+        system.current.addCelestialBody(CelestialBody('Moon', 7.348e22, 1.737e6, parent_name='Earth'))
+        system.current.celestial_bodies['Moon'].setPosition(np.array([3.844e8, 0.0, 0.0]))
+        system.current.celestial_bodies['Moon'].setVelocity(np.array([0.0, 1022.0, 0.0]))
+        system.setScheme('rk4')
+        system.setDt(1.0)
+        system.setCelestialBodyDt(celestial_body_dt)
+        system.setEndTime(600.0)
+        system.simulateSystem()
+        assert np.isclose(system.current.time, 600.0)
+        positions.append(np.array([rigid_body.getPosition() for rigid_body in system.current.getRigidBodies()]))
+    assert np.allclose(positions[0], positions[1], rtol=0.0, atol=1e-3)
+
+def test_simulateSystem_numba(tmp_path, monkeypatch):
+    pytest.importorskip('numba')
+    monkeypatch.chdir(tmp_path)
+    positions = []
+    for backend in ['numpy', 'numba']:
+        system = circularOrbitSystem(backend)
+        system.setScheme('rk4')
+        system.setBackend(backend)
+        system.setDt(10.0)
+        system.setEndTime(1000.0)
+        system.simulateSystem()
+        assert np.isclose(system.current.time, 1000.0)
+        positions.append(system.current.vessels['Sat'].getPosition())
+    assert np.allclose(positions[0], positions[1], rtol=0.0, atol=1e-6)
+
+def test_simulateSystem_numbaUnsupported(tmp_path, monkeypatch, capsys):
+    pytest.importorskip('numba')
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('numba')
+    system.setScheme('rk4')
+    system.setBackend('numba')
+    assert system.kernelSupported()
+    system.setConjunctionThreshold(1.0e3)
+    assert system.getKernelUnsupported() == ['conjunction screening']
+    assert not system.kernelSupported()
+    monkeypatch.setattr(System, 'simulateSystemKernel', lambda self: pytest.fail('Kernel used for unsupported System.'))
+    system.setDt(10.0)
+    system.setEndTime(100.0)
+    system.simulateSystem()
+    assert 'The numba backend does not support conjunction screening. Using "numpy" backend.' in capsys.readouterr().out
+    assert np.isclose(system.current.time, 100.0)
+
+def test_simulateSystem_resume(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    uninterrupted = circularOrbitSystem('uninterrupted')
+    interrupted = circularOrbitSystem('interrupted')
+    for system in [uninterrupted, interrupted]:
+        system.setScheme('rk4')
+        system.setDt(10.0)
+        system.setSaveInterval(10)
+        system.setCheckpointInterval(3)
+    uninterrupted.setEndTime(2000.0)
+    uninterrupted.simulateSystem()
+    interrupted.setEndTime(1000.0)
+    interrupted.simulateSystem()
+    resumed = System('resumed')
+    resumed.resume('interrupted.psm')
+    assert resumed.current.getTime() == 1000.0
+    assert resumed.getCheckpointInterval() == 3
+    resumed.setEndTime(2000.0)
+    resumed.simulateSystem()
+    assert np.array_equal(resumed.current.getStates(), uninterrupted.current.getStates())
+    assert sorted(os.listdir('interrupted_data')) == sorted(os.listdir('uninterrupted_data'))
+    latest = System('latest')
+    latest.load('interrupted.psm', getAll=False)
+    assert latest.current.getSaveFile() == 20
+    # Timesteps are keyed by time however they are loaded
+    loaded = System('loaded')
+    loaded.load('interrupted.psm')
+    assert sorted(loaded.timesteps.keys()) == [timestep.time for timestep in sorted(loaded.timesteps.values(), key=lambda timestep : timestep.time)]
+    assert loaded.current.getSaveFile() == 20
+    assert list(latest.timesteps.keys()) == [latest.current.getTime()]
+    resumed.resume('interrupted.psm')
+    assert list(resumed.timesteps.keys()) == [resumed.current.getTime()]
+
+def test_simulateSystem_epoch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('epoch')
+    start = datetime.datetime(2024, 10, 16, 7, 1, 2, 345678)
+    system.current.setDatetime(start)
+    assert system.current.getDatetime() == start
+    assert abs(system.current.getJulianDate() - julian.to_jd(start)) * 86400 < 1e-3
+    system.setDt(1 / 3)
+    system.setEndTime(30.0)
+    system.setSaveInterval(10)
+    system.simulateSystem()
+    assert abs((system.current.getDatetime() - start).total_seconds() - system.current.getTime()) < 1e-6
+    loaded = System('loaded')
+    loaded.load('epoch.psm', getAll=False)
+    assert loaded.current.getEpoch() == system.current.getEpoch()
+    assert abs((loaded.current.getDatetime() - start).total_seconds() - loaded.current.getTime()) < 1e-6
+
+def test_simulateSystem_barneshut(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = circularOrbitSystem('barneshut')
+    rng = np.random.default_rng(0)
+    for i in range(0, 200):
+        system.current.addCelestialBody(CelestialBody('Asteroid' + str(i), rng.uniform(1e15, 1e20), 1.0e3))
+        system.current.celestial_bodies['Asteroid' + str(i)].setPosition(rng.normal(size=3) * 1.0e9)
+    system.current.bindStates()
+    direct = system.getInputs(system.current.getStates())
+    system.setGravitySolver('barneshut', 0.0)
+    assert np.allclose(system.getInputs(system.current.getStates()), direct, rtol=1e-12, atol=0.0)
+    system.setGravitySolver('barneshut', 0.5)
+    assert system.getGravitySolver() == ('barneshut', 0.5)
+    forces = system.getInputs(system.current.getStates())[:, 0:3]
+    error = np.linalg.norm(forces - direct[:, 0:3], axis=1) / np.linalg.norm(direct[:, 0:3], axis=1)
+    assert np.max(error) < 0.1 and np.median(error) < 1e-2
+    # The octree is built once per step and refitted at each stage
+    builds = []
+    def countingOctree(*args):
+        builds.append(Octree(*args))
+        return builds[-1]
+    monkeypatch.setattr('pysamss.main.system.Octree', countingOctree)
+    system.setScheme('rk4')
+    system.setDt(10.0)
+    system.setEndTime(100.0)
+    system.simulateSystem()
+    assert len(builds) == 10
+    assert np.isclose(system.current.time, 100.0)
+
+def test_simulateSystem_gravityPruning(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    positions = []
+    for gravity_tolerance in [None, 1e-6]:
+        system = System('pruning' + str(gravity_tolerance))
+        system.current.addCelestialBody(CelestialBody('Sun', 1.989e30, 6.957e8))
+        system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6, parent_name='Sun'))
+        system.current.addCelestialBody(CelestialBody('Jupiter', 1.898e27, 6.9911e7, parent_name='Sun'))
+        system.current.celestial_bodies['Earth'].setPosition(np.array([1.496e11, 0.0, 0.0]))
+        system.current.celestial_bodies['Earth'].setVelocity(np.array([0.0, 29.78e3, 0.0]))
+        system.current.celestial_bodies['Jupiter'].setPosition(np.array([-7.785e11, 0.0, 0.0]))
+        system.current.celestial_bodies['Jupiter'].setVelocity(np.array([0.0, -13.07e3, 0.0]))
+        for i in range(0, 20):
+            angle = 2 * np.pi * i / 20
+            system.current.addVessel(Vessel('Sat' + str(i), [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth'))
+            system.current.vessels['Sat' + str(i)].setPosition(np.array([1.496e11, 0.0, 0.0]) + 7.0e6 * np.array([np.cos(angle), np.sin(angle), 0.0]))
+            system.current.vessels['Sat' + str(i)].setVelocity(np.array([0.0, 29.78e3, 0.0]) + np.sqrt(MU_EARTH / 7.0e6) * np.array([-np.sin(angle), np.cos(angle), 0.0]))
+        system.setGravityPruning(gravity_tolerance, 10)
+        system.setScheme('rk4')
+        system.setDt(10.0)
+        system.setEndTime(1000.0)
+        system.setSaveInterval(10**9)
+        system.simulateSystem()
+        positions.append(system.current.getStates()[:, 3:6])
+    # Jupiter is dropped for all vessels, Earth (sphere of influence) and the Sun are kept
+    assert np.array_equal(system.getGravitySources(), np.tile([True, True, False], (20, 1)))
+    # Position error is bounded by 0.5 * gravity_tolerance * |a| * t**2 with |a| ~ 9 m.s**-2
+    assert np.max(np.linalg.norm(positions[0] - positions[1], axis=1)) < 0.5 * 1e-6 * 9.0 * 1000.0**2
+
+def test_simulateSystem_kepler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orbital_elements = [1.496e11, 0.0167, 1.796, -0.196, 0.0, 0.5, 2451545.0]
+    states = []
+    for propagation in ['integrate', 'kepler']:
+        system = System(propagation)
+        system.current.addCelestialBody(CelestialBody('Sun', 1.989e30, 6.957e8))
+        system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6, parent_name='Sun', orbital_elements=orbital_elements))
+        system.current.addVessel(Vessel('Sat', [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth'))
+        system.current.setDatetime(datetime.datetime(2000, 1, 1, 12))
+        earth = system.current.celestial_bodies['Earth']
+        position, velocity = earth.calculateKeplerState(0.0)
+        earth.setPosition(position)
+        earth.setVelocity(velocity)
+        earth.setPropagation(propagation)
+        system.current.vessels['Sat'].setPosition(position + np.array([7.0e6, 0.0, 0.0]))
+        system.current.vessels['Sat'].setVelocity(velocity + np.array([0.0, np.sqrt(MU_EARTH / 7.0e6), 0.0]))
+        system.setScheme('rk4')
+        system.setDt(10.0)
+        system.setEndTime(6000.0)
+        system.setSaveInterval(100)
+        system.simulateSystem()
+        states.append(system.current.getStates().copy())
+    position, velocity = earth.calculateKeplerState(6000.0)
+    assert np.allclose(states[1][1, 3:6], states[1][0, 3:6] + position, rtol=0.0, atol=1e-3)
+    assert np.allclose(states[1][1, 0:3], states[1][0, 0:3] + velocity, rtol=0.0, atol=1e-9)
+    assert np.allclose(states[1][:, 3:6], states[0][:, 3:6], rtol=0.0, atol=10.0)
+    assert np.array_equal(system.current.inputs[1], np.zeros(6)) # No gravity calculated for Earth
+    loaded = System('loaded')
+    loaded.load('kepler.psm', getAll=False)
+    assert loaded.current.celestial_bodies['Earth'].getPropagation() == 'kepler'
+    assert np.array_equal(loaded.current.celestial_bodies['Earth'].getOrbitalElements(), orbital_elements)
+
+def test_simulateSystem_testParticles(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    states = []
+    for test_particle in [False, True]:
+        system = System('test_particles' + str(test_particle))
+        system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6))
+        for i in range(0, 50):
+            angle = 2 * np.pi * i / 50
+            radius = 7.0e6 + 1.0e4 * i
+            system.current.addVessel(Vessel('Sat' + str(i), [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth', test_particle=test_particle))
+            system.current.vessels['Sat' + str(i)].setPosition(radius * np.array([np.cos(angle), np.sin(angle), 0.0]))
+            system.current.vessels['Sat' + str(i)].setVelocity(np.sqrt(MU_EARTH / radius) * np.array([-np.sin(angle), np.cos(angle), 0.0]))
+        system.current.vessels['Sat0'].setAttitudeDot(np.array([0.0, 0.0, 0.01]))
+        system.setScheme('rk4')
+        system.setDt(10.0)
+        system.setEndTime(1000.0)
+        system.setSaveInterval(50)
+        system.simulateSystem()
+        states.append(system.current.getStates().copy())
+    assert np.array_equal(states[0][:, 0:6], states[1][:, 0:6])
+    assert np.array_equal(states[1][1:, 6:13], np.tile([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0], (50, 1))) # Attitude fixed
+    assert system.current.vessels['Sat1'].northeastdownRF is None # Reference frames not updated
+    loaded = System('loaded')
+    loaded.load('test_particlesTrue.psm', getAll=False)
+    assert loaded.current.vessels['Sat1'].getTestParticle()
+
+def test_simulateSystem_encke(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    positions = {}
+    for name, propagation, dt in [['reference', 'integrate', 10.0], ['direct', 'integrate', 300.0], ['encke', 'encke', 300.0]]:
+        system = System(name)
+        system.current.addCelestialBody(CelestialBody('Sun', 1.989e30, 6.957e8))
+        system.current.addCelestialBody(CelestialBody('Earth', 5.972e24, 6.371e6, parent_name='Sun'))
+        system.current.celestial_bodies['Earth'].setPosition(np.array([1.496e11, 0.0, 0.0]))
+        system.current.celestial_bodies['Earth'].setVelocity(np.array([0.0, 29.78e3, 0.0]))
+        system.current.addVessel(Vessel('Sat', [Stage(1000, 1, 10, np.array([0, 0, 0]))], parent_name='Earth', propagation=propagation))
+        system.current.vessels['Sat'].setPosition(np.array([1.496e11 + 7.0e6, 0.0, 0.0]))
+        system.current.vessels['Sat'].setVelocity(np.array([0.0, 29.78e3 + 1.01 * np.sqrt(MU_EARTH / 7.0e6), 1000.0]))
+        system.setScheme('rk4')
+        system.setDt(dt)
+        system.setEndTime(6000.0)
+        system.setSaveInterval(10**9)
+        system.simulateSystem()
+        positions[name] = system.current.vessels['Sat'].getPosition() - system.current.celestial_bodies['Earth'].getPosition()
+    assert np.linalg.norm(positions['direct'] - positions['reference']) > 100.0
+    assert np.linalg.norm(positions['encke'] - positions['reference']) < 1.0
+    # Tight tolerance rectifies every step
+    system.setEnckeTolerance(1e-12)
+    system.setEndTime(6600.0)
+    system.simulateSystem()
+    assert np.all(system.encke_reference[2] == 6600.0)
@@ -19,7 +19,8 @@ setup(name='pysamss',
                 'pysamss.helpermath',
                 'pysamss.control',
                 'pysamss.plotting',
-                'pysamss.forcetorque'],
+                'pysamss.forcetorque',
+                'pysamss.integration'],
       package_data={'pysamss' : ['LICENSE.txt'],
                     'pysamss.resources' : ['*.jpg']},
       install_requires=['h5py>=2.10.0',
@@ -30,5 +31,6 @@ setup(name='pysamss',
                         'PyQt5>=5.14.2',
                         'pyquaternion>=0.9.5',
                         'sgp4>=2.7',
-                        'vtk>=8.1.2']
+                        'vtk>=8.1.2'],
+      extras_require={'numba' : ['numba>=0.50']}
      )
\ No newline at end of file